@@ -4,17 +4,28 @@ Airwallex Python SDK.
 A fully-featured SDK for interacting with the Airwallex API.
 """
 from .client import AirwallexClient, AirwallexAsyncClient
+from .token_store import TokenStore, MemoryTokenStore, FileTokenStore
+from .rate_limit import RateLimiter, TokenBucket
+from .concurrency import AdaptiveConcurrencyLimiter
+from .retry import RetryPolicy, ExponentialBackoff, FixedBackoff, RetryBudget
+from .circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from .hedging import HedgingPolicy
+from .checkpoint import CheckpointStore, JSONFileCheckpointStore, SQLiteCheckpointStore
+from .page_size import PageSizeTuner
+from .codec import JSONCodec, StdlibJSONCodec, OrjsonCodec, UjsonCodec
+from .columnar import ColumnarBatch, ColumnarDecoder
 from .exceptions import (
     AirwallexAPIError,
     AuthenticationError,
     RateLimitError,
     ResourceNotFoundError,
     ValidationError,
-    ServerError
+    ServerError,
+    CircuitOpenError
 )
 
 # Import models
-from .models import AirwallexModel
+from .models import AirwallexModel, LazyModel, CompactRecord
 from .models.account import Account as AccountModel
 from .models.payment import Payment as PaymentModel
 from .models.beneficiary import Beneficiary as BeneficiaryModel
@@ -38,13 +49,39 @@ from .models.issuing_config import IssuingConfig as IssuingConfigModel
 __all__ = [
     "AirwallexClient",
     "AirwallexAsyncClient",
+    "TokenStore",
+    "MemoryTokenStore",
+    "FileTokenStore",
+    "RateLimiter",
+    "TokenBucket",
+    "AdaptiveConcurrencyLimiter",
+    "RetryPolicy",
+    "ExponentialBackoff",
+    "FixedBackoff",
+    "RetryBudget",
+    "CircuitBreaker",
+    "CircuitBreakerRegistry",
+    "HedgingPolicy",
+    "CheckpointStore",
+    "JSONFileCheckpointStore",
+    "SQLiteCheckpointStore",
+    "PageSizeTuner",
+    "JSONCodec",
+    "StdlibJSONCodec",
+    "OrjsonCodec",
+    "UjsonCodec",
+    "ColumnarBatch",
+    "ColumnarDecoder",
     "AirwallexAPIError",
     "AuthenticationError",
     "RateLimitError",
     "ResourceNotFoundError",
     "ValidationError",
     "ServerError",
+    "CircuitOpenError",
     "AirwallexModel",
+    "LazyModel",
+    "CompactRecord",
     "AccountModel",
     "PaymentModel",
     "BeneficiaryModel",
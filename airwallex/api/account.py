@@ -29,11 +29,11 @@ class Account(AirwallexAPIBase[Account]):
             Account: Account with balance information.
         """
         url = self._build_url(account_id, "balance")
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("GET", url)
-            data = response.json()
+            data = self.client.json_codec.decode(response)
             account_data = {"id": account_id, "balance": data}
-            return self.model_class.from_api_response(account_data)
+            return self._build_item(account_data)
         else:
             raise ValueError("Use fetch_balance_async for async clients")
             
@@ -48,11 +48,11 @@ class Account(AirwallexAPIBase[Account]):
             Account: Account with balance information.
         """
         url = self._build_url(account_id, "balance")
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("GET", url)
-            data = response.json()
+            data = self.client.json_codec.decode(response)
             account_data = {"id": account_id, "balance": data}
-            return self.model_class.from_api_response(account_data)
+            return self._build_item(account_data)
         else:
             raise ValueError("Use fetch_balance for sync clients")
     
@@ -31,9 +31,9 @@ class AccountDetail(AirwallexAPIBase[AccountDetailModel]):
         """
         url = "/api/v1/account"
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("GET", url)
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use get_my_account_async for async clients")
             
@@ -46,9 +46,9 @@ class AccountDetail(AirwallexAPIBase[AccountDetailModel]):
         """
         url = "/api/v1/account"
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("GET", url)
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use get_my_account for sync clients")
     
@@ -64,9 +64,9 @@ class AccountDetail(AirwallexAPIBase[AccountDetailModel]):
         """
         url = f"/api/v1/account/amendments/{amendment_id}"
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("GET", url)
-            return Amendment.from_api_response(response.json())
+            return Amendment.from_api_response(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use get_amendment_async for async clients")
             
@@ -82,9 +82,9 @@ class AccountDetail(AirwallexAPIBase[AccountDetailModel]):
         """
         url = f"/api/v1/account/amendments/{amendment_id}"
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("GET", url)
-            return Amendment.from_api_response(response.json())
+            return Amendment.from_api_response(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use get_amendment for sync clients")
     
@@ -100,9 +100,9 @@ class AccountDetail(AirwallexAPIBase[AccountDetailModel]):
         """
         url = "/api/v1/account/amendments/create"
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("POST", url, json=amendment.to_api_dict())
-            return Amendment.from_api_response(response.json())
+            return Amendment.from_api_response(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use create_amendment_async for async clients")
             
@@ -118,9 +118,9 @@ class AccountDetail(AirwallexAPIBase[AccountDetailModel]):
         """
         url = "/api/v1/account/amendments/create"
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("POST", url, json=amendment.to_api_dict())
-            return Amendment.from_api_response(response.json())
+            return Amendment.from_api_response(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use create_amendment for sync clients")
     
@@ -133,9 +133,9 @@ class AccountDetail(AirwallexAPIBase[AccountDetailModel]):
         """
         url = "/api/v1/account/wallet_info"
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("GET", url)
-            return WalletInfo.from_api_response(response.json())
+            return WalletInfo.from_api_response(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use get_wallet_info_async for async clients")
             
@@ -148,9 +148,9 @@ class AccountDetail(AirwallexAPIBase[AccountDetailModel]):
         """
         url = "/api/v1/account/wallet_info"
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("GET", url)
-            return WalletInfo.from_api_response(response.json())
+            return WalletInfo.from_api_response(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use get_wallet_info for sync clients")
     
@@ -166,9 +166,9 @@ class AccountDetail(AirwallexAPIBase[AccountDetailModel]):
         """
         url = "/api/v1/accounts/create"
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("POST", url, json=account.to_api_dict())
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use create_account_async for async clients")
             
@@ -184,9 +184,9 @@ class AccountDetail(AirwallexAPIBase[AccountDetailModel]):
         """
         url = "/api/v1/accounts/create"
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("POST", url, json=account.to_api_dict())
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use create_account for sync clients")
     
@@ -203,9 +203,9 @@ class AccountDetail(AirwallexAPIBase[AccountDetailModel]):
         """
         url = f"/api/v1/accounts/{account_id}/update"
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("POST", url, json=account.to_api_dict())
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use update_account_async for async clients")
             
@@ -222,9 +222,9 @@ class AccountDetail(AirwallexAPIBase[AccountDetailModel]):
         """
         url = f"/api/v1/accounts/{account_id}/update"
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("POST", url, json=account.to_api_dict())
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use update_account for sync clients")
     
@@ -240,9 +240,9 @@ class AccountDetail(AirwallexAPIBase[AccountDetailModel]):
         """
         url = f"/api/v1/accounts/{account_id}/submit"
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("POST", url)
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use submit_account_async for async clients")
             
@@ -258,9 +258,9 @@ class AccountDetail(AirwallexAPIBase[AccountDetailModel]):
         """
         url = f"/api/v1/accounts/{account_id}/submit"
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("POST", url)
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use submit_account for sync clients")
     
@@ -276,9 +276,9 @@ class AccountDetail(AirwallexAPIBase[AccountDetailModel]):
         """
         url = f"/api/v1/accounts/{account_id}"
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("GET", url)
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use get_account_async for async clients")
             
@@ -294,9 +294,9 @@ class AccountDetail(AirwallexAPIBase[AccountDetailModel]):
         """
         url = f"/api/v1/accounts/{account_id}"
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("GET", url)
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use get_account for sync clients")
     
@@ -358,10 +358,10 @@ class AccountDetail(AirwallexAPIBase[AccountDetailModel]):
                 to_created_at = to_created_at.isoformat()
             params["to_created_at"] = to_created_at
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("GET", url, params=params)
-            data = response.json()
-            return [self.model_class.from_api_response(item) for item in data.get("items", [])]
+            data = self.client.json_codec.decode(response)
+            return [self._build_item(item) for item in data.get("items", [])]
         else:
             raise ValueError("Use list_accounts_async for async clients")
             
@@ -423,10 +423,10 @@ class AccountDetail(AirwallexAPIBase[AccountDetailModel]):
                 to_created_at = to_created_at.isoformat()
             params["to_created_at"] = to_created_at
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("GET", url, params=params)
-            data = response.json()
-            return [self.model_class.from_api_response(item) for item in data.get("items", [])]
+            data = self.client.json_codec.decode(response)
+            return [self._build_item(item) for item in data.get("items", [])]
         else:
             raise ValueError("Use list_accounts for sync clients")
     
@@ -443,9 +443,9 @@ class AccountDetail(AirwallexAPIBase[AccountDetailModel]):
         """
         url = f"/api/v1/accounts/{account_id}/terms_and_conditions/agree"
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("POST", url, json=request.to_api_dict())
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use agree_to_terms_async for async clients")
             
@@ -462,8 +462,8 @@ class AccountDetail(AirwallexAPIBase[AccountDetailModel]):
         """
         url = f"/api/v1/accounts/{account_id}/terms_and_conditions/agree"
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("POST", url, json=request.to_api_dict())
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use agree_to_terms for sync clients")
\ No newline at end of file
@@ -3,6 +3,11 @@ Base API class for the Airwallex SDK.
 """
 import asyncio
 import logging
+import queue
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
 from typing import (
     Any, 
     Dict, 
@@ -14,17 +19,30 @@ from typing import (
     Coroutine, 
     Generator, 
     AsyncGenerator,
+    Deque,
     Generic,
+    Tuple,
     cast,
     get_args,
     get_origin
 )
 
 from ..models.base import AirwallexModel
+from ..models.lazy import LazyModel
+from ..models.compact import CompactRecord, compact_record_class
+from ..columnar import ColumnarBatch, ColumnarDecoder, records_to_dataframe
 from ..utils import snake_to_pascal_case
+from ..sharding import ShardedScan, parse_timestamp
+from ..checkpoint import CheckpointStore, PaginationCheckpoint
+from ..incremental import HighWaterMark
+from ..page_size import PageSizeTuner
+from ..streaming import ItemsDecoder
 
 logger = logging.getLogger(__name__)
 
+# Seconds between checks for a cancelled consumer while the read-ahead queue is full
+READ_AHEAD_POLL_INTERVAL = 0.1
+
 T = TypeVar("T", bound=AirwallexModel)
 ClientType = TypeVar("ClientType")
 
@@ -38,6 +56,11 @@ class AirwallexAPIBase(Generic[T]):
     """
     endpoint: str = ""
     model_class: Type[T] = cast(Type[T], AirwallexModel)  # Will be overridden by subclasses
+    first_page_num: int = 1  # Listings that number pages from zero override this
+    default_page_size: int = 100
+    created_at_field: Optional[str] = None  # Set by listings that filter on from/to_created_at
+    to_created_at_inclusive: bool = True  # Listings whose to_created_at is exclusive override this
+    id_field: str = "id"
     
     def __init__(
         self,
@@ -75,20 +98,20 @@ class AirwallexAPIBase(Generic[T]):
             
             # If no module exists for this attribute and model has an id, then assume the attribute
             # is a valid endpoint suffix. Return a callable that makes a GET request.
-            def dynamic_endpoint(*args, **kwargs):
+            def dynamic_endpoint(*args, dataframe=False, **kwargs):
                 """
                 :param dataframe: If True, return a DataFrame instead of a list of dictionaries.
                 """
                 url = self._build_url(resource_id=self.id, suffix=path_item)
-                if not str(self.client.__class__.__name__).startswith('Async'):
+                if not str(self.client.__class__.__name__).startswith('AirwallexAsync'):
                     response = self.client._request("GET", url, params=kwargs)
-                    data = self._parse_response_data(response.json())
-                    return data
+                    data = self._parse_response_data(self.client.json_codec.decode(response))
+                    return records_to_dataframe(data) if dataframe else data
                 else:
                     async def async_endpoint():
                         response = await self.client._request("GET", url, params=kwargs)
-                        data = self._parse_response_data(response.json())
-                        return data
+                        data = self._parse_response_data(self.client.json_codec.decode(response))
+                        return records_to_dataframe(data) if dataframe else data
                     return async_endpoint()
             return dynamic_endpoint
 
@@ -109,12 +132,12 @@ class AirwallexAPIBase(Generic[T]):
         For async clients, returns a coroutine that yields an AsyncGenerator[T, None].
         """
         if resource_id is not None:
-            if not str(self.client.__class__.__name__).startswith('Async'):
+            if not str(self.client.__class__.__name__).startswith('AirwallexAsync'):
                 return self.fetch(resource_id)
             else:
                 return self.fetch_async(resource_id)
         else:
-            if not str(self.client.__class__.__name__).startswith('Async'):
+            if not str(self.client.__class__.__name__).startswith('AirwallexAsync'):
                 return self.paginate_generator(**kwargs)
             else:
                 return self.paginate_async_generator(**kwargs)
@@ -124,6 +147,56 @@ class AirwallexAPIBase(Generic[T]):
         """Get the API endpoint path."""
         return cls.endpoint if cls.endpoint else cls.__name__.lower()
     
+    def _build_item(
+        self,
+        data: Dict[str, Any],
+        lazy: bool = False,
+        compact: bool = False
+    ) -> Union[T, LazyModel[T], CompactRecord]:
+        """
+        Build the result for one item, as a model, a `LazyModel` view of it or
+        a `CompactRecord` of it.
+        
+        Clients created with ``trusted_decode`` build models and records without
+        validation.
+        """
+        if compact:
+            record_class = compact_record_class(self.model_class)
+            if getattr(self.client, "trusted_decode", False):
+                return record_class.from_trusted_api_response(data)
+            return record_class.from_api_response(data)
+        if lazy:
+            return LazyModel(self.model_class, data)
+        if getattr(self.client, "trusted_decode", False):
+            return self.model_class.from_trusted_api_response(data)
+        return self.model_class.from_api_response(data)
+    
+    def _build_page(
+        self,
+        items: List[Dict[str, Any]],
+        lazy: bool = False,
+        columnar: bool = False,
+        dataframe: bool = False,
+        amounts: str = "float",
+        compact: bool = False
+    ) -> Union[List[T], List[LazyModel[T]], List[CompactRecord], ColumnarBatch, Any]:
+        """
+        Build the result for one page of items: a list of models, `LazyModel`
+        views or `CompactRecord` s, or with ``columnar`` or ``dataframe`` set, a
+        `ColumnarBatch` or pandas DataFrame decoded directly from the raw items.
+        """
+        self._check_item_mode(lazy, compact, columnar or dataframe)
+        if columnar or dataframe:
+            batch = ColumnarDecoder(self.model_class, amounts=amounts).decode(items)
+            return batch.to_pandas() if dataframe else batch
+        return [self._build_item(item, lazy, compact) for item in items]
+    
+    @staticmethod
+    def _check_item_mode(lazy: bool, compact: bool, columnar: bool = False) -> None:
+        """Reject combinations of result modes, which would silently drop all but one of them."""
+        if lazy + compact + columnar > 1:
+            raise ValueError("lazy, compact and columnar/dataframe results cannot be combined.")
+    
     @staticmethod
     def _parse_response_data(
         response: Union[List[Any], Dict[str, Any]]
@@ -180,34 +253,57 @@ class AirwallexAPIBase(Generic[T]):
         """Convert the raw data to a Pydantic model."""
         if not self.data:
             raise ValueError("No data available to convert to a model")
-        return self.model_class.from_api_response(self.data)
+        return self._build_item(self.data)
     
     # Synchronous API methods
     
     def fetch(self, resource_id: Any) -> T:
         """Fetch a single resource by ID."""
-        if str(self.client.__class__.__name__).startswith('Async'):
+        if str(self.client.__class__.__name__).startswith('AirwallexAsync'):
             raise ValueError("This method requires a sync client.")
         url = self._build_url(resource_id)
         response = self.client._request("GET", url)
-        data = self._parse_response_data(response.json())
+        data = self._parse_response_data(self.client.json_codec.decode(response))
         # If the returned data is a list, take the first item.
         if isinstance(data, list):
             data = data[0] if data else {}
-        return self.model_class.from_api_response(data)
+        return self._build_item(data)
     
-    def list(self, **params: Any) -> List[T]:
-        """List resources with optional filtering parameters."""
-        if str(self.client.__class__.__name__).startswith('Async'):
+    def list(
+        self,
+        lazy: bool = False,
+        columnar: bool = False,
+        dataframe: bool = False,
+        amounts: str = "float",
+        compact: bool = False,
+        **params: Any
+    ) -> List[T]:
+        """
+        List resources with optional filtering parameters.
+        
+        With ``lazy`` set, items are returned as `LazyModel` views that only
+        convert and validate the fields that are read.
+        
+        With ``columnar`` set, the page is decoded into a `ColumnarBatch` of
+        typed NumPy arrays without building a model per item, and with
+        ``dataframe`` set, into a pandas DataFrame. ``amounts`` is "float" for
+        float64 amounts or "minor_units" for int64 amounts in the minor unit of
+        their currency.
+        
+        With ``compact`` set, items are returned as read-only `CompactRecord` s:
+        tuples with a property per field and nested models flattened, which
+        take a fraction of the memory of models.
+        """
+        if str(self.client.__class__.__name__).startswith('AirwallexAsync'):
             raise ValueError("This method requires a sync client.")
         url = self._build_url()
         response = self.client._request("GET", url, params=params)
-        data_list = self._parse_response_data(response.json())
-        return [self.model_class.from_api_response(item) for item in data_list]
+        data_list = self._parse_response_data(self.client.json_codec.decode(response))
+        return self._build_page(data_list, lazy, columnar, dataframe, amounts, compact)
     
     def create(self, payload: Union[Dict[str, Any], T]) -> T:
         """Create a new resource."""
-        if str(self.client.__class__.__name__).startswith('Async'):
+        if str(self.client.__class__.__name__).startswith('AirwallexAsync'):
             raise ValueError("This method requires a sync client.")
         
         payload_dict = payload
@@ -217,15 +313,15 @@ class AirwallexAPIBase(Generic[T]):
             
         url = self._build_url()
         response = self.client._request("POST", url, json=payload_dict)
-        data = self._parse_response_data(response.json())
+        data = self._parse_response_data(self.client.json_codec.decode(response))
         # If the returned data is a list, take the first item.
         if isinstance(data, list):
             data = data[0] if data else {}
-        return self.model_class.from_api_response(data)
+        return self._build_item(data)
     
     def update(self, resource_id: Any, payload: Union[Dict[str, Any], T]) -> T:
         """Update an existing resource."""
-        if str(self.client.__class__.__name__).startswith('Async'):
+        if str(self.client.__class__.__name__).startswith('AirwallexAsync'):
             raise ValueError("This method requires a sync client.")
         
         payload_dict = payload
@@ -235,84 +331,451 @@ class AirwallexAPIBase(Generic[T]):
             
         url = self._build_url(resource_id)
         response = self.client._request("PUT", url, json=payload_dict)
-        data = self._parse_response_data(response.json())
+        data = self._parse_response_data(self.client.json_codec.decode(response))
         # If the returned data is a list, take the first item.
         if isinstance(data, list):
             data = data[0] if data else {}
-        return self.model_class.from_api_response(data)
+        return self._build_item(data)
     
     def delete(self, resource_id: Any) -> None:
         """Delete a resource."""
-        if str(self.client.__class__.__name__).startswith('Async'):
+        if str(self.client.__class__.__name__).startswith('AirwallexAsync'):
             raise ValueError("This method requires a sync client.")
         url = self._build_url(resource_id)
         self.client._request("DELETE", url)
         
-    def paginate(self, stop_page: Optional[int] = None, **params: Any) -> Generator[T, None, None]:
-        """
-        Generate items one by one from paginated results.
+    def _fetch_page(self, params: Dict[str, Any], tuner: Optional[PageSizeTuner] = None) -> Dict[str, Any]:
+        """Fetch one page of a listing and return the decoded response body."""
+        start = time.monotonic()
+        response = self.client._request("GET", self._build_url(), params=params)
+        data = self.client.json_codec.decode(response)
+        if tuner:
+            tuner.observe(params["page_size"], time.monotonic() - start, len(response.content), len(data.get("items", [])))
+        return data
+    
+    def _iter_streamed_items(
+        self,
+        stop_page: Optional[int],
+        params: Dict[str, Any]
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Fetch pages one after another, decoding and yielding raw items while each page downloads."""
+        page_num = params.get("page_num", self.first_page_num)
+        page_size = params.get("page_size", self.default_page_size)
         
-        Args:
-            stop_page: The page number to stop at (optional).
-            **params: Filter parameters to pass to the API.
+        while True:
+            page_params = {**params, "page_num": page_num, "page_size": page_size}
+            response = self.client._request("GET", self._build_url(), params=page_params, stream=True)
+            decoder = ItemsDecoder()
+            count = 0
+            try:
+                for chunk in response.iter_bytes():
+                    for item in decoder.feed(chunk):
+                        count += 1
+                        yield item
+                for item in decoder.close():
+                    count += 1
+                    yield item
+            finally:
+                response.close()
             
-        Yields:
-            T: Each item from the paginated results.
-        """
-        if str(self.client.__class__.__name__).startswith('Async'):
-            raise ValueError("This method requires a sync client.")
+            if not decoder.metadata.get("has_more", False) or not count:
+                break
+                
+            page_num += 1
             
-        page_num = params.get("page_num", 1)
-        page_size = params.get("page_size", 100)
+            if stop_page and page_num > stop_page:
+                break
+    
+    def _page_size_tuner(
+        self,
+        stop_page: Optional[int],
+        checkpoint: Optional[CheckpointStore],
+        params: Dict[str, Any]
+    ) -> Optional[PageSizeTuner]:
+        """Return the tuner for ``page_size="auto"`` (or a given tuner), or None for a fixed size."""
+        page_size = params.get("page_size")
+        if page_size != "auto" and not isinstance(page_size, PageSizeTuner):
+            return None
+        if stop_page or checkpoint or params.get("page_num", self.first_page_num) != self.first_page_num:
+            raise ValueError("Adaptive page sizes cannot be combined with stop_page, page_num or checkpoint.")
+        if isinstance(page_size, PageSizeTuner):
+            return page_size
+        return PageSizeTuner(initial=self.default_page_size)
+    
+    def _iter_pages(
+        self,
+        stop_page: Optional[int],
+        params: Dict[str, Any],
+        tuner: Optional[PageSizeTuner] = None
+    ) -> Generator[Tuple[int, List[Dict[str, Any]], bool], None, None]:
+        """Fetch pages one after another, yielding ``(page_num, items, is_last_page)``."""
+        page_num = params.get("page_num", self.first_page_num)
+        page_size = params.get("page_size", self.default_page_size)
+        # Position of the next page's first item; with a tuner the page size may change
+        offset = 0
         
         while True:
-            params["page_num"] = page_num
-            params["page_size"] = page_size
-            url = self._build_url()
-            response = self.client._request("GET", url, params=params)
-            data = response.json()
+            if tuner:
+                page_size = tuner.next_size(offset)
+                page_num = self.first_page_num + offset // page_size
+            data = self._fetch_page({**params, "page_num": page_num, "page_size": page_size}, tuner)
             
             items = data.get("items", [])
             has_more = data.get("has_more", False)
             
-            for item in items:
-                yield self.model_class.from_api_response(item)
+            yield page_num, items, not has_more or not items
                 
             if not has_more or not items:
                 break
                 
             page_num += 1
+            offset += page_size
             
             if stop_page and page_num > stop_page:
                 break
+    
+    def _checkpoint(
+        self,
+        store: Optional[CheckpointStore],
+        key: Optional[str],
+        params: Dict[str, Any]
+    ) -> Tuple[Optional[PaginationCheckpoint], Dict[str, Any], int]:
+        """Resume a listing from its checkpoint, returning the tracker, params and items to skip."""
+        if store is None:
+            return None, params, 0
+        params = {**params, "page_size": params.get("page_size", self.default_page_size)}
+        checkpoint = PaginationCheckpoint(store, self._build_url(), params, key)
+        page_num, skip = checkpoint.resume(params.get("page_num", self.first_page_num))
+        if skip or page_num != params.get("page_num", self.first_page_num):
+            logger.info(f"Resuming {self._build_url()} at page {page_num}, item {skip}")
+        return checkpoint, {**params, "page_num": page_num}, skip
+    
+    @staticmethod
+    def _read_ahead(pages: Generator[Any, None, None], depth: int) -> Generator[Any, None, None]:
+        """
+        Run a page generator on a worker thread, buffering up to ``depth`` pages.
         
+        The worker fetches the next pages while the caller processes the current
+        one. Errors raised by the worker are re-raised in the caller, and closing
+        the returned generator stops the worker.
+        """
+        buffer: "queue.Queue[Any]" = queue.Queue(maxsize=depth)
+        stopped = threading.Event()
+        done = object()
+        
+        def put(entry: Any) -> bool:
+            while not stopped.is_set():
+                try:
+                    buffer.put(entry, timeout=READ_AHEAD_POLL_INTERVAL)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def worker() -> None:
+            try:
+                for page in pages:
+                    if not put((page, None)):
+                        return
+                put((done, None))
+            except BaseException as exc:
+                put((None, exc))
+            finally:
+                pages.close()
+        
+        thread = threading.Thread(target=worker, name="airwallex-read-ahead", daemon=True)
+        thread.start()
+        try:
+            while True:
+                page, error = buffer.get()
+                if error is not None:
+                    raise error
+                if page is done:
+                    return
+                yield page
+        finally:
+            stopped.set()
+    
+    def paginate(
+        self,
+        stop_page: Optional[int] = None,
+        read_ahead: int = 0,
+        checkpoint: Optional[CheckpointStore] = None,
+        checkpoint_key: Optional[str] = None,
+        stream: bool = False,
+        lazy: bool = False,
+        compact: bool = False,
+        **params: Any
+    ) -> Generator[T, None, None]:
+        """
+        Generate items one by one from paginated results.
+        
+        With ``read_ahead`` set, a worker thread fetches up to that many pages
+        ahead into a bounded queue while the caller processes the current page,
+        overlapping network time with processing time.
+        
+        With ``page_size="auto"`` (or a `PageSizeTuner`), the page size is tuned
+        from the latency and response size of the pages fetched so far.
+        
+        With ``stream`` set, each page's ``items`` array is decoded incrementally
+        from the response body and items are yielded as soon as they arrive, so
+        a page is never held in memory as a whole. The connection stays in use
+        until the page has been consumed.
+        
+        With a ``checkpoint`` store, the position in the listing is saved as
+        each item is consumed and when the generator is closed, and a later
+        call with the same filters resumes from there. An item counts as
+        consumed once the next one is requested, so only the item being
+        processed when a run stopped, even by a crash, is yielded again. The
+        checkpoint is cleared once the listing has been read to the end.
+        
+        With ``lazy`` set, items are yielded as `LazyModel` views that only
+        convert and validate the fields that are read. With ``compact`` set,
+        they are yielded as read-only `CompactRecord` s.
+        
+        Args:
+            stop_page: The page number to stop at (optional).
+            read_ahead: Number of pages to fetch ahead on a worker thread (default 0, none).
+            checkpoint: Store to save and resume the position from (optional).
+            checkpoint_key: Key of the checkpoint; defaults to one derived from the filters.
+            stream: Decode items incrementally as each page downloads (default False).
+            lazy: Yield `LazyModel` views validated on access (default False).
+            compact: Yield read-only `CompactRecord` s (default False).
+            **params: Filter parameters to pass to the API.
+            
+        Yields:
+            T: Each item from the paginated results.
+        """
+        if str(self.client.__class__.__name__).startswith('AirwallexAsync'):
+            raise ValueError("This method requires a sync client.")
+        self._check_item_mode(lazy, compact)
+        
+        if stream:
+            if read_ahead or checkpoint or self._page_size_tuner(stop_page, checkpoint, params) is not None:
+                raise ValueError("stream cannot be combined with read_ahead, checkpoint or an adaptive page_size.")
+            for item in self._iter_streamed_items(stop_page, params):
+                yield self._build_item(item, lazy, compact)
+            return
+        
+        tuner = self._page_size_tuner(stop_page, checkpoint, params)
+        tracker, params, skip = self._checkpoint(checkpoint, checkpoint_key, params)
+        pages = self._iter_pages(stop_page, params, tuner)
+        if read_ahead > 0:
+            pages = self._read_ahead(pages, read_ahead)
+        
+        exhausted = False
+        try:
+            for page_num, items, last_page in pages:
+                for offset in range(skip, len(items)):
+                    yield self._build_item(items[offset], lazy, compact)
+                    if tracker:
+                        tracker.advance(page_num, offset + 1)
+                        tracker.save()
+                skip = 0
+                exhausted = last_page
+                if tracker and not last_page:
+                    tracker.advance(page_num + 1, 0)
+        finally:
+            # Stop the read-ahead worker now rather than when the generator is collected
+            pages.close()
+            if tracker and exhausted:
+                tracker.complete()
+            elif tracker:
+                tracker.save()
+    
+    def paginate_columns(
+        self,
+        stop_page: Optional[int] = None,
+        read_ahead: int = 0,
+        dataframe: bool = False,
+        amounts: str = "float",
+        **params: Any
+    ) -> Union[ColumnarBatch, Any]:
+        """
+        Read every page of a listing into typed column arrays.
+        
+        Each page is decoded straight from its raw items into one NumPy array
+        per field (see `ColumnarDecoder`), and the pages are concatenated column
+        by column, so no model or other per-item object is built. Categorical
+        columns share their categories across pages.
+        
+        ``read_ahead`` and ``page_size="auto"`` behave as in `paginate`.
+        
+        Args:
+            stop_page: The page number to stop at (optional).
+            read_ahead: Number of pages to fetch ahead on a worker thread (default 0, none).
+            dataframe: Return a pandas DataFrame instead of a `ColumnarBatch` (default False).
+            amounts: "float" for float64 amounts, or "minor_units" for int64
+                amounts in the minor unit of their currency (default "float").
+            **params: Filter parameters to pass to the API.
+            
+        Returns:
+            ColumnarBatch: The columns of every item, or a DataFrame of them.
+        """
+        if str(self.client.__class__.__name__).startswith('AirwallexAsync'):
+            raise ValueError("This method requires a sync client.")
+        decoder = ColumnarDecoder(self.model_class, amounts=amounts)
+        tuner = self._page_size_tuner(stop_page, None, params)
+        pages = self._iter_pages(stop_page, params, tuner)
+        if read_ahead > 0:
+            pages = self._read_ahead(pages, read_ahead)
+        try:
+            batches = [decoder.decode(items) for _, items, _ in pages]
+        finally:
+            pages.close()
+        batch = ColumnarBatch.concat(batches) if batches else decoder.decode([])
+        return batch.to_pandas() if dataframe else batch
+    
+    def _sharded_scan(
+        self,
+        from_created_at: Union[str, datetime],
+        to_created_at: Union[str, datetime],
+        shards: int,
+        max_pages_per_window: int,
+        params: Dict[str, Any]
+    ) -> ShardedScan:
+        """Plan a sharded scan of this listing."""
+        if not self.created_at_field:
+            raise ValueError(f"{self.__class__.__name__} does not support sharded scans.")
+        if self._page_size_tuner(None, None, params) is not None:
+            raise ValueError("Sharded scans need a fixed page_size; page_size='auto' is not supported.")
+        return ShardedScan(
+            from_created_at=from_created_at,
+            to_created_at=to_created_at,
+            created_at_field=self.created_at_field,
+            params=params,
+            shards=shards,
+            page_size=params.pop("page_size", self.default_page_size),
+            first_page_num=self.first_page_num,
+            max_pages_per_window=max_pages_per_window,
+            inclusive_end=self.to_created_at_inclusive,
+        )
+    
+    def scan(
+        self,
+        from_created_at: Union[str, datetime],
+        to_created_at: Union[str, datetime],
+        shards: int = 8,
+        max_workers: int = 8,
+        max_pages_per_window: int = 10,
+        **params: Any
+    ) -> Generator[T, None, None]:
+        """
+        Generate every item created in a time range, paging through sub-ranges in parallel.
+        
+        The range is split into ``shards`` windows that are paginated concurrently
+        on a thread pool. Windows holding more than ``max_pages_per_window`` pages
+        are split in half. Items are yielded in ascending creation order.
+        
+        Args:
+            from_created_at: Start of the range (inclusive).
+            to_created_at: End of the range (inclusive).
+            shards: Number of windows the range is initially split into.
+            max_workers: Number of worker threads.
+            max_pages_per_window: Page count above which a window is split.
+            **params: Other filter parameters to pass to the API.
+            
+        Yields:
+            T: Each item in the range, oldest first.
+        """
+        if str(self.client.__class__.__name__).startswith('AirwallexAsync'):
+            raise ValueError("This method requires a sync client.")
+        plan = self._sharded_scan(from_created_at, to_created_at, shards, max_pages_per_window, params)
+        for item in plan.run(self._fetch_page, max_workers=max_workers):
+            yield self._build_item(item)
+    
+    def _high_water_mark(
+        self,
+        store: CheckpointStore,
+        overlap: timedelta,
+        key: Optional[str],
+        params: Dict[str, Any]
+    ) -> Tuple[HighWaterMark, Dict[str, Any]]:
+        """Load the high-water mark of an incremental sync and the params to list the delta with."""
+        if not self.created_at_field:
+            raise ValueError(f"{self.__class__.__name__} does not support incremental syncs.")
+        if "from_created_at" in params:
+            raise ValueError("from_created_at is set from the stored high-water mark.")
+        mark = HighWaterMark(store, self._build_url(), params, overlap, key)
+        if mark.since is not None:
+            params = {**params, "from_created_at": mark.since.isoformat()}
+        return mark, params
+    
+    def fetch_new(
+        self,
+        store: CheckpointStore,
+        overlap: timedelta = timedelta(minutes=10),
+        key: Optional[str] = None,
+        **params: Any
+    ) -> Generator[T, None, None]:
+        """
+        Generate the items created since the previous run with the same filters.
+        
+        The latest creation time seen (the high-water mark) is kept in ``store``.
+        Each run lists from ``overlap`` before the mark, to catch items that
+        became visible late, and skips items already returned by earlier runs.
+        The mark is only advanced once the delta has been read to the end, so an
+        interrupted run is repeated in full next time.
+        
+        Args:
+            store: Store keeping the high-water mark between runs.
+            overlap: How far before the high-water mark to start listing.
+            key: Key of the stored mark; defaults to one derived from the filters.
+            **params: Other filter parameters to pass to the API.
+            
+        Yields:
+            T: Each item not returned by a previous run.
+        """
+        mark, params = self._high_water_mark(store, overlap, key, params)
+        for item in self.paginate(**params):
+            created_at = parse_timestamp(getattr(item, self.created_at_field))
+            if mark.is_new(str(getattr(item, self.id_field)), created_at):
+                yield item
+        mark.save()
+    
+    def paginate_generator(self, stop_page: Optional[int] = None, **params: Any) -> Generator[T, None, None]:
+        """Alias of `paginate`, used when the API object is called without a resource ID."""
+        return self.paginate(stop_page=stop_page, **params)
         
     # Asynchronous API methods
     
     async def fetch_async(self, resource_id: Any) -> T:
         """Fetch a single resource by ID asynchronously."""
-        if not str(self.client.__class__.__name__).startswith('Async'):
+        if not str(self.client.__class__.__name__).startswith('AirwallexAsync'):
             raise ValueError("This method requires an async client.")
         url = self._build_url(resource_id)
         response = await self.client._request("GET", url)
-        data = self._parse_response_data(response.json())
+        data = self._parse_response_data(self.client.json_codec.decode(response))
         # If the returned data is a list, take the first item.
         if isinstance(data, list):
             data = data[0] if data else {}
-        return self.model_class.from_api_response(data)
+        return self._build_item(data)
     
-    async def list_async(self, **params: Any) -> List[T]:
-        """List resources with optional filtering parameters asynchronously."""
-        if not str(self.client.__class__.__name__).startswith('Async'):
+    async def list_async(
+        self,
+        lazy: bool = False,
+        columnar: bool = False,
+        dataframe: bool = False,
+        amounts: str = "float",
+        compact: bool = False,
+        **params: Any
+    ) -> List[T]:
+        """
+        List resources with optional filtering parameters asynchronously.
+        
+        ``lazy``, ``columnar``, ``dataframe``, ``amounts`` and ``compact`` behave
+        as in `list`.
+        """
+        if not str(self.client.__class__.__name__).startswith('AirwallexAsync'):
             raise ValueError("This method requires an async client.")
         url = self._build_url()
         response = await self.client._request("GET", url, params=params)
-        data_list = self._parse_response_data(response.json())
-        return [self.model_class.from_api_response(item) for item in data_list]
+        data_list = self._parse_response_data(self.client.json_codec.decode(response))
+        return self._build_page(data_list, lazy, columnar, dataframe, amounts, compact)
     
     async def create_async(self, payload: Union[Dict[str, Any], T]) -> T:
         """Create a new resource asynchronously."""
-        if not str(self.client.__class__.__name__).startswith('Async'):
+        if not str(self.client.__class__.__name__).startswith('AirwallexAsync'):
             raise ValueError("This method requires an async client.")
         
         payload_dict = payload
@@ -322,15 +785,15 @@ class AirwallexAPIBase(Generic[T]):
             
         url = self._build_url()
         response = await self.client._request("POST", url, json=payload_dict)
-        data = self._parse_response_data(response.json())
+        data = self._parse_response_data(self.client.json_codec.decode(response))
         # If the returned data is a list, take the first item.
         if isinstance(data, list):
             data = data[0] if data else {}
-        return self.model_class.from_api_response(data)
+        return self._build_item(data)
     
     async def update_async(self, resource_id: Any, payload: Union[Dict[str, Any], T]) -> T:
         """Update an existing resource asynchronously."""
-        if not str(self.client.__class__.__name__).startswith('Async'):
+        if not str(self.client.__class__.__name__).startswith('AirwallexAsync'):
             raise ValueError("This method requires an async client.")
         
         payload_dict = payload
@@ -340,53 +803,298 @@ class AirwallexAPIBase(Generic[T]):
             
         url = self._build_url(resource_id)
         response = await self.client._request("PUT", url, json=payload_dict)
-        data = self._parse_response_data(response.json())
+        data = self._parse_response_data(self.client.json_codec.decode(response))
         # If the returned data is a list, take the first item.
         if isinstance(data, list):
             data = data[0] if data else {}
-        return self.model_class.from_api_response(data)
+        return self._build_item(data)
     
     async def delete_async(self, resource_id: Any) -> None:
         """Delete a resource asynchronously."""
-        if not str(self.client.__class__.__name__).startswith('Async'):
+        if not str(self.client.__class__.__name__).startswith('AirwallexAsync'):
             raise ValueError("This method requires an async client.")
         url = self._build_url(resource_id)
         await self.client._request("DELETE", url)
 
-    async def paginate_async(self, stop_page: Optional[int] = None, **params: Any) -> AsyncGenerator[T, None]:
+    async def _fetch_page_async(
+        self,
+        params: Dict[str, Any],
+        tuner: Optional[PageSizeTuner] = None
+    ) -> Dict[str, Any]:
+        """Fetch one page of a listing asynchronously and return the decoded response body."""
+        start = time.monotonic()
+        response = await self.client._request("GET", self._build_url(), params=params)
+        data = self.client.json_codec.decode(response)
+        if tuner:
+            tuner.observe(params["page_size"], time.monotonic() - start, len(response.content), len(data.get("items", [])))
+        return data
+
+    async def _iter_streamed_items_async(
+        self,
+        stop_page: Optional[int],
+        params: Dict[str, Any]
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Asynchronous version of `_iter_streamed_items`."""
+        page_num = params.get("page_num", self.first_page_num)
+        page_size = params.get("page_size", self.default_page_size)
+        
+        while True:
+            page_params = {**params, "page_num": page_num, "page_size": page_size}
+            response = await self.client._request("GET", self._build_url(), params=page_params, stream=True)
+            decoder = ItemsDecoder()
+            count = 0
+            try:
+                async for chunk in response.aiter_bytes():
+                    for item in decoder.feed(chunk):
+                        count += 1
+                        yield item
+                for item in decoder.close():
+                    count += 1
+                    yield item
+            finally:
+                await response.aclose()
+            
+            if not decoder.metadata.get("has_more", False) or not count:
+                break
+                
+            page_num += 1
+            
+            if stop_page and page_num > stop_page:
+                break
+    
+    async def _iter_pages_async(
+        self,
+        stop_page: Optional[int],
+        params: Dict[str, Any],
+        tuner: Optional[PageSizeTuner] = None,
+        prefetch: int = 1
+    ) -> AsyncGenerator[Tuple[int, List[Dict[str, Any]], bool], None]:
+        """
+        Fetch pages keeping up to ``prefetch`` requests in flight, yielding ``(page_num, items, is_last_page)``.
+        
+        The next pages are only scheduled once the caller asks for another page,
+        and pages requested past the last one are cancelled or discarded.
+        """
+        page_size = params.get("page_size", self.default_page_size)
+        next_page = params.get("page_num", self.first_page_num)
+        # Position of the next page's first item; with a tuner the page size may change
+        next_offset = 0
+        in_flight: Deque[Tuple[int, "asyncio.Task[Dict[str, Any]]"]] = deque()
+        
+        def schedule() -> None:
+            nonlocal next_page, next_offset, page_size
+            while len(in_flight) < prefetch and not (stop_page and next_page > stop_page):
+                if tuner:
+                    page_size = tuner.next_size(next_offset)
+                    next_page = self.first_page_num + next_offset // page_size
+                page_params = {**params, "page_num": next_page, "page_size": page_size}
+                in_flight.append((next_page, asyncio.ensure_future(self._fetch_page_async(page_params, tuner))))
+                next_page += 1
+                next_offset += page_size
+        
+        try:
+            schedule()
+            while in_flight:
+                page_num, task = in_flight.popleft()
+                data = await task
+                
+                items = data.get("items", [])
+                has_more = data.get("has_more", False)
+                
+                last_page = not has_more or not items
+                if last_page:
+                    # Anything still in flight is past the end of the listing
+                    self._cancel_pages(in_flight)
+                
+                yield page_num, items, last_page
+                
+                if not last_page:
+                    schedule()
+        finally:
+            self._cancel_pages(in_flight)
+    
+    async def paginate_async(
+        self,
+        stop_page: Optional[int] = None,
+        prefetch: int = 1,
+        checkpoint: Optional[CheckpointStore] = None,
+        checkpoint_key: Optional[str] = None,
+        stream: bool = False,
+        lazy: bool = False,
+        compact: bool = False,
+        **params: Any
+    ) -> AsyncGenerator[T, None]:
         """
         Generate items one by one from paginated results, asynchronously.
         
+        With ``prefetch`` greater than one, that many pages are kept in flight:
+        page N+1.. are requested while page N is being consumed. Items are still
+        yielded in order, and pages requested past the last one are cancelled or
+        discarded.
+        
+        With a ``checkpoint`` store, the position is saved and resumed as in
+        `paginate`, and ``page_size="auto"``, ``stream``, ``lazy`` and ``compact`` behave as
+        in `paginate`.
+        
         Args:
             stop_page: The page number to stop at (optional).
+            prefetch: Number of pages to keep in flight (default 1, sequential).
+            checkpoint: Store to save and resume the position from (optional).
+            checkpoint_key: Key of the checkpoint; defaults to one derived from the filters.
+            stream: Decode items incrementally as each page downloads (default False).
+            lazy: Yield `LazyModel` views validated on access (default False).
+            compact: Yield read-only `CompactRecord` s (default False).
             **params: Filter parameters to pass to the API.
             
         Yields:
             T: Each item from the paginated results.
         """
-        if not str(self.client.__class__.__name__).startswith('Async'):
+        if not str(self.client.__class__.__name__).startswith('AirwallexAsync'):
             raise ValueError("This method requires an async client.")
-            
-        page_num = params.get("page_num", 1)
-        page_size = params.get("page_size", 100)
+        if prefetch < 1:
+            raise ValueError("prefetch must be at least 1")
+        self._check_item_mode(lazy, compact)
         
-        while True:
-            params["page_num"] = page_num
-            params["page_size"] = page_size
-            url = self._build_url()
-            response = await self.client._request("GET", url, params=params)
-            data = response.json()
+        if stream:
+            if prefetch > 1 or checkpoint or self._page_size_tuner(stop_page, checkpoint, params) is not None:
+                raise ValueError("stream cannot be combined with prefetch, checkpoint or an adaptive page_size.")
+            async for item in self._iter_streamed_items_async(stop_page, params):
+                yield self._build_item(item, lazy, compact)
+            return
+        
+        tuner = self._page_size_tuner(stop_page, checkpoint, params)
+        tracker, params, skip = self._checkpoint(checkpoint, checkpoint_key, params)
+        pages = self._iter_pages_async(stop_page, params, tuner, prefetch)
+        
+        exhausted = False
+        try:
+            async for page_num, items, last_page in pages:
+                for offset in range(skip, len(items)):
+                    yield self._build_item(items[offset], lazy, compact)
+                    if tracker:
+                        tracker.advance(page_num, offset + 1)
+                        tracker.save()
+                skip = 0
+                exhausted = last_page
+                if tracker and not last_page:
+                    tracker.advance(page_num + 1, 0)
+        finally:
+            await pages.aclose()
+            if tracker and exhausted:
+                tracker.complete()
+            elif tracker:
+                tracker.save()
+    
+    async def paginate_columns_async(
+        self,
+        stop_page: Optional[int] = None,
+        prefetch: int = 1,
+        dataframe: bool = False,
+        amounts: str = "float",
+        **params: Any
+    ) -> Union[ColumnarBatch, Any]:
+        """
+        Read every page of a listing into typed column arrays, asynchronously.
+        
+        Asynchronous version of `paginate_columns`; ``prefetch`` behaves as in
+        `paginate_async`.
+        
+        Args:
+            stop_page: The page number to stop at (optional).
+            prefetch: Number of pages to keep in flight (default 1, sequential).
+            dataframe: Return a pandas DataFrame instead of a `ColumnarBatch` (default False).
+            amounts: "float" for float64 amounts, or "minor_units" for int64
+                amounts in the minor unit of their currency (default "float").
+            **params: Filter parameters to pass to the API.
             
-            items = data.get("items", [])
-            has_more = data.get("has_more", False)
+        Returns:
+            ColumnarBatch: The columns of every item, or a DataFrame of them.
+        """
+        if not str(self.client.__class__.__name__).startswith('AirwallexAsync'):
+            raise ValueError("This method requires an async client.")
+        if prefetch < 1:
+            raise ValueError("prefetch must be at least 1")
+        decoder = ColumnarDecoder(self.model_class, amounts=amounts)
+        tuner = self._page_size_tuner(stop_page, None, params)
+        pages = self._iter_pages_async(stop_page, params, tuner, prefetch)
+        batches = []
+        try:
+            async for _, items, _ in pages:
+                batches.append(decoder.decode(items))
+        finally:
+            await pages.aclose()
+        batch = ColumnarBatch.concat(batches) if batches else decoder.decode([])
+        return batch.to_pandas() if dataframe else batch
+    
+    async def scan_async(
+        self,
+        from_created_at: Union[str, datetime],
+        to_created_at: Union[str, datetime],
+        shards: int = 8,
+        max_concurrency: int = 8,
+        max_pages_per_window: int = 10,
+        **params: Any
+    ) -> AsyncGenerator[T, None]:
+        """
+        Generate every item created in a time range, paging through sub-ranges concurrently.
+        
+        Asynchronous version of `scan`; up to ``max_concurrency`` windows are
+        paginated at once.
+        
+        Args:
+            from_created_at: Start of the range (inclusive).
+            to_created_at: End of the range (inclusive).
+            shards: Number of windows the range is initially split into.
+            max_concurrency: Number of windows paginated at once.
+            max_pages_per_window: Page count above which a window is split.
+            **params: Other filter parameters to pass to the API.
             
-            for item in items:
-                yield self.model_class.from_api_response(item)
-                
-            if not has_more or not items:
-                break
-                
-            page_num += 1
+        Yields:
+            T: Each item in the range, oldest first.
+        """
+        if not str(self.client.__class__.__name__).startswith('AirwallexAsync'):
+            raise ValueError("This method requires an async client.")
+        plan = self._sharded_scan(from_created_at, to_created_at, shards, max_pages_per_window, params)
+        async for item in plan.run_async(self._fetch_page_async, max_concurrency=max_concurrency):
+            yield self._build_item(item)
+    
+    async def fetch_new_async(
+        self,
+        store: CheckpointStore,
+        overlap: timedelta = timedelta(minutes=10),
+        key: Optional[str] = None,
+        **params: Any
+    ) -> AsyncGenerator[T, None]:
+        """
+        Generate the items created since the previous run with the same filters, asynchronously.
+        
+        See `fetch_new`.
+        
+        Args:
+            store: Store keeping the high-water mark between runs.
+            overlap: How far before the high-water mark to start listing.
+            key: Key of the stored mark; defaults to one derived from the filters.
+            **params: Other filter parameters to pass to the API.
             
-            if stop_page and page_num > stop_page:
-                break
\ No newline at end of file
+        Yields:
+            T: Each item not returned by a previous run.
+        """
+        mark, params = self._high_water_mark(store, overlap, key, params)
+        async for item in self.paginate_async(**params):
+            created_at = parse_timestamp(getattr(item, self.created_at_field))
+            if mark.is_new(str(getattr(item, self.id_field)), created_at):
+                yield item
+        mark.save()
+    
+    @staticmethod
+    def _cancel_pages(in_flight: Deque[Tuple[int, "asyncio.Task[Dict[str, Any]]"]]) -> None:
+        """Cancel and forget page requests that will not be consumed."""
+        while in_flight:
+            _, task = in_flight.pop()
+            task.cancel()
+            # Retrieve any error so it is not reported as unhandled
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    
+    def paginate_async_generator(self, stop_page: Optional[int] = None, **params: Any) -> AsyncGenerator[T, None]:
+        """Alias of `paginate_async`, used when the API object is called without a resource ID."""
+        return self.paginate_async(stop_page=stop_page, **params)
@@ -79,9 +79,9 @@ class Beneficiary(AirwallexAPIBase[BeneficiaryModel]):
         """
         url = self._build_url(suffix="validate")
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("POST", url, json=beneficiary.to_api_dict())
-            return response.json()
+            return self.client.json_codec.decode(response)
         else:
             raise ValueError("Use validate_async for async clients")
     
@@ -97,9 +97,9 @@ class Beneficiary(AirwallexAPIBase[BeneficiaryModel]):
         """
         url = self._build_url(suffix="validate")
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("POST", url, json=beneficiary.to_api_dict())
-            return response.json()
+            return self.client.json_codec.decode(response)
         else:
             raise ValueError("Use validate for sync clients")
     
@@ -17,6 +17,8 @@ class FinancialTransaction(AirwallexAPIBase[FinancialTransaction]):
     """
     endpoint = "financial_transactions"
     model_class = cast(Type[FinancialTransaction], FinancialTransaction)
+    first_page_num = 0
+    created_at_field = "created_at"
     
     def list_with_filters(
         self, 
@@ -27,7 +29,11 @@ class FinancialTransaction(AirwallexAPIBase[FinancialTransaction]):
         source_id: Optional[str] = None,
         status: Optional[str] = None,
         page_num: int = 0,
-        page_size: int = 100
+        page_size: int = 100,
+        columnar: bool = False,
+        dataframe: bool = False,
+        amounts: str = "float",
+        compact: bool = False
     ) -> List[FinancialTransaction]:
         """
         List financial transactions with filtering options.
@@ -41,6 +47,10 @@ class FinancialTransaction(AirwallexAPIBase[FinancialTransaction]):
             status: Filter by status (PENDING, SETTLED)
             page_num: Page number (0-indexed) for pagination
             page_size: Number of transactions per page (max 1000)
+            columnar: Return a `ColumnarBatch` of typed column arrays instead of models
+            dataframe: Return a pandas DataFrame instead of models
+            amounts: "float" for float64 amounts or "minor_units" for int64 minor units (columnar only)
+            compact: Return read-only `CompactRecord` s instead of models
             
         Returns:
             List[FinancialTransaction]: List of matching financial transactions
@@ -68,7 +78,7 @@ class FinancialTransaction(AirwallexAPIBase[FinancialTransaction]):
         if to_created_at:
             params["to_created_at"] = to_created_at
         
-        return self.list(**params)
+        return self.list(columnar=columnar, dataframe=dataframe, amounts=amounts, compact=compact, **params)
     
     async def list_with_filters_async(
         self, 
@@ -79,7 +89,11 @@ class FinancialTransaction(AirwallexAPIBase[FinancialTransaction]):
         source_id: Optional[str] = None,
         status: Optional[str] = None,
         page_num: int = 0,
-        page_size: int = 100
+        page_size: int = 100,
+        columnar: bool = False,
+        dataframe: bool = False,
+        amounts: str = "float",
+        compact: bool = False
     ) -> List[FinancialTransaction]:
         """
         List financial transactions with filtering options asynchronously.
@@ -93,6 +107,10 @@ class FinancialTransaction(AirwallexAPIBase[FinancialTransaction]):
             status: Filter by status (PENDING, SETTLED)
             page_num: Page number (0-indexed) for pagination
             page_size: Number of transactions per page (max 1000)
+            columnar: Return a `ColumnarBatch` of typed column arrays instead of models
+            dataframe: Return a pandas DataFrame instead of models
+            amounts: "float" for float64 amounts or "minor_units" for int64 minor units (columnar only)
+            compact: Return read-only `CompactRecord` s instead of models
             
         Returns:
             List[FinancialTransaction]: List of matching financial transactions
@@ -120,4 +138,4 @@ class FinancialTransaction(AirwallexAPIBase[FinancialTransaction]):
         if to_created_at:
             params["to_created_at"] = to_created_at
         
-        return await self.list_async(**params)
\ No newline at end of file
+        return await self.list_async(columnar=columnar, dataframe=dataframe, amounts=amounts, compact=compact, **params)
\ No newline at end of file
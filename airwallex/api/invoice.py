@@ -33,9 +33,9 @@ class Invoice(AirwallexAPIBase[Invoice]):
         """
         url = self._build_url(suffix="preview")
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("POST", url, json=preview_request.to_api_dict())
-            return InvoicePreviewResponse.from_api_response(response.json())
+            return InvoicePreviewResponse.from_api_response(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use preview_async for async clients")
     
@@ -54,9 +54,9 @@ class Invoice(AirwallexAPIBase[Invoice]):
         """
         url = self._build_url(suffix="preview")
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("POST", url, json=preview_request.to_api_dict())
-            return InvoicePreviewResponse.from_api_response(response.json())
+            return InvoicePreviewResponse.from_api_response(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use preview for sync clients")
     
@@ -78,9 +78,9 @@ class Invoice(AirwallexAPIBase[Invoice]):
             "page_size": page_size
         }
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("GET", url, params=params)
-            data = response.json()
+            data = self.client.json_codec.decode(response)
             
             if "items" in data:
                 return [InvoiceItem.from_api_response(item) for item in data["items"]]
@@ -106,9 +106,9 @@ class Invoice(AirwallexAPIBase[Invoice]):
             "page_size": page_size
         }
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("GET", url, params=params)
-            data = response.json()
+            data = self.client.json_codec.decode(response)
             
             if "items" in data:
                 return [InvoiceItem.from_api_response(item) for item in data["items"]]
@@ -129,9 +129,9 @@ class Invoice(AirwallexAPIBase[Invoice]):
         """
         url = f"{self._build_url(invoice_id)}/items/{item_id}"
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("GET", url)
-            return InvoiceItem.from_api_response(response.json())
+            return InvoiceItem.from_api_response(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use get_item_async for async clients")
     
@@ -148,9 +148,9 @@ class Invoice(AirwallexAPIBase[Invoice]):
         """
         url = f"{self._build_url(invoice_id)}/items/{item_id}"
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("GET", url)
-            return InvoiceItem.from_api_response(response.json())
+            return InvoiceItem.from_api_response(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use get_item for sync clients")
     
@@ -1,7 +1,7 @@
 """
 Airwallex Issuing Authorization API.
 """
-from typing import Dict, Any, List, Optional, Type, TypeVar, Union, cast
+from typing import List, Optional, Type, TypeVar, Union, cast
 from datetime import datetime
 from ..models.issuing_authorization import Authorization, AuthorizationListResponse
 from .base import AirwallexAPIBase
@@ -17,6 +17,11 @@ class IssuingAuthorization(AirwallexAPIBase[Authorization]):
     """
     endpoint = "issuing/authorizations"
     model_class = cast(Type[Authorization], Authorization)
+    first_page_num = 0
+    default_page_size = 10
+    created_at_field = "create_time"
+    to_created_at_inclusive = False
+    id_field = "transaction_id"
     
     def list_with_filters(
         self,
@@ -30,6 +35,10 @@ class IssuingAuthorization(AirwallexAPIBase[Authorization]):
         retrieval_ref: Optional[str] = None,
         status: Optional[str] = None,
         to_created_at: Optional[Union[str, datetime]] = None,
+        columnar: bool = False,
+        dataframe: bool = False,
+        amounts: str = "float",
+        compact: bool = False
     ) -> List[Authorization]:
         """
         List authorizations with filtering options.
@@ -45,6 +54,10 @@ class IssuingAuthorization(AirwallexAPIBase[Authorization]):
             retrieval_ref: Retrieval reference number
             status: Authorization status (CLEARED, EXPIRED, FAILED, PENDING, REVERSED)
             to_created_at: End of Transaction Date in ISO8601 format (exclusive)
+            columnar: Return a `ColumnarBatch` of typed column arrays instead of models
+            dataframe: Return a pandas DataFrame instead of models
+            amounts: "float" for float64 amounts or "minor_units" for int64 minor units (columnar only)
+            compact: Return read-only `CompactRecord` s instead of models
             
         Returns:
             List[Authorization]: List of matching authorizations
@@ -82,10 +95,10 @@ class IssuingAuthorization(AirwallexAPIBase[Authorization]):
                 to_created_at = to_created_at.isoformat()
             params["to_created_at"] = to_created_at
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("GET", self._build_url(), params=params)
-            data = response.json()
-            return [self.model_class.from_api_response(item) for item in data.get("items", [])]
+            data = self.client.json_codec.decode(response)
+            return self._build_page(data.get("items", []), columnar=columnar, dataframe=dataframe, amounts=amounts, compact=compact)
         else:
             raise ValueError("Use list_with_filters_async for async clients")
     
@@ -101,6 +114,10 @@ class IssuingAuthorization(AirwallexAPIBase[Authorization]):
         retrieval_ref: Optional[str] = None,
         status: Optional[str] = None,
         to_created_at: Optional[Union[str, datetime]] = None,
+        columnar: bool = False,
+        dataframe: bool = False,
+        amounts: str = "float",
+        compact: bool = False
     ) -> List[Authorization]:
         """
         List authorizations with filtering options asynchronously.
@@ -116,6 +133,10 @@ class IssuingAuthorization(AirwallexAPIBase[Authorization]):
             retrieval_ref: Retrieval reference number
             status: Authorization status (CLEARED, EXPIRED, FAILED, PENDING, REVERSED)
             to_created_at: End of Transaction Date in ISO8601 format (exclusive)
+            columnar: Return a `ColumnarBatch` of typed column arrays instead of models
+            dataframe: Return a pandas DataFrame instead of models
+            amounts: "float" for float64 amounts or "minor_units" for int64 minor units (columnar only)
+            compact: Return read-only `CompactRecord` s instead of models
             
         Returns:
             List[Authorization]: List of matching authorizations
@@ -153,161 +174,9 @@ class IssuingAuthorization(AirwallexAPIBase[Authorization]):
                 to_created_at = to_created_at.isoformat()
             params["to_created_at"] = to_created_at
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("GET", self._build_url(), params=params)
-            data = response.json()
-            return [self.model_class.from_api_response(item) for item in data.get("items", [])]
+            data = self.client.json_codec.decode(response)
+            return self._build_page(data.get("items", []), columnar=columnar, dataframe=dataframe, amounts=amounts, compact=compact)
         else:
             raise ValueError("Use list_with_filters for sync clients")
-    
-    def paginate(self, **params: Any) -> List[Authorization]:
-        """
-        Fetch all pages of authorizations.
-        
-        Args:
-            **params: Filter parameters to pass to the API
-            
-        Returns:
-            List[Authorization]: All authorizations matching the filters
-        """
-        if str(self.client.__class__.__name__).startswith('Async'):
-            raise ValueError("This method requires a sync client.")
-            
-        all_items: List[Dict[str, Any]] = []
-        page_num = params.get("page_num", 0)
-        page_size = params.get("page_size", 10)
-        
-        while True:
-            params["page_num"] = page_num
-            params["page_size"] = page_size
-            
-            response = self.client._request("GET", self._build_url(), params=params)
-            data = response.json()
-            
-            items = data.get("items", [])
-            has_more = data.get("has_more", False)
-            
-            if not items:
-                break
-                
-            all_items.extend(items)
-            
-            if not has_more:
-                break
-                
-            page_num += 1
-                
-        return [self.model_class.from_api_response(item) for item in all_items]
-    
-    async def paginate_async(self, **params: Any) -> List[Authorization]:
-        """
-        Fetch all pages of authorizations asynchronously.
-        
-        Args:
-            **params: Filter parameters to pass to the API
-            
-        Returns:
-            List[Authorization]: All authorizations matching the filters
-        """
-        if not self.client.__class__.__name__.startswith('Async'):
-            raise ValueError("This method requires an async client.")
-            
-        all_items: List[Dict[str, Any]] = []
-        page_num = params.get("page_num", 0)
-        page_size = params.get("page_size", 10)
-        
-        while True:
-            params["page_num"] = page_num
-            params["page_size"] = page_size
-            
-            response = await self.client._request("GET", self._build_url(), params=params)
-            data = response.json()
-            
-            items = data.get("items", [])
-            has_more = data.get("has_more", False)
-            
-            if not items:
-                break
-                
-            all_items.extend(items)
-            
-            if not has_more:
-                break
-                
-            page_num += 1
-                
-        return [self.model_class.from_api_response(item) for item in all_items]
-    
-    def paginate_generator(self, **params: Any):
-        """
-        Generate items one by one from paginated results.
-        
-        Args:
-            **params: Filter parameters to pass to the API
-            
-        Yields:
-            Authorization: Authorization objects one by one
-        """
-        if self.client.__class__.__name__.startswith('Async'):
-            raise ValueError("This method requires a sync client.")
-            
-        page_num = params.get("page_num", 0)
-        page_size = params.get("page_size", 10)
-        
-        while True:
-            params["page_num"] = page_num
-            params["page_size"] = page_size
-            
-            response = self.client._request("GET", self._build_url(), params=params)
-            data = response.json()
-            
-            items = data.get("items", [])
-            has_more = data.get("has_more", False)
-            
-            if not items:
-                break
-                
-            for item in items:
-                yield self.model_class.from_api_response(item)
-            
-            if not has_more:
-                break
-                
-            page_num += 1
-    
-    async def paginate_async_generator(self, **params: Any):
-        """
-        Generate items one by one from paginated results asynchronously.
-        
-        Args:
-            **params: Filter parameters to pass to the API
-            
-        Yields:
-            Authorization: Authorization objects one by one
-        """
-        if not self.client.__class__.__name__.startswith('Async'):
-            raise ValueError("This method requires an async client.")
-            
-        page_num = params.get("page_num", 0)
-        page_size = params.get("page_size", 10)
-        
-        while True:
-            params["page_num"] = page_num
-            params["page_size"] = page_size
-            
-            response = await self.client._request("GET", self._build_url(), params=params)
-            data = response.json()
-            
-            items = data.get("items", [])
-            has_more = data.get("has_more", False)
-            
-            if not items:
-                break
-                
-            for item in items:
-                yield self.model_class.from_api_response(item)
-            
-            if not has_more:
-                break
-                
-            page_num += 1
@@ -1,7 +1,7 @@
 """
 Airwallex Issuing Card API.
 """
-from typing import Dict, Any, List, Optional, Type, TypeVar, Union, cast
+from typing import List, Optional, Type, TypeVar, Union, cast
 from datetime import datetime
 from ..models.issuing_card import Card, CardCreateRequest, CardUpdateRequest, CardDetails, CardLimits
 from .base import AirwallexAPIBase
@@ -17,6 +17,8 @@ class IssuingCard(AirwallexAPIBase[Card]):
     """
     endpoint = "issuing/cards"
     model_class = cast(Type[Card], Card)
+    first_page_num = 0
+    default_page_size = 10
     
     def create_card(self, card: CardCreateRequest) -> Card:
         """
@@ -30,9 +32,9 @@ class IssuingCard(AirwallexAPIBase[Card]):
         """
         url = f"{self.base_path}/create"
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("POST", url, json=card.to_api_dict())
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use create_card_async for async clients")
     
@@ -48,9 +50,9 @@ class IssuingCard(AirwallexAPIBase[Card]):
         """
         url = f"{self.base_path}/create"
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("POST", url, json=card.to_api_dict())
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use create_card for sync clients")
     
@@ -66,9 +68,9 @@ class IssuingCard(AirwallexAPIBase[Card]):
         """
         url = f"{self._build_url(card_id)}/details"
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("GET", url)
-            return CardDetails.from_api_response(response.json())
+            return CardDetails.from_api_response(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use get_card_details_async for async clients")
     
@@ -84,9 +86,9 @@ class IssuingCard(AirwallexAPIBase[Card]):
         """
         url = f"{self._build_url(card_id)}/details"
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("GET", url)
-            return CardDetails.from_api_response(response.json())
+            return CardDetails.from_api_response(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use get_card_details for sync clients")
     
@@ -99,7 +101,7 @@ class IssuingCard(AirwallexAPIBase[Card]):
         """
         url = f"{self._build_url(card_id)}/activate"
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             self.client._request("POST", url)
         else:
             raise ValueError("Use activate_card_async for async clients")
@@ -113,7 +115,7 @@ class IssuingCard(AirwallexAPIBase[Card]):
         """
         url = f"{self._build_url(card_id)}/activate"
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             await self.client._request("POST", url)
         else:
             raise ValueError("Use activate_card for sync clients")
@@ -130,9 +132,9 @@ class IssuingCard(AirwallexAPIBase[Card]):
         """
         url = f"{self._build_url(card_id)}/limits"
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("GET", url)
-            return CardLimits.from_api_response(response.json())
+            return CardLimits.from_api_response(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use get_card_limits_async for async clients")
     
@@ -148,9 +150,9 @@ class IssuingCard(AirwallexAPIBase[Card]):
         """
         url = f"{self._build_url(card_id)}/limits"
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("GET", url)
-            return CardLimits.from_api_response(response.json())
+            return CardLimits.from_api_response(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use get_card_limits for sync clients")
     
@@ -167,9 +169,9 @@ class IssuingCard(AirwallexAPIBase[Card]):
         """
         url = f"{self._build_url(card_id)}/update"
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("POST", url, json=update_data.to_api_dict())
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use update_card_async for async clients")
     
@@ -186,9 +188,9 @@ class IssuingCard(AirwallexAPIBase[Card]):
         """
         url = f"{self._build_url(card_id)}/update"
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("POST", url, json=update_data.to_api_dict())
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use update_card for sync clients")
     
@@ -255,10 +257,10 @@ class IssuingCard(AirwallexAPIBase[Card]):
                 to_updated_at = to_updated_at.isoformat()
             params["to_updated_at"] = to_updated_at
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("GET", self._build_url(), params=params)
-            data = response.json()
-            return [self.model_class.from_api_response(item) for item in data.get("items", [])]
+            data = self.client.json_codec.decode(response)
+            return [self._build_item(item) for item in data.get("items", [])]
         else:
             raise ValueError("Use list_with_filters_async for async clients")
     
@@ -325,87 +327,9 @@ class IssuingCard(AirwallexAPIBase[Card]):
                 to_updated_at = to_updated_at.isoformat()
             params["to_updated_at"] = to_updated_at
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("GET", self._build_url(), params=params)
-            data = response.json()
-            return [self.model_class.from_api_response(item) for item in data.get("items", [])]
+            data = self.client.json_codec.decode(response)
+            return [self._build_item(item) for item in data.get("items", [])]
         else:
             raise ValueError("Use list_with_filters for sync clients")
-    
-    def paginate(self, **params: Any) -> List[Card]:
-        """
-        Fetch all pages of cards.
-        
-        Args:
-            **params: Filter parameters to pass to the API
-            
-        Returns:
-            List[Card]: All cards matching the filters
-        """
-        if str(self.client.__class__.__name__).startswith('Async'):
-            raise ValueError("This method requires a sync client.")
-            
-        all_items: List[Dict[str, Any]] = []
-        page_num = params.get("page_num", 0)
-        page_size = params.get("page_size", 10)
-        
-        while True:
-            params["page_num"] = page_num
-            params["page_size"] = page_size
-            
-            response = self.client._request("GET", self._build_url(), params=params)
-            data = response.json()
-            
-            items = data.get("items", [])
-            has_more = data.get("has_more", False)
-            
-            if not items:
-                break
-                
-            all_items.extend(items)
-            
-            if not has_more:
-                break
-                
-            page_num += 1
-                
-        return [self.model_class.from_api_response(item) for item in all_items]
-    
-    async def paginate_async(self, **params: Any) -> List[Card]:
-        """
-        Fetch all pages of cards asynchronously.
-        
-        Args:
-            **params: Filter parameters to pass to the API
-            
-        Returns:
-            List[Card]: All cards matching the filters
-        """
-        if not self.client.__class__.__name__.startswith('Async'):
-            raise ValueError("This method requires an async client.")
-            
-        all_items: List[Dict[str, Any]] = []
-        page_num = params.get("page_num", 0)
-        page_size = params.get("page_size", 10)
-        
-        while True:
-            params["page_num"] = page_num
-            params["page_size"] = page_size
-            
-            response = await self.client._request("GET", self._build_url(), params=params)
-            data = response.json()
-            
-            items = data.get("items", [])
-            has_more = data.get("has_more", False)
-            
-            if not items:
-                break
-                
-            all_items.extend(items)
-            
-            if not has_more:
-                break
-                
-            page_num += 1
-                
-        return [self.model_class.from_api_response(item) for item in all_items]
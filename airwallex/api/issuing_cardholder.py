@@ -1,7 +1,7 @@
 """
 Airwallex Issuing Cardholder API.
 """
-from typing import Dict, Any, List, Optional, Type, TypeVar, Union, cast
+from typing import List, Optional, Type, TypeVar, Union, cast
 from ..models.issuing_cardholder import Cardholder, CardholderCreateRequest, CardholderUpdateRequest
 from .base import AirwallexAPIBase
 
@@ -16,6 +16,8 @@ class IssuingCardholder(AirwallexAPIBase[Cardholder]):
     """
     endpoint = "issuing/cardholders"
     model_class = cast(Type[Cardholder], Cardholder)
+    first_page_num = 0
+    default_page_size = 10
     
     def create_cardholder(self, cardholder: CardholderCreateRequest) -> Cardholder:
         """
@@ -29,9 +31,9 @@ class IssuingCardholder(AirwallexAPIBase[Cardholder]):
         """
         url = f"{self.base_path}/create"
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("POST", url, json=cardholder.to_api_dict())
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use create_cardholder_async for async clients")
     
@@ -47,9 +49,9 @@ class IssuingCardholder(AirwallexAPIBase[Cardholder]):
         """
         url = f"{self.base_path}/create"
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("POST", url, json=cardholder.to_api_dict())
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use create_cardholder for sync clients")
     
@@ -78,10 +80,10 @@ class IssuingCardholder(AirwallexAPIBase[Cardholder]):
         if cardholder_status:
             params["cardholder_status"] = cardholder_status
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("GET", self._build_url(), params=params)
-            data = response.json()
-            return [self.model_class.from_api_response(item) for item in data.get("items", [])]
+            data = self.client.json_codec.decode(response)
+            return [self._build_item(item) for item in data.get("items", [])]
         else:
             raise ValueError("Use list_with_filters_async for async clients")
     
@@ -110,10 +112,10 @@ class IssuingCardholder(AirwallexAPIBase[Cardholder]):
         if cardholder_status:
             params["cardholder_status"] = cardholder_status
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("GET", self._build_url(), params=params)
-            data = response.json()
-            return [self.model_class.from_api_response(item) for item in data.get("items", [])]
+            data = self.client.json_codec.decode(response)
+            return [self._build_item(item) for item in data.get("items", [])]
         else:
             raise ValueError("Use list_with_filters for sync clients")
     
@@ -130,9 +132,9 @@ class IssuingCardholder(AirwallexAPIBase[Cardholder]):
         """
         url = f"{self._build_url(cardholder_id)}/update"
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("POST", url, json=update_data.to_api_dict())
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use update_cardholder_async for async clients")
     
@@ -149,86 +151,8 @@ class IssuingCardholder(AirwallexAPIBase[Cardholder]):
         """
         url = f"{self._build_url(cardholder_id)}/update"
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("POST", url, json=update_data.to_api_dict())
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use update_cardholder for sync clients")
-    
-    def paginate(self, **params: Any) -> List[Cardholder]:
-        """
-        Fetch all pages of cardholders.
-        
-        Args:
-            **params: Filter parameters to pass to the API
-            
-        Returns:
-            List[Cardholder]: All cardholders matching the filters
-        """
-        if str(self.client.__class__.__name__).startswith('Async'):
-            raise ValueError("This method requires a sync client.")
-            
-        all_items: List[Dict[str, Any]] = []
-        page_num = params.get("page_num", 0)
-        page_size = params.get("page_size", 10)
-        
-        while True:
-            params["page_num"] = page_num
-            params["page_size"] = page_size
-            
-            response = self.client._request("GET", self._build_url(), params=params)
-            data = response.json()
-            
-            items = data.get("items", [])
-            has_more = data.get("has_more", False)
-            
-            if not items:
-                break
-                
-            all_items.extend(items)
-            
-            if not has_more:
-                break
-                
-            page_num += 1
-                
-        return [self.model_class.from_api_response(item) for item in all_items]
-    
-    async def paginate_async(self, **params: Any) -> List[Cardholder]:
-        """
-        Fetch all pages of cardholders asynchronously.
-        
-        Args:
-            **params: Filter parameters to pass to the API
-            
-        Returns:
-            List[Cardholder]: All cardholders matching the filters
-        """
-        if not self.client.__class__.__name__.startswith('Async'):
-            raise ValueError("This method requires an async client.")
-            
-        all_items: List[Dict[str, Any]] = []
-        page_num = params.get("page_num", 0)
-        page_size = params.get("page_size", 10)
-        
-        while True:
-            params["page_num"] = page_num
-            params["page_size"] = page_size
-            
-            response = await self.client._request("GET", self._build_url(), params=params)
-            data = response.json()
-            
-            items = data.get("items", [])
-            has_more = data.get("has_more", False)
-            
-            if not items:
-                break
-                
-            all_items.extend(items)
-            
-            if not has_more:
-                break
-                
-            page_num += 1
-                
-        return [self.model_class.from_api_response(item) for item in all_items]
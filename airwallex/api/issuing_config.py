@@ -24,9 +24,9 @@ class IssuingConfig(AirwallexAPIBase[IssuingConfig]):
         Returns:
             IssuingConfig: The current issuing configuration
         """
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("GET", self._build_url())
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use get_config_async for async clients")
     
@@ -37,9 +37,9 @@ class IssuingConfig(AirwallexAPIBase[IssuingConfig]):
         Returns:
             IssuingConfig: The current issuing configuration
         """
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("GET", self._build_url())
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use get_config for sync clients")
     
@@ -55,9 +55,9 @@ class IssuingConfig(AirwallexAPIBase[IssuingConfig]):
         """
         url = f"{self._build_url()}/update"
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("POST", url, json=update_data.to_api_dict())
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use update_config_async for async clients")
     
@@ -73,8 +73,8 @@ class IssuingConfig(AirwallexAPIBase[IssuingConfig]):
         """
         url = f"{self._build_url()}/update"
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("POST", url, json=update_data.to_api_dict())
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use update_config for sync clients")
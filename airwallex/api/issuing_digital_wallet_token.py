@@ -1,7 +1,7 @@
 """
 Airwallex Issuing Digital Wallet Token API.
 """
-from typing import Dict, Any, List, Optional, Type, TypeVar, Union, cast
+from typing import List, Optional, Type, TypeVar, Union, cast
 from datetime import datetime
 from ..models.issuing_digital_wallet_token import DigitalWalletToken
 from .base import AirwallexAPIBase
@@ -17,6 +17,8 @@ class IssuingDigitalWalletToken(AirwallexAPIBase[DigitalWalletToken]):
     """
     endpoint = "issuing/digital_wallet_tokens"
     model_class = cast(Type[DigitalWalletToken], DigitalWalletToken)
+    first_page_num = 0
+    default_page_size = 10
     
     def list_with_filters(
         self,
@@ -87,10 +89,10 @@ class IssuingDigitalWalletToken(AirwallexAPIBase[DigitalWalletToken]):
         if token_types:
             params["token_types"] = token_types
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("GET", self._build_url(), params=params)
-            data = response.json()
-            return [self.model_class.from_api_response(item) for item in data.get("items", [])]
+            data = self.client.json_codec.decode(response)
+            return [self._build_item(item) for item in data.get("items", [])]
         else:
             raise ValueError("Use list_with_filters_async for async clients")
     
@@ -163,87 +165,9 @@ class IssuingDigitalWalletToken(AirwallexAPIBase[DigitalWalletToken]):
         if token_types:
             params["token_types"] = token_types
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("GET", self._build_url(), params=params)
-            data = response.json()
-            return [self.model_class.from_api_response(item) for item in data.get("items", [])]
+            data = self.client.json_codec.decode(response)
+            return [self._build_item(item) for item in data.get("items", [])]
         else:
             raise ValueError("Use list_with_filters for sync clients")
-    
-    def paginate(self, **params: Any) -> List[DigitalWalletToken]:
-        """
-        Fetch all pages of digital wallet tokens.
-        
-        Args:
-            **params: Filter parameters to pass to the API
-            
-        Returns:
-            List[DigitalWalletToken]: All digital wallet tokens matching the filters
-        """
-        if str(self.client.__class__.__name__).startswith('Async'):
-            raise ValueError("This method requires a sync client.")
-            
-        all_items: List[Dict[str, Any]] = []
-        page_num = params.get("page_num", 0)
-        page_size = params.get("page_size", 10)
-        
-        while True:
-            params["page_num"] = page_num
-            params["page_size"] = page_size
-            
-            response = self.client._request("GET", self._build_url(), params=params)
-            data = response.json()
-            
-            items = data.get("items", [])
-            has_more = data.get("has_more", False)
-            
-            if not items:
-                break
-                
-            all_items.extend(items)
-            
-            if not has_more:
-                break
-                
-            page_num += 1
-                
-        return [self.model_class.from_api_response(item) for item in all_items]
-    
-    async def paginate_async(self, **params: Any) -> List[DigitalWalletToken]:
-        """
-        Fetch all pages of digital wallet tokens asynchronously.
-        
-        Args:
-            **params: Filter parameters to pass to the API
-            
-        Returns:
-            List[DigitalWalletToken]: All digital wallet tokens matching the filters
-        """
-        if not self.client.__class__.__name__.startswith('Async'):
-            raise ValueError("This method requires an async client.")
-            
-        all_items: List[Dict[str, Any]] = []
-        page_num = params.get("page_num", 0)
-        page_size = params.get("page_size", 10)
-        
-        while True:
-            params["page_num"] = page_num
-            params["page_size"] = page_size
-            
-            response = await self.client._request("GET", self._build_url(), params=params)
-            data = response.json()
-            
-            items = data.get("items", [])
-            has_more = data.get("has_more", False)
-            
-            if not items:
-                break
-                
-            all_items.extend(items)
-            
-            if not has_more:
-                break
-                
-            page_num += 1
-                
-        return [self.model_class.from_api_response(item) for item in all_items]
@@ -1,7 +1,7 @@
 """
 Airwallex Issuing Transaction API.
 """
-from typing import Dict, Any, List, Optional, Type, TypeVar, Union, cast
+from typing import List, Optional, Type, TypeVar, Union, cast
 from datetime import datetime
 from ..models.issuing_transaction import Transaction
 from .base import AirwallexAPIBase
@@ -17,6 +17,10 @@ class IssuingTransaction(AirwallexAPIBase[Transaction]):
     """
     endpoint = "issuing/transactions"
     model_class = cast(Type[Transaction], Transaction)
+    first_page_num = 0
+    default_page_size = 10
+    created_at_field = "transaction_date"
+    id_field = "transaction_id"
     
     def list_with_filters(
         self,
@@ -29,7 +33,11 @@ class IssuingTransaction(AirwallexAPIBase[Transaction]):
         page_size: int = 10,
         retrieval_ref: Optional[str] = None,
         to_created_at: Optional[Union[str, datetime]] = None,
-        transaction_type: Optional[str] = None
+        transaction_type: Optional[str] = None,
+        columnar: bool = False,
+        dataframe: bool = False,
+        amounts: str = "float",
+        compact: bool = False
     ) -> List[Transaction]:
         """
         List transactions with filtering options.
@@ -45,6 +53,10 @@ class IssuingTransaction(AirwallexAPIBase[Transaction]):
             retrieval_ref: Retrieval reference number
             to_created_at: End of Transaction Date in ISO8601 format (inclusive)
             transaction_type: Transaction type (AUTHORIZATION, CLEARING, REFUND, REVERSAL, ORIGINAL_CREDIT)
+            columnar: Return a `ColumnarBatch` of typed column arrays instead of models
+            dataframe: Return a pandas DataFrame instead of models
+            amounts: "float" for float64 amounts or "minor_units" for int64 minor units (columnar only)
+            compact: Return read-only `CompactRecord` s instead of models
             
         Returns:
             List[Transaction]: List of matching transactions
@@ -78,10 +90,10 @@ class IssuingTransaction(AirwallexAPIBase[Transaction]):
         if transaction_type:
             params["transaction_type"] = transaction_type
         
-        if not str(self.client.__class__.__name__).startswith('Async'):
+        if not str(self.client.__class__.__name__).startswith('AirwallexAsync'):
             response = self.client._request("GET", self._build_url(), params=params)
-            data = response.json()
-            return [self.model_class.from_api_response(item) for item in data.get("items", [])]
+            data = self.client.json_codec.decode(response)
+            return self._build_page(data.get("items", []), columnar=columnar, dataframe=dataframe, amounts=amounts, compact=compact)
         else:
             raise ValueError("Use list_with_filters_async for async clients")
     
@@ -96,7 +108,11 @@ class IssuingTransaction(AirwallexAPIBase[Transaction]):
         page_size: int = 10,
         retrieval_ref: Optional[str] = None,
         to_created_at: Optional[Union[str, datetime]] = None,
-        transaction_type: Optional[str] = None
+        transaction_type: Optional[str] = None,
+        columnar: bool = False,
+        dataframe: bool = False,
+        amounts: str = "float",
+        compact: bool = False
     ) -> List[Transaction]:
         """
         List transactions with filtering options asynchronously.
@@ -112,6 +128,10 @@ class IssuingTransaction(AirwallexAPIBase[Transaction]):
             retrieval_ref: Retrieval reference number
             to_created_at: End of Transaction Date in ISO8601 format (inclusive)
             transaction_type: Transaction type (AUTHORIZATION, CLEARING, REFUND, REVERSAL, ORIGINAL_CREDIT)
+            columnar: Return a `ColumnarBatch` of typed column arrays instead of models
+            dataframe: Return a pandas DataFrame instead of models
+            amounts: "float" for float64 amounts or "minor_units" for int64 minor units (columnar only)
+            compact: Return read-only `CompactRecord` s instead of models
             
         Returns:
             List[Transaction]: List of matching transactions
@@ -145,48 +165,9 @@ class IssuingTransaction(AirwallexAPIBase[Transaction]):
         if transaction_type:
             params["transaction_type"] = transaction_type
         
-        if str(self.client.__class__.__name__).startswith('Async'):
+        if str(self.client.__class__.__name__).startswith('AirwallexAsync'):
             response = await self.client._request("GET", self._build_url(), params=params)
-            data = response.json()
-            return [self.model_class.from_api_response(item) for item in data.get("items", [])]
+            data = self.client.json_codec.decode(response)
+            return self._build_page(data.get("items", []), columnar=columnar, dataframe=dataframe, amounts=amounts, compact=compact)
         else:
             raise ValueError("Use list_with_filters for sync clients")
-    
-    def paginate(self, **params: Any) -> List[Transaction]:
-        """
-        Fetch all pages of transactions.
-        
-        Args:
-            **params: Filter parameters to pass to the API
-            
-        Returns:
-            List[Transaction]: All transactions matching the filters
-        """
-        if str(self.client.__class__.__name__).startswith('Async'):
-            raise ValueError("This method requires a sync client.")
-            
-        all_items: List[Dict[str, Any]] = []
-        page_num = params.get("page_num", 0)
-        page_size = params.get("page_size", 10)
-        
-        while True:
-            params["page_num"] = page_num
-            params["page_size"] = page_size
-            
-            response = self.client._request("GET", self._build_url(), params=params)
-            data = response.json()
-            
-            items = data.get("items", [])
-            has_more = data.get("has_more", False)
-            
-            if not items:
-                break
-                
-            all_items.extend(items)
-            
-            if not has_more:
-                break
-                
-            page_num += 1
-                
-        return [self.model_class.from_api_response(item) for item in all_items]
\ No newline at end of file
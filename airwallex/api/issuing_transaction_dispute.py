@@ -30,9 +30,9 @@ class IssuingTransactionDispute(AirwallexAPIBase[TransactionDispute]):
         """
         url = f"{self.base_path}/create"
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("POST", url, json=dispute.to_api_dict())
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use create_dispute_async for async clients")
     
@@ -48,9 +48,9 @@ class IssuingTransactionDispute(AirwallexAPIBase[TransactionDispute]):
         """
         url = f"{self.base_path}/create"
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("POST", url, json=dispute.to_api_dict())
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use create_dispute for sync clients")
     
@@ -67,9 +67,9 @@ class IssuingTransactionDispute(AirwallexAPIBase[TransactionDispute]):
         """
         url = f"{self._build_url(dispute_id)}/update"
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("POST", url, json=update_data.to_api_dict())
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use update_dispute_async for async clients")
     
@@ -86,9 +86,9 @@ class IssuingTransactionDispute(AirwallexAPIBase[TransactionDispute]):
         """
         url = f"{self._build_url(dispute_id)}/update"
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("POST", url, json=update_data.to_api_dict())
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use update_dispute for sync clients")
     
@@ -104,9 +104,9 @@ class IssuingTransactionDispute(AirwallexAPIBase[TransactionDispute]):
         """
         url = f"{self._build_url(dispute_id)}/submit"
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("POST", url)
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use submit_dispute_async for async clients")
     
@@ -122,9 +122,9 @@ class IssuingTransactionDispute(AirwallexAPIBase[TransactionDispute]):
         """
         url = f"{self._build_url(dispute_id)}/submit"
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("POST", url)
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use submit_dispute for sync clients")
     
@@ -140,9 +140,9 @@ class IssuingTransactionDispute(AirwallexAPIBase[TransactionDispute]):
         """
         url = f"{self._build_url(dispute_id)}/cancel"
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("POST", url)
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use cancel_dispute_async for async clients")
     
@@ -158,9 +158,9 @@ class IssuingTransactionDispute(AirwallexAPIBase[TransactionDispute]):
         """
         url = f"{self._build_url(dispute_id)}/cancel"
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("POST", url)
-            return self.model_class.from_api_response(response.json())
+            return self._build_item(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use cancel_dispute for sync clients")
     
@@ -244,10 +244,10 @@ class IssuingTransactionDispute(AirwallexAPIBase[TransactionDispute]):
         if updated_by:
             params["updated_by"] = updated_by
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("GET", self._build_url(), params=params)
-            data = response.json()
-            return [self.model_class.from_api_response(item) for item in data.get("items", [])]
+            data = self.client.json_codec.decode(response)
+            return [self._build_item(item) for item in data.get("items", [])]
         else:
             raise ValueError("Use list_with_filters_async for async clients")
     
@@ -331,9 +331,9 @@ class IssuingTransactionDispute(AirwallexAPIBase[TransactionDispute]):
         if updated_by:
             params["updated_by"] = updated_by
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("GET", self._build_url(), params=params)
-            data = response.json()
-            return [self.model_class.from_api_response(item) for item in data.get("items", [])]
+            data = self.client.json_codec.decode(response)
+            return [self._build_item(item) for item in data.get("items", [])]
         else:
             raise ValueError("Use list_with_filters for sync clients")
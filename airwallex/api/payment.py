@@ -114,9 +114,9 @@ class Payment(AirwallexAPIBase[Payment]):
             "source_type": source_type
         }
         
-        if not self.client.__class__.__name__.startswith('Async'):
+        if not self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = self.client._request("POST", url, json=payload)
-            return PaymentQuote.from_api_response(response.json())
+            return PaymentQuote.from_api_response(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use get_quote_async for async clients")
     
@@ -141,8 +141,8 @@ class Payment(AirwallexAPIBase[Payment]):
             "source_type": source_type
         }
         
-        if self.client.__class__.__name__.startswith('Async'):
+        if self.client.__class__.__name__.startswith('AirwallexAsync'):
             response = await self.client._request("POST", url, json=payload)
-            return PaymentQuote.from_api_response(response.json())
+            return PaymentQuote.from_api_response(self.client.json_codec.decode(response))
         else:
             raise ValueError("Use get_quote for sync clients")
@@ -0,0 +1,191 @@
+"""
+Checkpoint stores for resumable pagination.
+
+A long ``paginate()`` run that dies part-way would otherwise restart from the
+first page. With a checkpoint store the paginator records its position - page
+and offset within the page - together with the listing and filters it belongs
+to, and a later run with the same listing and filters continues from there.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+class CheckpointStore:
+    """
+    Interface for checkpoint stores.
+
+    Checkpoints are JSON-serialisable dicts keyed by an opaque string, by
+    default derived from the listing endpoint and its filters.
+    """
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the checkpoint saved under ``key``, if any."""
+        raise NotImplementedError
+
+    def save(self, key: str, state: Dict[str, Any]) -> None:
+        """Save a checkpoint under ``key``, replacing any previous one."""
+        raise NotImplementedError
+
+    def clear(self, key: str) -> None:
+        """Delete the checkpoint saved under ``key``."""
+        raise NotImplementedError
+
+
+class JSONFileCheckpointStore(CheckpointStore):
+    """
+    Keep checkpoints in a JSON file, replaced atomically on every save.
+
+    Args:
+        path: Location of the checkpoint file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _write(self, data: Dict[str, Dict[str, Any]]) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".airwallex-checkpoint-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._read().get(key)
+
+    def save(self, key: str, state: Dict[str, Any]) -> None:
+        with self._lock:
+            data = self._read()
+            data[key] = state
+            self._write(data)
+
+    def clear(self, key: str) -> None:
+        with self._lock:
+            data = self._read()
+            if data.pop(key, None) is not None:
+                self._write(data)
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """
+    Keep checkpoints in a SQLite database, one row per key.
+
+    Args:
+        path: Location of the database file (created if missing).
+        table: Name of the table holding checkpoints.
+    """
+
+    def __init__(self, path: str, table: str = "airwallex_checkpoints") -> None:
+        if not table.isidentifier():
+            raise ValueError("table must be a valid identifier")
+        self.path = path
+        self.table = table
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} "
+                "(key TEXT PRIMARY KEY, state TEXT NOT NULL, updated_at REAL NOT NULL)"
+            )
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(f"SELECT state FROM {self.table} WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save(self, key: str, state: Dict[str, Any]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, state, updated_at) VALUES (?, ?, ?)",
+                (key, json.dumps(state), time.time())
+            )
+
+    def clear(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+class PaginationCheckpoint:
+    """
+    Tracks a paginator's position and persists it to a checkpoint store.
+
+    The position is the next page to fetch and how many items of it have
+    already been consumed. It is saved whenever an item has been consumed and
+    when the paginator is closed, and cleared once the listing is exhausted.
+
+    Args:
+        store: Where checkpoints are kept.
+        endpoint: URL of the listing.
+        params: Filters of the listing, excluding the page number.
+        key: Checkpoint key; defaults to a hash of ``endpoint`` and ``params``.
+    """
+
+    def __init__(
+        self,
+        store: CheckpointStore,
+        endpoint: str,
+        params: Dict[str, Any],
+        key: Optional[str] = None
+    ) -> None:
+        self.store = store
+        self.endpoint = endpoint
+        self.filters = {name: value for name, value in params.items() if name != "page_num"}
+        # Values such as datetimes are compared and stored in their query string form
+        self.filters = json.loads(json.dumps(self.filters, sort_keys=True, default=str))
+        self.key = key or hashlib.sha256(
+            json.dumps([endpoint, self.filters], sort_keys=True).encode()
+        ).hexdigest()
+        self.page_num: Optional[int] = None
+        self.offset = 0
+
+    def resume(self, first_page_num: int) -> Tuple[int, int]:
+        """Return the ``(page_num, offset)`` to start from."""
+        state = self.store.load(self.key)
+        if state is None:
+            self.page_num, self.offset = first_page_num, 0
+        elif state["endpoint"] != self.endpoint or state["filters"] != self.filters:
+            raise ValueError(
+                f"Checkpoint '{self.key}' belongs to a different listing or filter set"
+            )
+        else:
+            self.page_num, self.offset = state["page_num"], state["offset"]
+        return self.page_num, self.offset
+
+    def advance(self, page_num: int, offset: int) -> None:
+        """Record that ``offset`` items of ``page_num`` have been consumed."""
+        self.page_num, self.offset = page_num, offset
+
+    def save(self) -> None:
+        """Persist the current position."""
+        self.store.save(self.key, {
+            "endpoint": self.endpoint,
+            "filters": self.filters,
+            "page_num": self.page_num,
+            "offset": self.offset,
+        })
+
+    def complete(self) -> None:
+        """Forget the checkpoint once the listing has been read to the end."""
+        self.store.clear(self.key)
@@ -0,0 +1,162 @@
+"""
+Circuit breakers for the Airwallex API clients.
+
+When one API surface keeps failing, callers would otherwise each spend their
+full retry allowance on it before giving up. A circuit breaker tracks failures
+per endpoint family and, once they pass a threshold, "opens": requests to that
+family fail immediately with ``CircuitOpenError``. After a cool-down it lets a
+limited number of probe requests through ("half-open"), closing again if they
+succeed and re-opening if they fail.
+"""
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from .exceptions import CircuitOpenError
+from .utils import endpoint_family
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """
+    Breaker for a single endpoint family.
+    
+    Args:
+        failure_threshold: Consecutive failures that open the circuit.
+        recovery_timeout: Seconds the circuit stays open before probing.
+        half_open_max_calls: Probe requests allowed in flight while half-open.
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+        
+        # Counters for dashboards
+        self.times_opened = 0
+        self.rejected = 0
+    
+    @property
+    def state(self) -> str:
+        """Current state: "closed", "open" or "half_open"."""
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+    
+    def retry_in(self) -> float:
+        """Seconds until an open circuit will allow a probe."""
+        if self._state != self.OPEN:
+            return 0.0
+        return max(self._opened_at + self.recovery_timeout - time.monotonic(), 0.0)
+    
+    def _maybe_half_open(self) -> None:
+        if self._state == self.OPEN and self.retry_in() == 0:
+            self._state = self.HALF_OPEN
+            self._probes = 0
+    
+    def allow(self) -> bool:
+        """Whether a request may be sent now. Claims a probe slot when half-open."""
+        with self._lock:
+            self._maybe_half_open()
+            if self._state == self.CLOSED:
+                return True
+            if self._state == self.HALF_OPEN and self._probes < self.half_open_max_calls:
+                self._probes += 1
+                return True
+            self.rejected += 1
+            return False
+    
+    def record_success(self) -> None:
+        """Record a request that reached a healthy endpoint."""
+        with self._lock:
+            if self._state == self.HALF_OPEN:
+                logger.info("Circuit breaker closed after a successful probe")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probes = 0
+    
+    def record_failure(self) -> None:
+        """Record a server error or transport failure."""
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self.times_opened += 1
+                    logger.warning(f"Circuit breaker opened after {self._failures} failure(s)")
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+    
+    def release(self) -> None:
+        """Give back a probe slot for a request that ended without a verdict."""
+        with self._lock:
+            if self._state == self.HALF_OPEN and self._probes:
+                self._probes -= 1
+
+
+class CircuitBreakerRegistry:
+    """
+    One circuit breaker per endpoint family, shared by all API wrappers on a client.
+    
+    Args:
+        key_func: Maps a request URL to its breaker key. Defaults to the endpoint
+            family, e.g. "issuing/authorizations" or "payments".
+        **breaker_options: Passed to each ``CircuitBreaker``.
+    """
+    
+    def __init__(self, key_func: Optional[Callable[[str], str]] = None, **breaker_options) -> None:
+        self.key_func = key_func or endpoint_family
+        self.breaker_options = breaker_options
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+    
+    def breaker_for(self, url: str) -> CircuitBreaker:
+        """Return the breaker governing requests to ``url``."""
+        key = self.key_func(url)
+        with self._lock:
+            if key not in self._breakers:
+                self._breakers[key] = CircuitBreaker(**self.breaker_options)
+            return self._breakers[key]
+    
+    def check(self, url: str) -> CircuitBreaker:
+        """Return the breaker for ``url``, raising CircuitOpenError if it rejects the request."""
+        breaker = self.breaker_for(url)
+        if not breaker.allow():
+            raise CircuitOpenError(self.key_func(url), breaker.retry_in())
+        return breaker
+    
+    def states(self) -> Dict[str, str]:
+        """Current state of every breaker, keyed by endpoint family."""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {key: breaker.state for key, breaker in breakers.items()}
+    
+    def stats(self) -> Dict[str, Dict[str, object]]:
+        """State and counters of every breaker, for dashboards."""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {
+            key: {
+                "state": breaker.state,
+                "times_opened": breaker.times_opened,
+                "rejected": breaker.rejected,
+                "retry_in": breaker.retry_in(),
+            }
+            for key, breaker in breakers.items()
+        }
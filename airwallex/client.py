@@ -2,16 +2,31 @@
 Client for interacting with the Airwallex API.
 """
 import asyncio
+import hashlib
 import logging
+import threading
 import time
 import httpx
 import json
 from datetime import datetime, timedelta, timezone, date
-from typing import Any, Dict, List, Optional, Union, Type, TypeVar, cast
+from typing import Any, Dict, List, Optional, Set, Union, Type, TypeVar, cast
 from importlib import import_module
 
-from .utils import snake_to_pascal_case
+from .utils import snake_to_pascal_case, endpoint_family
 from .exceptions import create_exception_from_response, AuthenticationError
+from .token_store import TokenStore
+from .rate_limit import RateLimiter
+from .concurrency import AdaptiveConcurrencyLimiter
+from .circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+from .hedging import HedgingPolicy
+from .codec import JSONCodec, get_codec
+from .retry import (
+    RetryPolicy,
+    RetryBudget,
+    ExponentialBackoff,
+    parse_retry_after,
+    is_retryable_transport_error,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +35,17 @@ DEFAULT_AUTH_URL = 'https://api.airwallex.com/api/v1/authentication/login'
 
 T = TypeVar("T")
 
+# Seconds to wait before retrying a failed background token renewal
+TOKEN_RENEWAL_RETRY_DELAY = 5
+
+# Seconds between attempts to take a busy token store lock from async code
+TOKEN_STORE_POLL_INTERVAL = 0.05
+
+
+def _now_like(reference: datetime) -> datetime:
+    """Current time, naive or aware to match ``reference`` so the two compare."""
+    return datetime.now(reference.tzinfo) if reference.tzinfo else datetime.now()
+
 
 class AirwallexClient:
     """
@@ -36,7 +62,20 @@ class AirwallexClient:
         base_url: str = DEFAULT_BASE_URL,
         auth_url: str = DEFAULT_AUTH_URL,
         request_timeout: int = 60,
-        on_behalf_of: Optional[str] = None
+        on_behalf_of: Optional[str] = None,
+        background_token_refresh: bool = False,
+        token_refresh_skew: float = 60,
+        token_store: Optional[TokenStore] = None,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+        http2: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        circuit_breaker: Optional[CircuitBreakerRegistry] = None,
+        trusted_decode: bool = False,
+        json_codec: Optional[Union[str, JSONCodec]] = None
     ):
         if not client_id or not api_key:
             raise ValueError("Client ID and API key are required")
@@ -48,19 +87,69 @@ class AirwallexClient:
         self.request_timeout = request_timeout
         self.on_behalf_of = on_behalf_of
         
+        # Renew the token this many seconds before it expires, in the background,
+        # so that token rollover never blocks a request
+        self.background_token_refresh = background_token_refresh
+        self.token_refresh_skew = token_refresh_skew
+        
+        # Optional store shared with other clients/processes using the same credentials
+        self.token_store = token_store
+        self._token_store_key = hashlib.sha256(f"{client_id}:{auth_url}".encode()).hexdigest()
+        
         # Authentication state
         self._token: Optional[str] = None
         self._token_expiry: Optional[datetime] = None
+        self._token_renew_at: Optional[datetime] = None
+        self._renewal_timer: Optional[threading.Timer] = None
         
-        # Create persistent httpx client
-        self._client = httpx.Client(
-            base_url=self.base_url,
-            timeout=self.request_timeout,
+        # Serialises logins so concurrent callers share a single refresh
+        self._auth_lock = threading.Lock()
+        
+        # Connection pool settings. HTTP/2 multiplexes concurrent requests over
+        # one connection and needs the optional `h2` package (httpx[http2]).
+        # httpcore scans the whole pool on every request, so a large
+        # max_keepalive_connections costs CPU per request; raise
+        # max_connections for concurrency instead.
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
         )
+        self.http2 = http2
+        
+        # Optional client-side throttle applied before every request is sent
+        self.rate_limiter = rate_limiter
+        
+        # Backoff between retries, and a cap on retries relative to live traffic
+        self.retry_policy = retry_policy or ExponentialBackoff()
+        self.retry_budget = retry_budget or RetryBudget()
+        
+        # Optional per-endpoint breakers that fail fast while an endpoint is down
+        self.circuit_breaker = circuit_breaker
+        
+        # Build response models without validation (model_construct), for
+        # read-heavy workloads that trust the API's data
+        self.trusted_decode = trusted_decode
+        
+        # Encodes request payloads and decodes responses: the standard library
+        # by default, or "orjson"/"ujson"/"auto" when the packages are installed
+        self.json_codec = get_codec(json_codec)
+        
+        # Create persistent httpx client
+        self._client = httpx.Client(**self._http_client_options())
         
         # Cache for API instances
         self._api_instances: Dict[str, Any] = {}
     
+    def _http_client_options(self) -> Dict[str, Any]:
+        """Keyword arguments for the underlying httpx client."""
+        return {
+            "base_url": self.base_url,
+            "timeout": self.request_timeout,
+            "limits": self.limits,
+            "http2": self.http2,
+        }
+    
     @property
     def headers(self) -> Dict[str, str]:
         """Default headers to use for all requests."""
@@ -111,112 +200,340 @@ class AirwallexClient:
         kwargs['params'] = self._prepare_params(params)
         return kwargs
     
+    def _token_is_valid(self) -> bool:
+        """Return True if the current access token has not yet expired."""
+        if not self._token or not self._token_expiry:
+            return False
+        # Compare like with like: expires_at may or may not carry a timezone
+        return _now_like(self._token_expiry) < self._token_expiry
+    
+    def _seconds_until_renewal(self) -> float:
+        """Seconds until the background renewal for the current token is due."""
+        if not self._token_renew_at:
+            return 0.0
+        return max((self._token_renew_at - _now_like(self._token_renew_at)).total_seconds(), 0.0)
+    
+    def _auth_headers(self) -> Dict[str, str]:
+        """Headers for the login request."""
+        # Airwallex requires x-client-id and x-api-key in the headers, not in the body
+        return {
+            "Content-Type": "application/json",
+            "x-client-id": self.client_id,
+            "x-api-key": self.api_key
+        }
+    
+    def _handle_auth_response(self, response: httpx.Response) -> None:
+        """Validate a login response and store the returned token."""
+        if response.status_code != 201:  # Airwallex returns 201 for successful auth
+            raise AuthenticationError(
+                status_code=response.status_code,
+                response=response,
+                method="POST",
+                url=self.auth_url,
+                kwargs={"headers": {"x-client-id": self.client_id, "x-api-key": "**redacted**"}},
+                message="Authentication failed",
+                codec=self.json_codec
+            )
+            
+        auth_data = self.json_codec.decode(response)
+        
+        # Set token expiry based on expires_at if provided, or default to 30 minutes
+        if "expires_at" in auth_data:
+            # Parse ISO8601 format date
+            expiry = datetime.fromisoformat(auth_data["expires_at"].replace("Z", "+00:00"))
+        else:
+            # Default to 30 minutes if no expires_at provided
+            expiry = datetime.now(timezone.utc) + timedelta(minutes=30)
+        self._set_token(auth_data.get("token"), expiry)
+        
+        if self.token_store is not None:
+            self.token_store.save(self._token_store_key, self._token, self._token_expiry)
+        
+        logger.debug("Successfully authenticated with Airwallex API")
+    
+    def _set_token(self, token: Optional[str], expiry: datetime) -> None:
+        """Install a new access token and work out when to renew it."""
+        self._token = token
+        self._token_expiry = expiry
+        
+        # Renew `token_refresh_skew` seconds ahead of expiry, but never spend less
+        # than half the token's lifetime on it so short-lived tokens don't spin
+        lifetime = (expiry - _now_like(expiry)).total_seconds()
+        renew_in = max(lifetime - self.token_refresh_skew, lifetime / 2, 0.0)
+        self._token_renew_at = _now_like(expiry) + timedelta(seconds=renew_in)
+    
+    def _adopt_shared_token(self, stale_token: Optional[str] = None) -> bool:
+        """
+        Take over a token another client saved to the token store.
+        
+        Returns False if the store has nothing usable: no entry, an expired
+        entry, or the same ``stale_token`` this client is trying to replace.
+        """
+        entry = self.token_store.load(self._token_store_key)
+        if not entry:
+            return False
+        token, expiry = entry
+        if token == stale_token or _now_like(expiry) >= expiry:
+            return False
+        self._set_token(token, expiry)
+        logger.debug("Reusing access token from the shared token store")
+        return True
+    
+    def _login(self) -> None:
+        """Perform the login request. Callers must hold ``_auth_lock``."""
+        # auth_url is absolute, so it bypasses base_url while still reusing the
+        # pooled keep-alive connections instead of a fresh TCP/TLS handshake
+        response = self._client.post(self.auth_url, headers=self._auth_headers())
+        self._handle_auth_response(response)
+    
+    def _obtain_token(self, stale_token: Optional[str] = None) -> None:
+        """
+        Get a fresh token, from the shared token store or by logging in.
+        
+        Callers must hold ``_auth_lock``. With a token store, the login happens
+        under the store's lock so that clients sharing it log in only once.
+        """
+        if self.token_store is None:
+            self._login()
+        elif not self._adopt_shared_token(stale_token):
+            with self.token_store.lock(self._token_store_key):
+                # Another client may have logged in while we waited for the lock
+                if not self._adopt_shared_token(stale_token):
+                    self._login()
+        
+        if self.background_token_refresh:
+            self._schedule_token_renewal(self._seconds_until_renewal())
+    
+    def _schedule_token_renewal(self, delay: float) -> None:
+        """(Re)arm the timer thread that renews the token in the background."""
+        if self._renewal_timer:
+            self._renewal_timer.cancel()
+        self._renewal_timer = threading.Timer(delay, self._renew_token)
+        self._renewal_timer.daemon = True
+        self._renewal_timer.start()
+    
+    def _renew_token(self) -> None:
+        """
+        Log in again ahead of expiry without invalidating the current token.
+        
+        Requests keep using the old token until the new one is stored. If the
+        renewal fails it is retried shortly while the old token remains valid;
+        after that, requests fall back to refreshing on demand.
+        """
+        try:
+            with self._auth_lock:
+                if self._seconds_until_renewal() > 0:
+                    # Someone else already renewed the token
+                    self._schedule_token_renewal(self._seconds_until_renewal())
+                    return
+                self._obtain_token(stale_token=self._token)
+        except Exception:
+            logger.warning("Background token renewal failed", exc_info=True)
+            if self._token_is_valid():
+                self._schedule_token_renewal(TOKEN_RENEWAL_RETRY_DELAY)
+    
     def authenticate(self) -> None:
         """
         Authenticate with the Airwallex API and get an access token.
         
         Airwallex auth requires sending the API key and client ID in headers
-        and returns a token valid for 30 minutes.
+        and returns a token valid for 30 minutes. Concurrent callers share a
+        single login: whoever takes the lock first refreshes the token and
+        everyone else reuses it.
         """
         # Return early if we already have a valid token
-        if self._token and self._token_expiry and datetime.now(timezone.utc) < self._token_expiry:
+        if self._token_is_valid():
             return
         
-        # Use a separate client for authentication to avoid base_url issues
-        auth_client = httpx.Client(timeout=self.request_timeout)
-        try:
-            # Airwallex requires x-client-id and x-api-key in the headers, not in the body
-            response = auth_client.post(
-                self.auth_url,
-                headers={
-                    "Content-Type": "application/json",
-                    "x-client-id": self.client_id,
-                    "x-api-key": self.api_key
-                }
-            )
-            
-            if response.status_code != 201:  # Airwallex returns 201 for successful auth
-                raise AuthenticationError(
-                    status_code=response.status_code,
-                    response=response,
-                    method="POST",
-                    url=self.auth_url,
-                    kwargs={"headers": {"x-client-id": self.client_id, "x-api-key": "**redacted**"}},
-                    message="Authentication failed"
-                )
-                
-            auth_data = response.json()
-            self._token = auth_data.get("token")
-            
-            # Set token expiry based on expires_at if provided, or default to 30 minutes
-            if "expires_at" in auth_data:
-                # Parse ISO8601 format date
-                self._token_expiry = datetime.fromisoformat(auth_data["expires_at"].replace("Z", "+00:00"))
+        with self._auth_lock:
+            # Another thread may have refreshed the token while we waited
+            if self._token_is_valid():
+                return
+            self._obtain_token()
+    
+    def _refresh_token(self, stale_token: Optional[str]) -> None:
+        """
+        Replace a token the API has rejected.
+        
+        Only the first caller holding ``stale_token`` performs a login; callers
+        that arrive after the token has already been replaced reuse the new one.
+        """
+        with self._auth_lock:
+            if self._token and self._token != stale_token and self._token_is_valid():
+                return
+            self._token = None
+            self._token_expiry = None
+            self._obtain_token(stale_token=stale_token)
+    
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> Optional[float]:
+        """
+        Decide whether a failed response should be retried.
+        
+        Rate-limited (429) and server error (5xx) responses are retried while the
+        retry policy allows another attempt and the retry budget has room.
+        
+        Args:
+            response: The failed response.
+            attempt: Number of retries already made for this request.
+        
+        Returns:
+            Seconds to wait before retrying, or None to give up.
+        """
+        if response.status_code != 429 and response.status_code < 500:
+            return None
+        return self._next_retry_delay(attempt, parse_retry_after(response.headers.get('Retry-After')))
+    
+    def _transport_retry_delay(
+        self, exc: httpx.TransportError, method: str, kwargs: Dict[str, Any], attempt: int
+    ) -> Optional[float]:
+        """
+        Decide whether a request that failed without a response should be retried.
+        
+        Connection failures are always retried. Failures after the request may
+        have reached the server (timeouts, resets, a keep-alive connection closed
+        under us) are only retried for idempotent requests: GET and friends, and
+        POSTs carrying a ``request_id`` idempotency key.
+        
+        Returns:
+            Seconds to wait before retrying, or None to give up.
+        """
+        if not is_retryable_transport_error(exc, method, kwargs.get('json')):
+            return None
+        return self._next_retry_delay(attempt)
+    
+    def _next_retry_delay(self, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """Backoff before the next retry, or None if the policy or budget forbids it."""
+        if attempt >= self.retry_policy.max_retries:
+            return None
+        if not self.retry_budget.withdraw():
+            logger.warning("Retry budget exhausted, not retrying")
+            return None
+        return self.retry_policy.delay(attempt + 1, retry_after)
+    
+    @staticmethod
+    def _record_breaker_outcome(
+        breaker: Optional[CircuitBreaker],
+        response: Optional[httpx.Response] = None,
+        exc: Optional[BaseException] = None
+    ) -> None:
+        """Report the outcome of one attempt to its circuit breaker."""
+        if breaker is None:
+            return
+        if exc is not None:
+            if isinstance(exc, httpx.TransportError):
+                breaker.record_failure()
             else:
-                # Default to 30 minutes if no expires_at provided
-                self._token_expiry = datetime.now(timezone.utc) + timedelta(minutes=30)
-            
-            logger.debug("Successfully authenticated with Airwallex API")
-                
-        finally:
-            auth_client.close()
+                breaker.release()
+        elif response.status_code >= 500:
+            breaker.record_failure()
+        elif response.status_code == 429:
+            # Throttling says nothing about the endpoint's health
+            breaker.release()
+        else:
+            breaker.record_success()
+    
+    @property
+    def circuit_states(self) -> Dict[str, str]:
+        """State of each endpoint family's circuit breaker, e.g. for dashboards."""
+        return self.circuit_breaker.states() if self.circuit_breaker else {}
+    
+    def _encode_body(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace a ``json`` payload by its encoding with the client's codec."""
+        if kwargs.get("json") is None:
+            return kwargs
+        options = {key: value for key, value in kwargs.items() if key != "json"}
+        options["content"] = self.json_codec.dumps(kwargs["json"])
+        return options
     
-    def _request(self, method: str, url: str, **kwargs) -> Optional[httpx.Response]:
+    def _http_request(self, method: str, url: str, kwargs: Dict[str, Any]) -> httpx.Response:
+        """Issue one HTTP request, leaving the body unread if ``stream`` is set."""
+        options = self._encode_body(kwargs)
+        if options.get("stream"):
+            options = {key: value for key, value in options.items() if key != "stream"}
+            return self._client.send(self._client.build_request(method, url, **options), stream=True)
+        return self._client.request(method, url, **options)
+    
+    def _send(self, method: str, url: str, kwargs: Dict[str, Any]) -> httpx.Response:
+        """Send a single attempt of a request through the client-side admission controls."""
+        breaker = self.circuit_breaker.check(url) if self.circuit_breaker else None
+        try:
+            if self.rate_limiter:
+                self.rate_limiter.acquire(url)
+            response = self._http_request(method, url, kwargs)
+        except BaseException as exc:
+            self._record_breaker_outcome(breaker, exc=exc)
+            raise
+        self._record_breaker_outcome(breaker, response=response)
+        return response
+    
+    def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
         """
         Make a synchronous HTTP request with automatic authentication.
         
         Args:
             method: HTTP method (GET, POST, PUT, DELETE, etc.)
             url: API endpoint URL (relative to base_url)
-            **kwargs: Additional arguments to pass to httpx.request()
+            **kwargs: Additional arguments to pass to httpx.request(). With
+                ``stream=True`` a successful response is returned with its body
+                unread, and the caller must close it.
             
         Returns:
             httpx.Response: The HTTP response
             
         Raises:
             AirwallexAPIError: For API errors
+            CircuitOpenError: If the endpoint's circuit breaker is open
         """
         # Ensure we're authenticated before making a request
         self.authenticate()
         
-        retries = 5
         kwargs = self._prepare_request(**kwargs)
+        sent_token = self._token
+        token_refreshed = False
+        attempt = 0
+        self.retry_budget.deposit()
         
-        while retries > 0:
-            response = self._client.request(method, url, **kwargs)
+        while True:
+            try:
+                response = self._send(method, url, kwargs)
+            except httpx.TransportError as exc:
+                delay = self._transport_retry_delay(exc, method, kwargs, attempt)
+                if delay is None:
+                    raise
+                attempt += 1
+                logger.warning(
+                    f"{exc.__class__.__name__} for {method} {url}, "
+                    f"retry {attempt}/{self.retry_policy.max_retries} in {delay:.2f}s"
+                )
+                time.sleep(delay)
+                continue
             
             # Handle successful responses
             if 200 <= response.status_code < 300:
                 return response
+            
+            # A streamed error response is small; read it so it can be inspected and released
+            if kwargs.get("stream"):
+                response.read()
                 
             # Handle authentication errors
-            if response.status_code == 401:
-                # Token might be expired, force refresh and retry
-                self._token = None
-                self._token_expiry = None
-                self.authenticate()
+            if response.status_code == 401 and not token_refreshed:
+                # Token might be expired, force refresh and retry once
+                self._refresh_token(stale_token=sent_token)
+                sent_token = self._token
+                token_refreshed = True
                 kwargs['headers'].update({"Authorization": f"Bearer {self._token}"})
-                retries -= 1
                 continue
-                
-            # Handle rate limiting
-            if response.status_code == 429:
-                retry_after = response.headers.get('Retry-After')
-                if retry_after and retry_after.isdigit():
-                    wait_time = int(retry_after)
-                    logger.info(f"Rate limited, sleeping for {wait_time} seconds")
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    # Default backoff: 1 second
-                    time.sleep(1)
-                    continue
             
-            # Retry on server errors (HTTP 5xx)
-            if response.status_code >= 500 and retries > 0:
-                retries -= 1
-                logger.warning(f"Server error ({response.status_code}), retrying {retries} more time(s)...")
-                time.sleep(1)
+            # Back off and retry rate limiting (429) and server errors (5xx)
+            delay = self._retry_delay(response, attempt)
+            if delay is not None:
+                attempt += 1
+                logger.warning(
+                    f"HTTP {response.status_code} for {method} {url}, "
+                    f"retry {attempt}/{self.retry_policy.max_retries} in {delay:.2f}s"
+                )
+                time.sleep(delay)
                 continue
                 
             # Create and raise the appropriate exception based on the response
@@ -224,7 +541,8 @@ class AirwallexClient:
                 response=response,
                 method=method,
                 url=url,
-                kwargs=kwargs
+                kwargs=kwargs,
+                codec=self.json_codec
             )
                 
     def __getattr__(self, item: str) -> Any:
@@ -251,6 +569,8 @@ class AirwallexClient:
 
     def close(self) -> None:
         """Close the HTTP client."""
+        if self._renewal_timer:
+            self._renewal_timer.cancel()
         self._client.close()
         
     def __enter__(self) -> "AirwallexClient":
@@ -264,60 +584,212 @@ class AirwallexAsyncClient(AirwallexClient):
     """
     Asynchronous client for interacting with the Airwallex API.
     """
-    def __init__(self, **kwargs):
+    def __init__(
+        self,
+        *,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        **kwargs
+    ):
         super().__init__(**kwargs)
         
+        # Optional AIMD limit on requests in flight, tuned from 429s and latency
+        self.concurrency_limiter = concurrency_limiter
+        
+        # Optional hedging of slow GETs with a second, identical request
+        self.hedging = hedging
+        
         # Replace the HTTP client with an async one
-        self._client = httpx.AsyncClient(
-            base_url=self.base_url,
-            timeout=self.request_timeout,
-        )
+        self._client.close()
+        self._client = httpx.AsyncClient(**self._http_client_options())
+        
+        # Coroutines waiting on a refresh await the same in-flight login
+        self._auth_lock = asyncio.Lock()
+        self._renewal_task: Optional["asyncio.Task[None]"] = None
+    
+    async def _login(self) -> None:
+        """Perform the login request. Callers must hold ``_auth_lock``."""
+        # auth_url is absolute, so it bypasses base_url while still reusing the
+        # pooled keep-alive connections instead of a fresh TCP/TLS handshake
+        response = await self._client.post(self.auth_url, headers=self._auth_headers())
+        self._handle_auth_response(response)
+    
+    async def _obtain_token(self, stale_token: Optional[str] = None) -> None:
+        """
+        Get a fresh token, from the shared token store or by logging in.
+        
+        Callers must hold ``_auth_lock``. With a token store, the login happens
+        under the store's lock so that clients sharing it log in only once. The
+        store lock is polled rather than waited on so the event loop keeps running.
+        """
+        if self.token_store is None:
+            await self._login()
+        elif not self._adopt_shared_token(stale_token):
+            while not self.token_store.acquire(self._token_store_key, blocking=False):
+                await asyncio.sleep(TOKEN_STORE_POLL_INTERVAL)
+            try:
+                # Another client may have logged in while we waited for the lock
+                if not self._adopt_shared_token(stale_token):
+                    await self._login()
+            finally:
+                self.token_store.release(self._token_store_key)
+        
+        if self.background_token_refresh and (self._renewal_task is None or self._renewal_task.done()):
+            self._renewal_task = asyncio.create_task(self._token_renewal_loop())
+    
+    async def _token_renewal_loop(self) -> None:
+        """
+        Background task that logs in again ahead of expiry.
+        
+        Requests keep using the old token until the new one is stored. If a
+        renewal fails it is retried shortly while the old token remains valid;
+        after that, requests fall back to refreshing on demand.
+        """
+        while True:
+            await asyncio.sleep(self._seconds_until_renewal())
+            try:
+                async with self._auth_lock:
+                    # Skip if someone else already renewed the token
+                    if self._seconds_until_renewal() <= 0:
+                        await self._obtain_token(stale_token=self._token)
+            except Exception:
+                logger.warning("Background token renewal failed", exc_info=True)
+                if not self._token_is_valid():
+                    return
+                await asyncio.sleep(TOKEN_RENEWAL_RETRY_DELAY)
     
     async def authenticate(self) -> None:
         """
         Authenticate with the Airwallex API and get an access token.
         
         Airwallex auth requires sending the API key and client ID in headers
-        and returns a token valid for 30 minutes.
+        and returns a token valid for 30 minutes. When many coroutines find the
+        token expired at once, only one of them logs in; the rest await the
+        same refresh.
         """
         # Return early if we already have a valid token
-        if self._token and self._token_expiry and datetime.now() < self._token_expiry:
+        if self._token_is_valid():
             return
         
-        # Use a separate client for authentication to avoid base_url issues
-        async with httpx.AsyncClient(timeout=self.request_timeout) as auth_client:
-            # Airwallex requires x-client-id and x-api-key in the headers, not in the body
-            response = await auth_client.post(
-                self.auth_url,
-                headers={
-                    "Content-Type": "application/json",
-                    "x-client-id": self.client_id,
-                    "x-api-key": self.api_key
-                }
-            )
-            
-            if response.status_code != 201:  # Airwallex returns 201 for successful auth
-                raise AuthenticationError(
-                    status_code=response.status_code,
-                    response=response,
-                    method="POST",
-                    url=self.auth_url,
-                    kwargs={"headers": {"x-client-id": self.client_id, "x-api-key": "**redacted**"}},
-                    message="Authentication failed"
-                )
-                
-            auth_data = response.json()
-            self._token = auth_data.get("token")
-            
-            # Set token expiry based on expires_at if provided, or default to 30 minutes
-            if "expires_at" in auth_data:
-                # Parse ISO8601 format date
-                self._token_expiry = datetime.fromisoformat(auth_data["expires_at"].replace("Z", "+00:00"))
-            else:
-                # Default to 30 minutes if no expires_at provided
-                self._token_expiry = datetime.now() + timedelta(minutes=30)
+        async with self._auth_lock:
+            # Another coroutine may have refreshed the token while we waited
+            if self._token_is_valid():
+                return
+            await self._obtain_token()
+    
+    async def _refresh_token(self, stale_token: Optional[str]) -> None:
+        """
+        Replace a token the API has rejected.
+        
+        Only the first coroutine holding ``stale_token`` performs a login;
+        coroutines that arrive after the token has already been replaced reuse
+        the new one.
+        """
+        async with self._auth_lock:
+            if self._token and self._token != stale_token and self._token_is_valid():
+                return
+            self._token = None
+            self._token_expiry = None
+            await self._obtain_token(stale_token=stale_token)
+    
+    @property
+    def concurrency_limit(self) -> Optional[int]:
+        """Current adaptive concurrency limit, or None if no limiter is configured."""
+        return self.concurrency_limiter.limit if self.concurrency_limiter else None
+    
+    async def _send(self, method: str, url: str, kwargs: Dict[str, Any]) -> httpx.Response:
+        """Send a single attempt of a request through the client-side admission controls."""
+        breaker = self.circuit_breaker.check(url) if self.circuit_breaker else None
+        try:
+            response = await self._send_admitted(method, url, kwargs)
+        except BaseException as exc:
+            self._record_breaker_outcome(breaker, exc=exc)
+            raise
+        self._record_breaker_outcome(breaker, response=response)
+        return response
+    
+    async def _http_request(self, method: str, url: str, kwargs: Dict[str, Any]) -> httpx.Response:
+        """Issue one HTTP request, leaving the body unread if ``stream`` is set."""
+        options = self._encode_body(kwargs)
+        if options.get("stream"):
+            options = {key: value for key, value in options.items() if key != "stream"}
+            return await self._client.send(self._client.build_request(method, url, **options), stream=True)
+        return await self._client.request(method, url, **options)
+    
+    async def _send_admitted(self, method: str, url: str, kwargs: Dict[str, Any]) -> httpx.Response:
+        """Send once the rate and concurrency limiters admit the request."""
+        if self.rate_limiter:
+            await self.rate_limiter.acquire_async(url)
+        if not self.concurrency_limiter:
+            return await self._http_request(method, url, kwargs)
+        
+        saturated = await self.concurrency_limiter.acquire()
+        start = time.monotonic()
+        status_code: Optional[int] = None
+        retry_after = False
+        try:
+            response = await self._http_request(method, url, kwargs)
+            status_code = response.status_code
+            retry_after = "Retry-After" in response.headers
+            return response
+        finally:
+            self.concurrency_limiter.release(status_code, time.monotonic() - start, retry_after, saturated)
+    
+    async def _send_hedged(self, method: str, url: str, kwargs: Dict[str, Any]) -> httpx.Response:
+        """
+        Send a GET, racing a second copy against it if it is slower than usual.
+        
+        The first attempt to produce a response wins and the other is cancelled.
+        If an attempt fails without a response, the other is still awaited.
+        """
+        policy = self.hedging
+        family = endpoint_family(url)
+        policy.budget.deposit()
+        delay = policy.delay_for(family)
+        
+        async def attempt() -> httpx.Response:
+            start = time.monotonic()
+            try:
+                response = await self._send(method, url, kwargs)
+            except asyncio.CancelledError:
+                # Cut short because the other attempt won: its latency is unknown,
+                # and recording it would pull the percentile, and so the delay, down
+                raise
+            except BaseException:
+                policy.record(family, time.monotonic() - start)
+                raise
+            policy.record(family, time.monotonic() - start)
+            return response
+        
+        primary = asyncio.ensure_future(attempt())
+        done: Set["asyncio.Future[httpx.Response]"] = set()
+        pending = {primary}
+        try:
+            if delay is not None:
+                done, pending = await asyncio.wait(pending, timeout=delay)
+                if not done and policy.try_hedge():
+                    logger.debug(f"Hedging {method} {url} after {delay:.3f}s")
+                    pending.add(asyncio.ensure_future(attempt()))
             
-            logger.debug("Successfully authenticated with Airwallex API")
+            error: Optional[BaseException] = None
+            while True:
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            policy.record_win()
+                        return task.result()
+                    if error is None or task is primary:
+                        error = task.exception()
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            # Every attempt finished without a response; surface the primary's error
+            raise cast(BaseException, error)
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
     
     async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
         """
@@ -326,55 +798,70 @@ class AirwallexAsyncClient(AirwallexClient):
         Args:
             method: HTTP method (GET, POST, PUT, DELETE, etc.)
             url: API endpoint URL (relative to base_url)
-            **kwargs: Additional arguments to pass to httpx.request()
+            **kwargs: Additional arguments to pass to httpx.request(). With
+                ``stream=True`` a successful response is returned with its body
+                unread, and the caller must close it.
             
         Returns:
             httpx.Response: The HTTP response
             
         Raises:
             AirwallexAPIError: For API errors
+            CircuitOpenError: If the endpoint's circuit breaker is open
         """
         # Ensure we're authenticated before making a request
         await self.authenticate()
         
-        retries = 5
         kwargs = self._prepare_request(**kwargs)
+        sent_token = self._token
+        token_refreshed = False
+        attempt = 0
+        self.retry_budget.deposit()
         
-        while retries > 0:
-            response = await self._client.request(method, url, **kwargs)
+        while True:
+            try:
+                if self.hedging and method.upper() == "GET" and not kwargs.get("stream"):
+                    response = await self._send_hedged(method, url, kwargs)
+                else:
+                    response = await self._send(method, url, kwargs)
+            except httpx.TransportError as exc:
+                delay = self._transport_retry_delay(exc, method, kwargs, attempt)
+                if delay is None:
+                    raise
+                attempt += 1
+                logger.warning(
+                    f"{exc.__class__.__name__} for {method} {url}, "
+                    f"retry {attempt}/{self.retry_policy.max_retries} in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
+                continue
             
             # Handle successful responses
             if 200 <= response.status_code < 300:
                 return response
+            
+            # A streamed error response is small; read it so it can be inspected and released
+            if kwargs.get("stream"):
+                await response.aread()
                 
             # Handle authentication errors
-            if response.status_code == 401:
-                # Token might be expired, force refresh and retry
-                self._token = None
-                self._token_expiry = None
-                await self.authenticate()
+            if response.status_code == 401 and not token_refreshed:
+                # Token might be expired, force refresh and retry once
+                await self._refresh_token(stale_token=sent_token)
+                sent_token = self._token
+                token_refreshed = True
                 kwargs['headers'].update({"Authorization": f"Bearer {self._token}"})
-                retries -= 1
                 continue
-                
-            # Handle rate limiting
-            if response.status_code == 429:
-                retry_after = response.headers.get('Retry-After')
-                if retry_after and retry_after.isdigit():
-                    wait_time = int(retry_after)
-                    logger.info(f"Rate limited, sleeping for {wait_time} seconds")
-                    await asyncio.sleep(wait_time)
-                    continue
-                else:
-                    # Default backoff: 1 second
-                    await asyncio.sleep(1)
-                    continue
             
-            # Retry on server errors (HTTP 5xx)
-            if response.status_code >= 500 and retries > 0:
-                retries -= 1
-                logger.warning(f"Server error ({response.status_code}), retrying {retries} more time(s)...")
-                await asyncio.sleep(1)
+            # Back off and retry rate limiting (429) and server errors (5xx)
+            delay = self._retry_delay(response, attempt)
+            if delay is not None:
+                attempt += 1
+                logger.warning(
+                    f"HTTP {response.status_code} for {method} {url}, "
+                    f"retry {attempt}/{self.retry_policy.max_retries} in {delay:.2f}s"
+                )
+                await asyncio.sleep(delay)
                 continue
                 
             # Create and raise the appropriate exception based on the response
@@ -382,11 +869,18 @@ class AirwallexAsyncClient(AirwallexClient):
                 response=response,
                 method=method,
                 url=url,
-                kwargs=kwargs
+                kwargs=kwargs,
+                codec=self.json_codec
             )
     
     async def close(self) -> None:
         """Close the async HTTP client."""
+        if self._renewal_task and not self._renewal_task.done():
+            self._renewal_task.cancel()
+            try:
+                await self._renewal_task
+            except asyncio.CancelledError:
+                pass
         await self._client.aclose()
         
     async def __aenter__(self) -> "AirwallexAsyncClient":
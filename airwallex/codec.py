@@ -0,0 +1,130 @@
+"""
+JSON codecs for request and response bodies.
+
+Clients decode every response and encode every payload with a codec. The
+default uses the standard library; faster backends are used when the optional
+``orjson`` or ``ujson`` packages are installed and selected with the client's
+``json_codec`` option (``"auto"`` picks the fastest one available).
+"""
+import json
+from typing import Any, Dict, Optional, Type, Union
+
+import httpx
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - optional dependency
+    ujson = None
+
+
+class JSONCodec:
+    """
+    Interface for JSON codecs.
+
+    Codecs decode from bytes and encode to UTF-8 bytes, so bodies never make an
+    extra round trip through ``str``.
+    """
+
+    name: str = ""
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Decode a JSON document."""
+        raise NotImplementedError
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as a JSON document."""
+        raise NotImplementedError
+
+    def decode(self, response: httpx.Response) -> Any:
+        """Decode the body of a response."""
+        return self.loads(response.content)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}>"
+
+
+class StdlibJSONCodec(JSONCodec):
+    """The standard library ``json`` module, encoding as httpx does."""
+
+    name = "json"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+    def decode(self, response: httpx.Response) -> Any:
+        # httpx detects the body's encoding from the headers and a BOM
+        return response.json()
+
+
+class OrjsonCodec(JSONCodec):
+    """``orjson``: decodes and encodes natively from and to bytes."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError("OrjsonCodec requires the 'orjson' package: pip install orjson")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+
+class UjsonCodec(JSONCodec):
+    """``ujson``: a C implementation of the standard library interface."""
+
+    name = "ujson"
+
+    def __init__(self) -> None:
+        if ujson is None:
+            raise ImportError("UjsonCodec requires the 'ujson' package: pip install ujson")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return ujson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode("utf-8")
+
+
+CODECS: Dict[str, Type[JSONCodec]] = {
+    StdlibJSONCodec.name: StdlibJSONCodec,
+    OrjsonCodec.name: OrjsonCodec,
+    UjsonCodec.name: UjsonCodec,
+}
+
+
+def get_codec(codec: Optional[Union[str, JSONCodec]] = None) -> JSONCodec:
+    """
+    Resolve a client's ``json_codec`` option.
+
+    Args:
+        codec: A codec instance, a codec name ("json", "orjson" or "ujson"),
+            "auto" for the fastest installed backend, or None for the standard
+            library.
+
+    Returns:
+        JSONCodec: The codec to use.
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec is None:
+        return StdlibJSONCodec()
+    if codec == "auto":
+        if orjson is not None:
+            return OrjsonCodec()
+        if ujson is not None:
+            return UjsonCodec()
+        return StdlibJSONCodec()
+    if codec not in CODECS:
+        raise ValueError(f"Unknown JSON codec '{codec}', expected one of {sorted(CODECS)} or 'auto'")
+    return CODECS[codec]()
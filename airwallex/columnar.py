@@ -0,0 +1,378 @@
+"""
+Columnar decoding of listing pages.
+
+Reporting code that builds DataFrames from model instances pays for a pydantic
+object per row and then copies every field out of it again. ``ColumnarDecoder``
+reads each page of raw items straight into one typed NumPy array per field:
+
+* amounts as float64, or as int64 minor units of their currency
+* timestamps as datetime64[us] in UTC
+* currencies, statuses, types and countries as categoricals (int32 codes into
+  a list of categories shared by every page decoded with the same decoder)
+* fields of nested models flattened into dotted columns (``merchant.name``)
+
+Missing values are NaN, NaT or category code -1; integer and boolean columns
+record them in a mask instead. Pages are concatenated column by column, and
+`ColumnarBatch` converts the result to pandas or Arrow without row objects.
+
+NumPy is an optional dependency (``pip install airwallex-sdk[columnar]``), as
+are pandas and pyarrow for the conversions.
+"""
+import re
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Type, Union, get_args, get_origin
+
+from .models.base import AirwallexModel
+from .sharding import parse_timestamp
+from .utils import is_code_field, snake_to_camel_case
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover - optional dependency
+    pd = None
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+# Digits after the decimal point of currencies whose minor unit is not 1/100 (ISO 4217)
+CURRENCY_EXPONENTS: Dict[str, int] = {
+    **dict.fromkeys(
+        ("BIF", "CLP", "DJF", "GNF", "ISK", "JPY", "KMF", "KRW", "PYG", "RWF", "UGX", "UYI", "VND", "VUV",
+         "XAF", "XOF", "XPF"),
+        0,
+    ),
+    **dict.fromkeys(("BHD", "IQD", "JOD", "KWD", "LYD", "OMR", "TND"), 3),
+}
+DEFAULT_CURRENCY_EXPONENT = 2
+
+# Float fields holding money amounts
+AMOUNT_NAMES = ("amount", "net", "fee")
+
+_UTC_OFFSET = re.compile(r"[+-]\d{2}:?\d{2}$")
+
+FLOAT, MINOR_UNITS, INT, BOOL, DATETIME, CATEGORY, STRING, OBJECT = (
+    "float", "minor_units", "int", "bool", "datetime", "category", "string", "object"
+)
+
+
+def _require(module: Any, package: str, extra: str) -> None:
+    if module is None:
+        raise ImportError(f"This feature requires the '{package}' package: pip install airwallex-sdk[{extra}]")
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _matches(name: str, names: Sequence[str]) -> bool:
+    return any(name == candidate or name.endswith("_" + candidate) for candidate in names)
+
+
+def _utc_iso(value: Any) -> str:
+    """A timestamp as an ISO string in UTC without offset, which NumPy parses natively."""
+    if value is None:
+        return "NaT"
+    if isinstance(value, str):
+        if value.endswith("Z"):
+            return value[:-1]
+        if value.endswith("+00:00"):
+            return value[:-6]
+        if "T" in value and not _UTC_OFFSET.search(value):
+            return value
+    return parse_timestamp(value).astimezone(timezone.utc).replace(tzinfo=None).isoformat()
+
+
+class _Column:
+    """One output column: where its values live in an item and how they are typed."""
+
+    __slots__ = ("name", "path", "kind", "currency")
+
+    def __init__(self, name: str, path: Tuple[Tuple[str, str], ...], kind: str) -> None:
+        self.name = name
+        # (snake_case, camelCase) key at each nesting level
+        self.path = path
+        self.kind = kind
+        # Name of the currency column for minor unit amounts
+        self.currency: Optional[str] = None
+
+    def getter(self) -> Callable[[Dict[str, Any]], Any]:
+        path = self.path
+
+        def get(item: Any) -> Any:
+            for snake, camel in path:
+                if not isinstance(item, dict):
+                    return None
+                value = item.get(snake)
+                item = item.get(camel) if value is None else value
+            return item
+
+        return get
+
+
+class ColumnarBatch:
+    """
+    Typed column arrays decoded from one or more pages of a listing.
+
+    Attributes:
+        columns: NumPy array per column name, all of the same length.
+        categories: Categories of each categorical column; its array holds codes.
+        masks: Boolean arrays, True where a value is missing, for integer and
+            boolean columns that have missing values.
+        kinds: How each column was decoded ("float", "minor_units", "int",
+            "bool", "datetime", "category", "string" or "object").
+    """
+
+    def __init__(
+        self,
+        columns: Dict[str, Any],
+        categories: Optional[Dict[str, List[Any]]] = None,
+        masks: Optional[Dict[str, Any]] = None,
+        length: int = 0,
+        kinds: Optional[Dict[str, str]] = None
+    ) -> None:
+        self.columns = columns
+        self.categories = categories or {}
+        self.masks = masks or {}
+        self.length = length
+        self.kinds = kinds or {}
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __repr__(self) -> str:
+        return f"<ColumnarBatch rows={self.length} columns={len(self.columns)}>"
+
+    def __getitem__(self, name: str) -> Any:
+        return self.columns[name]
+
+    @property
+    def names(self) -> List[str]:
+        """Column names, in model field order."""
+        return list(self.columns)
+
+    @classmethod
+    def concat(cls, batches: Iterable["ColumnarBatch"]) -> "ColumnarBatch":
+        """
+        Concatenate batches column by column.
+
+        The batches must come from the same `ColumnarDecoder`, so that their
+        categorical codes index the same categories.
+        """
+        batches = list(batches)
+        if not batches:
+            return cls({})
+        if len(batches) == 1:
+            return batches[0]
+        first = batches[0]
+        columns = {name: np.concatenate([batch.columns[name] for batch in batches]) for name in first.columns}
+        masks = {}
+        for name in {name for batch in batches for name in batch.masks}:
+            masks[name] = np.concatenate([
+                batch.masks.get(name, np.zeros(batch.length, dtype=bool)) for batch in batches
+            ])
+        # Later pages only ever add categories, so the last batch's list covers every code
+        return cls(
+            columns, dict(batches[-1].categories), masks, sum(batch.length for batch in batches), first.kinds
+        )
+
+    def to_pandas(self) -> "pd.DataFrame":
+        """Convert to a pandas DataFrame with categorical, nullable and UTC datetime columns."""
+        _require(pd, "pandas", "pandas")
+        data = {}
+        for name, values in self.columns.items():
+            if name in self.categories:
+                data[name] = pd.Categorical.from_codes(values, categories=self.categories[name])
+            elif name in self.masks and values.dtype == np.bool_:
+                data[name] = pd.arrays.BooleanArray(values, self.masks[name])
+            elif name in self.masks:
+                data[name] = pd.arrays.IntegerArray(values, self.masks[name])
+            elif values.dtype.kind == "M":
+                data[name] = pd.to_datetime(values, utc=True)
+            else:
+                data[name] = values
+        return pd.DataFrame(data)
+
+    def to_arrow(self) -> "pa.Table":
+        """Convert to a pyarrow Table with dictionary, nullable and UTC timestamp columns."""
+        _require(pa, "pyarrow", "arrow")
+        arrays = {}
+        for name, values in self.columns.items():
+            if name in self.categories:
+                categories = self.categories[name]
+                arrays[name] = pa.DictionaryArray.from_arrays(
+                    pa.array(values, mask=values < 0), pa.array(categories, type=None if categories else pa.string())
+                )
+            elif name in self.masks:
+                arrays[name] = pa.array(values, mask=self.masks[name])
+            elif values.dtype.kind == "M":
+                arrays[name] = pa.array(values, type=pa.timestamp("us", tz="UTC"))
+            elif self.kinds.get(name) == STRING:
+                arrays[name] = pa.array(values.tolist(), type=pa.string())
+            elif values.dtype == object:
+                arrays[name] = pa.array(values.tolist())
+            else:
+                arrays[name] = pa.array(values)
+        return pa.table(arrays)
+
+
+class ColumnarDecoder:
+    """
+    Decodes pages of raw items of one model into column arrays.
+
+    Use one decoder for all pages of a listing so categorical codes agree.
+
+    Args:
+        model_class: Model describing the items.
+        amounts: "float" for float64 amounts, or "minor_units" for int64 amounts
+            in the minor unit of the currency field next to them.
+        categorical: Column names to decode as categoricals, instead of the
+            currency, status, type and country fields.
+    """
+
+    def __init__(
+        self,
+        model_class: Type[AirwallexModel],
+        *,
+        amounts: str = FLOAT,
+        categorical: Optional[Sequence[str]] = None
+    ) -> None:
+        _require(np, "numpy", "columnar")
+        if amounts not in (FLOAT, MINOR_UNITS):
+            raise ValueError("amounts must be 'float' or 'minor_units'")
+        self.model_class = model_class
+        self.amounts = amounts
+        self.columns: List[_Column] = []
+        self._add_columns(model_class, (), categorical)
+        self._getters = [column.getter() for column in self.columns]
+        # Category -> code of each categorical column, growing as pages are decoded
+        self._category_codes: Dict[str, Dict[Any, int]] = {
+            column.name: {} for column in self.columns if column.kind == CATEGORY
+        }
+
+        if amounts == MINOR_UNITS:
+            names = {column.name for column in self.columns}
+            for column in self.columns:
+                if column.kind != FLOAT or not _matches(column.name.rsplit(".", 1)[-1], AMOUNT_NAMES):
+                    continue
+                prefix = column.name[:-len("amount")] if column.name.endswith("amount") else ""
+                currency = next(
+                    (name for name in (prefix + "currency", "currency") if name in names), None
+                )
+                if currency is not None and currency in self._category_codes:
+                    column.kind = MINOR_UNITS
+                    column.currency = currency
+        self._kinds = {column.name: column.kind for column in self.columns}
+
+    def _add_columns(
+        self,
+        model_class: Type[AirwallexModel],
+        parent: Tuple[Tuple[str, str], ...],
+        categorical: Optional[Sequence[str]]
+    ) -> None:
+        for name, field in model_class.model_fields.items():
+            if name == "resource_name":
+                continue
+            path = parent + ((name, snake_to_camel_case(name)),)
+            column_name = ".".join(snake for snake, _ in path)
+            annotation = _unwrap_optional(field.annotation)
+            if isinstance(annotation, type) and issubclass(annotation, AirwallexModel):
+                self._add_columns(annotation, path, categorical)
+                continue
+            if categorical is not None:
+                is_category = column_name in categorical
+            else:
+                is_category = annotation is str and is_code_field(name)
+            if is_category:
+                kind = CATEGORY
+            elif annotation is float:
+                kind = FLOAT
+            elif annotation is bool:
+                kind = BOOL
+            elif annotation is int:
+                kind = INT
+            elif annotation in (datetime, date):
+                kind = DATETIME
+            elif annotation is str:
+                kind = STRING
+            else:
+                kind = OBJECT
+            self.columns.append(_Column(column_name, path, kind))
+
+    def decode(self, items: Sequence[Dict[str, Any]]) -> ColumnarBatch:
+        """Decode one page of raw items."""
+        length = len(items)
+        columns: Dict[str, Any] = {}
+        masks: Dict[str, Any] = {}
+        for column, get in zip(self.columns, self._getters):
+            values = [get(item) for item in items]
+            kind = column.kind
+            if kind in (FLOAT, MINOR_UNITS):
+                columns[column.name] = np.array(
+                    [np.nan if value is None else value for value in values], dtype=np.float64
+                )
+            elif kind in (INT, BOOL):
+                missing = np.fromiter((value is None for value in values), dtype=bool, count=length)
+                filler = False if kind == BOOL else 0
+                columns[column.name] = np.array(
+                    [filler if value is None else value for value in values],
+                    dtype=np.bool_ if kind == BOOL else np.int64
+                )
+                if missing.any():
+                    masks[column.name] = missing
+            elif kind == DATETIME:
+                columns[column.name] = np.array([_utc_iso(value) for value in values], dtype="datetime64[us]")
+            elif kind == STRING:
+                array = np.empty(length, dtype=object)
+                array[:] = [value if value is None or value.__class__ is str else str(value) for value in values]
+                columns[column.name] = array
+            elif kind == CATEGORY:
+                codes = self._category_codes[column.name]
+                columns[column.name] = np.fromiter(
+                    (-1 if value is None else codes.setdefault(value, len(codes)) for value in values),
+                    dtype=np.int32,
+                    count=length
+                )
+            else:
+                array = np.empty(length, dtype=object)
+                array[:] = values
+                columns[column.name] = array
+
+        for column in self.columns:
+            if column.kind == MINOR_UNITS:
+                columns[column.name], missing = self._to_minor_units(
+                    columns[column.name], columns[column.currency], column.currency
+                )
+                if missing.any():
+                    masks[column.name] = missing
+
+        categories = {name: list(codes) for name, codes in self._category_codes.items()}
+        return ColumnarBatch(columns, categories, masks, length, self._kinds)
+
+    def _to_minor_units(self, amounts: Any, currency_codes: Any, currency_column: str) -> Tuple[Any, Any]:
+        categories = list(self._category_codes[currency_column])
+        exponents = np.array(
+            [CURRENCY_EXPONENTS.get(currency, DEFAULT_CURRENCY_EXPONENT) for currency in categories]
+            + [DEFAULT_CURRENCY_EXPONENT],  # code -1: currency missing
+            dtype=np.int64
+        )
+        scale = np.power(10.0, exponents[currency_codes])
+        missing = np.isnan(amounts)
+        minor = np.rint(np.where(missing, 0.0, amounts) * scale).astype(np.int64)
+        return minor, missing
+
+
+def records_to_dataframe(records: List[Dict[str, Any]]) -> "pd.DataFrame":
+    """Flatten raw API records into a pandas DataFrame, nested keys as dotted columns."""
+    _require(pd, "pandas", "pandas")
+    return pd.json_normalize(records)
@@ -0,0 +1,187 @@
+"""
+Adaptive concurrency control for the async client.
+
+``AdaptiveConcurrencyLimiter`` caps the number of requests in flight and tunes
+that cap with AIMD (additive increase, multiplicative decrease): each healthy
+response to a request admitted while the limiter was saturated grows the limit
+by about one request per round-trip, and a 429, a
+``Retry-After`` header or a latency spike cuts it by a constant factor. Bulk
+jobs can then run as fast as the API allows without a hand-tuned limit.
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limiter shared by the coroutines of one event loop.
+    
+    Args:
+        initial_limit: Starting number of concurrent requests.
+        min_limit: The limit never drops below this.
+        max_limit: The limit never grows above this.
+        increase: How much the limit grows per full window of healthy responses.
+        decrease_factor: Multiplier applied to the limit on an overload signal.
+        latency_threshold: Absolute latency (seconds) counted as a spike, if set.
+        latency_tolerance: A response slower than this multiple of the baseline
+            latency counts as a spike.
+    """
+    
+    # Weight of each healthy sample in the baseline latency average
+    BASELINE_WEIGHT = 0.05
+    # Samples needed before relative latency spikes are trusted
+    WARMUP_SAMPLES = 20
+    
+    def __init__(
+        self,
+        *,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        latency_threshold: Optional[float] = None,
+        latency_tolerance: float = 3.0,
+    ) -> None:
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.latency_threshold = latency_threshold
+        self.latency_tolerance = latency_tolerance
+        
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._baseline_latency: Optional[float] = None
+        self._samples = 0
+        self._last_decrease = 0.0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+        
+        # Counters for dashboards
+        self.increases = 0
+        self.decreases = 0
+    
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+    
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently in flight."""
+        return self._in_flight
+    
+    def stats(self) -> Dict[str, float]:
+        """Snapshot of the limiter's state, for metrics."""
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "baseline_latency": self._baseline_latency or 0.0,
+            "increases": self.increases,
+            "decreases": self.decreases,
+        }
+    
+    async def acquire(self) -> bool:
+        """
+        Wait for a free slot under the current limit.
+        
+        Returns:
+            Whether the request filled the limit when it was admitted; pass this
+            on to `release`.
+        """
+        while self._in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # Pass on a wake-up we may have consumed
+                self._wake()
+                raise
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self._in_flight += 1
+        return self._in_flight >= self.limit
+    
+    def _wake(self) -> None:
+        """Wake as many waiters as there are free slots."""
+        free = self.limit - self._in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+    
+    def release(
+        self,
+        status_code: Optional[int],
+        latency: float,
+        retry_after: bool = False,
+        saturated: bool = False,
+    ) -> None:
+        """
+        Free a slot and adjust the limit from the outcome of the request.
+        
+        Args:
+            status_code: HTTP status of the response, or None if the request failed
+                without one (the limit is then left unchanged).
+            latency: Seconds the request took.
+            retry_after: Whether the response carried a Retry-After header.
+            saturated: Whether the limit was full when the request was admitted,
+                as returned by `acquire`. Only such requests grow the limit, so a
+                lightly loaded client does not drift up to ``max_limit``.
+        """
+        if status_code == 429 or retry_after or self._is_latency_spike(latency):
+            self._decrease(latency)
+        elif status_code is not None and status_code < 500:
+            self._record_latency(latency)
+            if saturated:
+                self._increase()
+        
+        self._in_flight -= 1
+        self._wake()
+    
+    def _is_latency_spike(self, latency: float) -> bool:
+        if self.latency_threshold is not None and latency > self.latency_threshold:
+            return True
+        return (
+            self._samples >= self.WARMUP_SAMPLES
+            and self._baseline_latency is not None
+            and latency > self._baseline_latency * self.latency_tolerance
+        )
+    
+    def _record_latency(self, latency: float) -> None:
+        self._samples += 1
+        if self._baseline_latency is None:
+            self._baseline_latency = latency
+        else:
+            self._baseline_latency += (latency - self._baseline_latency) * self.BASELINE_WEIGHT
+    
+    def _increase(self) -> None:
+        previous = self.limit
+        # +increase spread over a window of `limit` responses
+        self._limit = min(float(self.max_limit), self._limit + self.increase / self._limit)
+        if self.limit != previous:
+            self.increases += 1
+            logger.debug(f"Concurrency limit raised to {self.limit}")
+    
+    def _decrease(self, latency: float) -> None:
+        # Requests already in flight when we backed off report the same overload;
+        # only react once per round-trip
+        now = time.monotonic()
+        if now - self._last_decrease < max(latency, self._baseline_latency or 0.0):
+            return
+        self._last_decrease = now
+        self._limit = max(float(self.min_limit), self._limit * self.decrease_factor)
+        self.decreases += 1
+        logger.info(f"Concurrency limit cut to {self.limit}")
@@ -1,9 +1,12 @@
 """
 Exceptions for the Airwallex API client.
 """
-from typing import Any, Dict, Optional, Type, ClassVar, Mapping
+from typing import Any, Dict, Optional, Type, ClassVar, Mapping, TYPE_CHECKING
 import httpx
 
+if TYPE_CHECKING:
+    from .codec import JSONCodec
+
 
 class AirwallexAPIError(Exception):
     """Base exception for Airwallex API errors."""
@@ -16,7 +19,8 @@ class AirwallexAPIError(Exception):
         method: str,
         url: str,
         kwargs: Dict[str, Any],
-        message: Optional[str] = None
+        message: Optional[str] = None,
+        codec: Optional["JSONCodec"] = None
     ):
         self.status_code = status_code
         self.response = response
@@ -26,7 +30,7 @@ class AirwallexAPIError(Exception):
         
         # Try to parse error details from the response
         try:
-            error_data = response.json()
+            error_data = codec.decode(response) if codec else response.json()
             self.error_code = error_data.get("code", "unknown")
             self.error_message = error_data.get("message", "Unknown error")
             self.error_source = error_data.get("source", None)
@@ -112,6 +116,22 @@ class ServiceUnavailableError(ServerError):
     pass
 
 
+class CircuitOpenError(Exception):
+    """
+    Raised without calling the API when the circuit breaker for an endpoint is open.
+    
+    The endpoint has been failing recently; requests to it fail fast until the
+    breaker lets a probe through to check whether it has recovered.
+    """
+    
+    def __init__(self, endpoint: str, retry_in: float):
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+        super().__init__(
+            f"Circuit breaker open for '{endpoint}', next probe allowed in {retry_in:.1f}s"
+        )
+
+
 # Mapping of error codes to exception classes
 ERROR_CODE_MAP: Dict[str, Type[AirwallexAPIError]] = {
     # Authentication errors
@@ -163,7 +183,8 @@ def create_exception_from_response(
     method: str,
     url: str,
     kwargs: Dict[str, Any],
-    message: Optional[str] = None
+    message: Optional[str] = None,
+    codec: Optional["JSONCodec"] = None
 ) -> AirwallexAPIError:
     """
     Create the appropriate exception based on the API response.
@@ -178,6 +199,7 @@ def create_exception_from_response(
         url: URL of the request
         kwargs: Additional keyword arguments passed to the request
         message: Optional custom error message
+        codec: JSON codec to parse the body with (default: the standard library)
         
     Returns:
         An instance of the appropriate AirwallexAPIError subclass
@@ -185,7 +207,7 @@ def create_exception_from_response(
     status_code = response.status_code
     
     try:
-        error_data = response.json()
+        error_data = codec.decode(response) if codec else response.json()
         error_code = error_data.get("code")
         
         if error_code and error_code in ERROR_CODE_MAP:
@@ -203,7 +225,8 @@ def create_exception_from_response(
         method=method,
         url=url,
         kwargs=kwargs,
-        message=message
+        message=message,
+        codec=codec
     )
 
 
@@ -0,0 +1,127 @@
+"""
+Hedged requests for the async Airwallex client.
+
+A small fraction of reads take far longer than the rest, and they dominate tail
+latency. Hedging sends a second, identical GET when the first has not answered
+within a high percentile of recent latencies for that endpoint family, uses
+whichever response arrives first and cancels the other. Hedges are drawn from a
+budget proportional to traffic so they cannot double the load on the API.
+"""
+import bisect
+import math
+import threading
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+from .retry import RetryBudget
+
+
+class LatencyWindow:
+    """Sliding window of recent request latencies with percentile lookups."""
+    
+    def __init__(self, size: int = 200) -> None:
+        self._recent: Deque[float] = deque(maxlen=size)
+        self._sorted: List[float] = []
+    
+    def __len__(self) -> int:
+        return len(self._recent)
+    
+    def add(self, latency: float) -> None:
+        """Record one latency, evicting the oldest when the window is full."""
+        if len(self._recent) == self._recent.maxlen:
+            oldest = self._recent[0]
+            del self._sorted[bisect.bisect_left(self._sorted, oldest)]
+        self._recent.append(latency)
+        bisect.insort(self._sorted, latency)
+    
+    def percentile(self, percentile: float) -> Optional[float]:
+        """Latency below which ``percentile`` percent of the window falls."""
+        if not self._sorted:
+            return None
+        index = math.ceil(percentile / 100 * len(self._sorted)) - 1
+        return self._sorted[min(max(index, 0), len(self._sorted) - 1)]
+
+
+class HedgingPolicy:
+    """
+    When and how often to hedge GET requests.
+    
+    Args:
+        percentile: Send a hedge once the request has been outstanding longer than
+            this percentile of recent latencies for its endpoint family.
+        min_delay: Lower bound on the hedge delay, in seconds.
+        max_delay: Optional upper bound on the hedge delay, in seconds.
+        min_samples: Latencies to observe for an endpoint family before hedging it.
+        window: Number of recent latencies kept per endpoint family.
+        budget: Budget hedges are drawn from. Defaults to one hedge per ten
+            requests, with a small time-based allowance for quiet clients.
+    """
+    
+    def __init__(
+        self,
+        *,
+        percentile: float = 95.0,
+        min_delay: float = 0.005,
+        max_delay: Optional[float] = None,
+        min_samples: int = 20,
+        window: int = 200,
+        budget: Optional[RetryBudget] = None,
+    ) -> None:
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.window = window
+        self.budget = budget or RetryBudget(ratio=0.1, min_retries_per_second=0.5, max_balance=5.0)
+        
+        self._windows: Dict[str, LatencyWindow] = {}
+        self._lock = threading.Lock()
+        
+        # Counters for monitoring
+        self.hedges_sent = 0
+        self.hedges_won = 0
+        self.hedges_denied = 0
+    
+    def record(self, family: str, latency: float) -> None:
+        """Record the latency of a completed request."""
+        with self._lock:
+            if family not in self._windows:
+                self._windows[family] = LatencyWindow(self.window)
+            self._windows[family].add(latency)
+    
+    def delay_for(self, family: str) -> Optional[float]:
+        """Seconds to wait before hedging, or None if there is not enough data yet."""
+        with self._lock:
+            window = self._windows.get(family)
+            if window is None or len(window) < self.min_samples:
+                return None
+            delay = max(window.percentile(self.percentile), self.min_delay)
+        if self.max_delay is not None:
+            delay = min(delay, self.max_delay)
+        return delay
+    
+    def try_hedge(self) -> bool:
+        """Take a hedge from the budget. Returns False if the budget is exhausted."""
+        allowed = self.budget.withdraw()
+        with self._lock:
+            if allowed:
+                self.hedges_sent += 1
+            else:
+                self.hedges_denied += 1
+        return allowed
+    
+    def record_win(self) -> None:
+        """Count a hedge that answered before the request it raced."""
+        with self._lock:
+            self.hedges_won += 1
+    
+    def stats(self) -> Dict[str, int]:
+        """Hedging counters, for monitoring."""
+        with self._lock:
+            return {
+                "hedges_sent": self.hedges_sent,
+                "hedges_won": self.hedges_won,
+                "hedges_denied": self.hedges_denied,
+            }
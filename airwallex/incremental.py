@@ -0,0 +1,79 @@
+"""
+High-water-mark tracking for incremental syncs.
+
+Jobs that only need what is new since their last run can list from a stored
+high-water mark - the latest creation time seen so far - instead of re-reading
+the whole history. Items can become visible slightly after their creation time,
+so each run re-reads an overlap window before the mark and drops the items it
+already returned, identified by ID.
+"""
+import hashlib
+import json
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from .checkpoint import CheckpointStore
+from .sharding import parse_timestamp
+
+
+class HighWaterMark:
+    """
+    State of one incremental sync, kept in a checkpoint store.
+
+    Args:
+        store: Where the state is kept between runs.
+        endpoint: URL of the listing.
+        params: Filters of the listing, other than the creation time range.
+        overlap: How far before the high-water mark each run starts reading.
+        key: State key; defaults to a hash of ``endpoint`` and ``params``.
+    """
+
+    def __init__(
+        self,
+        store: CheckpointStore,
+        endpoint: str,
+        params: Dict[str, Any],
+        overlap: timedelta,
+        key: Optional[str] = None
+    ) -> None:
+        self.store = store
+        self.overlap = overlap
+        filters = json.loads(json.dumps(params, sort_keys=True, default=str))
+        self.key = key or "hwm:" + hashlib.sha256(
+            json.dumps([endpoint, filters], sort_keys=True).encode()
+        ).hexdigest()
+
+        state = store.load(self.key) or {}
+        self.mark: Optional[datetime] = (
+            parse_timestamp(state["high_water_mark"]) if state.get("high_water_mark") else None
+        )
+        # IDs created within the overlap window before the mark, with their creation times
+        self.recent: Dict[str, str] = dict(state.get("recent_ids", {}))
+
+    @property
+    def since(self) -> Optional[datetime]:
+        """Creation time to list from, or None on the first run."""
+        return self.mark - self.overlap if self.mark else None
+
+    def is_new(self, item_id: str, created_at: datetime) -> bool:
+        """Record an item, returning False if a previous run already returned it."""
+        if item_id in self.recent:
+            return False
+        if self.mark is None or created_at > self.mark:
+            self.mark = created_at
+        if created_at >= self.mark - self.overlap:
+            self.recent[item_id] = created_at.isoformat()
+        return True
+
+    def save(self) -> None:
+        """Persist the mark, keeping only the IDs still inside the overlap window."""
+        if self.mark is not None:
+            cutoff = self.mark - self.overlap
+            self.recent = {
+                item_id: created_at for item_id, created_at in self.recent.items()
+                if parse_timestamp(created_at) >= cutoff
+            }
+        self.store.save(self.key, {
+            "high_water_mark": self.mark.isoformat() if self.mark else None,
+            "recent_ids": self.recent,
+        })
@@ -2,6 +2,8 @@
 Pydantic models for the Airwallex API.
 """
 from .base import AirwallexModel
+from .lazy import LazyModel
+from .compact import CompactRecord, compact_record_class
 from .account import Account as AccountModel
 from .payment import Payment as PaymentModel
 from .beneficiary import Beneficiary as BeneficiaryModel
@@ -34,6 +36,9 @@ from .issuing_config import IssuingConfig as IssuingConfigModel
 
 __all__ = [
     "AirwallexModel",
+    "LazyModel",
+    "CompactRecord",
+    "compact_record_class",
     "AccountModel",
     "PaymentModel",
     "BeneficiaryModel",
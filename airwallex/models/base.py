@@ -1,14 +1,100 @@
 """
 Base Pydantic models for the Airwallex API.
 """
-from typing import Any, Dict, List, Optional, ClassVar, Type, TypeVar, Generic, get_origin, get_args
-from datetime import datetime
-import re
-from pydantic import BaseModel, Field, ConfigDict, model_validator
+from typing import (
+    Any, Callable, Dict, FrozenSet, List, Literal, Optional, ClassVar, Tuple, Type, TypeVar, Generic, Union,
+    get_origin, get_args
+)
+from datetime import date, datetime
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, model_validator
 from ..utils import snake_to_camel_case, camel_to_snake_case
 
 T = TypeVar('T', bound='AirwallexModel')
 
+Coercer = Callable[[Any], Any]
+
+# Field defaults of these types can be shared between instances
+_IMMUTABLE_DEFAULTS = (type(None), str, int, float, bool, tuple, frozenset)
+
+_object_setattr = object.__setattr__
+_datetime_adapter = TypeAdapter(datetime)
+_date_adapter = TypeAdapter(date)
+
+
+def _parse_datetime(value: Any) -> Any:
+    """Parse an ISO 8601 timestamp, falling back to pydantic for other formats."""
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        pass
+    if isinstance(value, str) and value.endswith("Z"):
+        # Python < 3.11 does not accept the "Z" suffix
+        try:
+            return datetime.fromisoformat(value[:-1] + "+00:00")
+        except ValueError:
+            pass
+    return value if isinstance(value, datetime) else _datetime_adapter.validate_python(value)
+
+
+def _parse_date(value: Any) -> Any:
+    """Parse an ISO 8601 date, falling back to pydantic for other formats."""
+    if isinstance(value, str):
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            pass
+    return value if isinstance(value, date) else _date_adapter.validate_python(value)
+
+
+def _is_model_annotation(annotation: Any) -> bool:
+    """Whether a field holds AirwallexModels (optionally in a list), which convert their own keys."""
+    if isinstance(annotation, type):
+        return issubclass(annotation, AirwallexModel)
+    origin = get_origin(annotation)
+    if origin is Union or origin is list or origin is List:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return bool(args) and all(_is_model_annotation(arg) for arg in args)
+    return False
+
+
+def _is_scalar_annotation(annotation: Any) -> bool:
+    """Whether a field can only hold scalars (or lists of them), which never need key conversion."""
+    if annotation in (str, int, float, bool, type(None)):
+        return True
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return True
+    if origin is Union or origin is list or origin is List:
+        return all(_is_scalar_annotation(arg) for arg in get_args(annotation))
+    return False
+
+
+def _trusted_coercer(annotation: Any) -> Optional[Coercer]:
+    """
+    How a trusted value of a field's type is built: nested models are
+    constructed, timestamps parsed and everything else left as decoded.
+    """
+    origin = get_origin(annotation)
+    if origin is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        return _trusted_coercer(args[0]) if len(args) == 1 else None
+    if origin is list or origin is List:
+        args = get_args(annotation)
+        inner = _trusted_coercer(args[0]) if args else None
+        if inner is None:
+            return None
+        return lambda value: [
+            item if item is None else inner(item) for item in value
+        ] if isinstance(value, list) else value
+    if isinstance(annotation, type):
+        if issubclass(annotation, AirwallexModel):
+            return lambda value: annotation.from_trusted_api_response(value) if isinstance(value, dict) else value
+        if issubclass(annotation, datetime):
+            return _parse_datetime
+        if issubclass(annotation, date):
+            return _parse_date
+    return None
+
 
 class AirwallexModel(BaseModel):
     """Base model for all Airwallex API models with camelCase conversion."""
@@ -22,6 +108,50 @@ class AirwallexModel(BaseModel):
     # Class variable to store the API resource name
     resource_name: ClassVar[str] = ""
     
+    # Key conversions for the model's own fields, built once per class
+    _snake_aliases: ClassVar[Dict[str, str]] = {}
+    _camel_aliases: ClassVar[Dict[str, str]] = {}
+    # Fields holding nested models, whose keys are converted by the nested model
+    _nested_model_fields: ClassVar[FrozenSet[str]] = frozenset()
+    # Field name and builder (None: as decoded) of each known key for
+    # `from_trusted_api_response`, and the defaults it fills in: immutable ones
+    # shared, others built per instance
+    _trusted_fields: ClassVar[Dict[str, Tuple[str, Optional[Coercer]]]] = {}
+    _trusted_defaults: ClassVar[Dict[str, Any]] = {}
+    _trusted_default_factories: ClassVar[FrozenSet[str]] = frozenset()
+    _trusted_via_construct: ClassVar[bool] = False
+    
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._camel_aliases = {name: snake_to_camel_case(name) for name in cls.model_fields}
+        cls._snake_aliases = {
+            key: camel_to_snake_case(key)
+            for name, camel_name in cls._camel_aliases.items()
+            for key in (name, camel_name)
+        }
+        cls._nested_model_fields = frozenset(
+            name for name, field in cls.model_fields.items() if _is_model_annotation(field.annotation)
+        )
+        coercers: Dict[str, Optional[Coercer]] = {}
+        for name, field in cls.model_fields.items():
+            coerce = _trusted_coercer(field.annotation)
+            if coerce is None and not _is_scalar_annotation(field.annotation):
+                # Keys of plain nested dicts are converted as in `from_api_response`
+                coerce = cls._convert_nested_keys
+            coercers[name] = coerce
+        cls._trusted_fields = {
+            key: (name, coercers[name]) for key, name in cls._snake_aliases.items() if name in coercers
+        }
+        optional = {name: field for name, field in cls.model_fields.items() if not field.is_required()}
+        cls._trusted_defaults = {
+            name: field.default for name, field in optional.items()
+            if field.default_factory is None and isinstance(field.default, _IMMUTABLE_DEFAULTS)
+        }
+        cls._trusted_default_factories = frozenset(optional.keys() - cls._trusted_defaults.keys())
+        # Models with private attributes or post-init hooks need model_construct's setup
+        cls._trusted_via_construct = bool(cls.__private_attributes__) or cls.__pydantic_post_init__ is not None
+    
     @model_validator(mode='before')
     @classmethod
     def _convert_keys_to_snake_case(cls, data: Any) -> Any:
@@ -29,13 +159,17 @@ class AirwallexModel(BaseModel):
         if not isinstance(data, dict):
             return data
             
+        aliases = cls._snake_aliases
+        nested_models = cls._nested_model_fields
         result = {}
         for key, value in data.items():
             # Convert camelCase keys to snake_case
-            snake_key = camel_to_snake_case(key)
+            snake_key = aliases.get(key) or camel_to_snake_case(key)
             
             # Handle nested dictionaries and lists
-            if isinstance(value, dict):
+            if snake_key in nested_models:
+                result[snake_key] = value
+            elif isinstance(value, dict):
                 result[snake_key] = cls._convert_keys_to_snake_case(value)
             elif isinstance(value, list) and all(isinstance(item, dict) for item in value):
                 result[snake_key] = [cls._convert_keys_to_snake_case(item) for item in value]
@@ -48,10 +182,11 @@ class AirwallexModel(BaseModel):
         """Convert the model to a dictionary with camelCase keys for API requests."""
         data = self.model_dump(exclude_unset=True)
         result: Dict[str, Any] = {}
+        aliases = self._camel_aliases
         
         for key, value in data.items():
             # Convert snake_case keys to camelCase
-            camel_key = snake_to_camel_case(key)
+            camel_key = aliases.get(key) or snake_to_camel_case(key)
             
             # Handle nested models, dictionaries, and lists
             if isinstance(value, AirwallexModel):
@@ -84,7 +219,51 @@ class AirwallexModel(BaseModel):
     @classmethod
     def from_api_response(cls: Type[T], data: Dict[str, Any]) -> T:
         """Create a model instance from API response data."""
-        return cls.model_validate(cls._convert_keys_to_snake_case(data))
+        # Keys are converted by the model's before-validator
+        return cls.model_validate(data)
+    
+    @classmethod
+    def _convert_nested_keys(cls, value: Any) -> Any:
+        """Convert the keys of a plain dict, or list of dicts, held by a field."""
+        if isinstance(value, dict):
+            return cls._convert_keys_to_snake_case(value)
+        if isinstance(value, list) and all(isinstance(item, dict) for item in value):
+            return [cls._convert_keys_to_snake_case(item) for item in value]
+        return value
+    
+    @classmethod
+    def from_trusted_api_response(cls: Type[T], data: Dict[str, Any]) -> T:
+        """
+        Build a model instance from API response data without validating it.
+        
+        Keys are converted, nested models are built the same way and timestamps
+        are parsed, but no other value is checked or coerced, so this is only
+        for data already known to match the model, such as responses from the
+        Airwallex API. Missing optional fields take their defaults; missing
+        required fields are left unset.
+        """
+        fields = cls._trusted_fields
+        present = {}
+        for key, value in data.items():
+            field = fields.get(key) or fields.get(camel_to_snake_case(key))
+            if field is not None:
+                name, coerce = field
+                present[name] = value if coerce is None or value is None else coerce(value)
+        if cls._trusted_via_construct:
+            return cls.model_construct(_fields_set=set(present), **present)
+        
+        values = {**cls._trusted_defaults, **present}
+        if cls._trusted_default_factories:
+            for name in cls._trusted_default_factories - present.keys():
+                values[name] = cls.model_fields[name].get_default(call_default_factory=True)
+        
+        # What model_construct does, without its per-call work over every field
+        instance = cls.__new__(cls)
+        _object_setattr(instance, "__dict__", values)
+        _object_setattr(instance, "__pydantic_fields_set__", set(present))
+        _object_setattr(instance, "__pydantic_extra__", None)
+        _object_setattr(instance, "__pydantic_private__", None)
+        return instance
 
 
 # Common types used across the SDK
@@ -0,0 +1,234 @@
+"""
+Compact read-only records of API response items.
+
+A pydantic model instance carries a ``__dict__``, field-set tracking and a
+further model object per nested model, which adds up when millions of
+transactions are held in memory. ``compact_record_class`` generates, once per
+model class, a ``tuple`` subclass with empty ``__slots__`` and one read-only
+property per field:
+
+* fields of nested models are flattened (``merchant.name`` becomes
+  ``merchant_name``)
+* lists are stored as tuples, and lists of nested models as tuples of records
+* currency, status, type and country values are interned, so each distinct
+  code is stored once
+"""
+import sys
+from operator import itemgetter
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Type, TypeVar, Union, get_args, get_origin
+
+from .base import AirwallexModel, Coercer, _trusted_coercer
+from ..utils import is_code_field, snake_to_camel_case
+
+T = TypeVar("T", bound=AirwallexModel)
+R = TypeVar("R", bound="CompactRecord")
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _list_model(annotation: Any) -> Optional[Type[AirwallexModel]]:
+    """The model class of a list-of-models field, if it is one."""
+    if get_origin(annotation) in (list, List):
+        args = get_args(annotation)
+        item = _unwrap_optional(args[0]) if args else None
+        if isinstance(item, type) and issubclass(item, AirwallexModel):
+            return item
+    return None
+
+
+class _Field:
+    """One field of a model and how its value is stored in a record."""
+
+    __slots__ = ("name", "camel", "coerce", "intern", "nested", "records")
+
+    def __init__(self, name: str, annotation: Any) -> None:
+        self.name = name
+        self.camel = snake_to_camel_case(name)
+        annotation = _unwrap_optional(annotation)
+        self.coerce: Optional[Coercer] = None
+        self.intern = annotation is str and is_code_field(name)
+        # Fields of a nested model, flattened into the record
+        self.nested: Optional[List[_Field]] = None
+        # Record class of the items of a list-of-models field
+        self.records: Optional[Type[CompactRecord]] = None
+        if isinstance(annotation, type) and issubclass(annotation, AirwallexModel):
+            self.nested = _fields(annotation)
+        elif _list_model(annotation) is not None:
+            self.records = compact_record_class(_list_model(annotation))
+        else:
+            self.coerce = _trusted_coercer(annotation)
+
+    def store(self, value: Any, trusted: bool) -> Any:
+        """Convert a field value, raw if ``trusted`` or else from a model, for storage."""
+        if value is None:
+            return None
+        if trusted and self.coerce is not None:
+            value = self.coerce(value)
+        if isinstance(value, list):
+            if self.records is not None:
+                build = self.records.from_trusted_api_response if trusted else self.records.from_model
+                return tuple(build(item) if isinstance(item, (dict, AirwallexModel)) else item for item in value)
+            return tuple(value)
+        if self.intern and type(value) is str:
+            return sys.intern(value)
+        return value
+
+
+def _fields(model_class: Type[AirwallexModel]) -> List[_Field]:
+    return [
+        _Field(name, field.annotation)
+        for name, field in model_class.model_fields.items()
+        if name != "resource_name"
+    ]
+
+
+def _flat_names(fields: List[_Field], prefix: str = "") -> List[str]:
+    names = []
+    for field in fields:
+        if field.nested is not None:
+            names.extend(_flat_names(field.nested, prefix + field.name + "_"))
+        else:
+            names.append(prefix + field.name)
+    return names
+
+
+def _from_raw(fields: List[_Field], data: Optional[Dict[str, Any]], values: List[Any]) -> None:
+    for field in fields:
+        value = None
+        if data is not None:
+            value = data.get(field.name)
+            if value is None:
+                value = data.get(field.camel)
+        if field.nested is not None:
+            _from_raw(field.nested, value if isinstance(value, dict) else None, values)
+        else:
+            values.append(field.store(value, trusted=True))
+
+
+def _from_model(fields: List[_Field], model: Optional[AirwallexModel], values: List[Any]) -> None:
+    for field in fields:
+        value = None if model is None else getattr(model, field.name)
+        if field.nested is not None:
+            _from_model(field.nested, value, values)
+        else:
+            values.append(field.store(value, trusted=False))
+
+
+def _to_data(fields: List[_Field], values: Tuple[Any, ...], position: int) -> Tuple[Dict[str, Any], int]:
+    """Rebuild the nested data of a record, and the position after the fields read."""
+    data: Dict[str, Any] = {}
+    for field in fields:
+        if field.nested is not None:
+            nested, position = _to_data(field.nested, values, position)
+            data[field.name] = nested if any(value is not None for value in nested.values()) else None
+            continue
+        value = values[position]
+        position += 1
+        if isinstance(value, tuple):
+            value = [item.to_model() if isinstance(item, CompactRecord) else item for item in value]
+        data[field.name] = value
+    return data, position
+
+
+class CompactRecord(tuple):
+    """
+    Base class of the read-only records generated by `compact_record_class`.
+
+    Records are tuples of field values in model field order, with a property
+    per field. A nested model that was absent reads as all of its flattened
+    fields being None, and is rebuilt as None by `to_model`.
+    """
+
+    __slots__ = ()
+
+    _fields: ClassVar[Tuple[str, ...]] = ()
+    _model_class: ClassVar[Type[AirwallexModel]] = AirwallexModel
+    _plan: ClassVar[List[_Field]] = []
+
+    def __new__(cls: Type[R], values: Any) -> R:
+        return tuple.__new__(cls, values)
+
+    @classmethod
+    def from_model(cls: Type[R], model: AirwallexModel) -> R:
+        """Build a record from a model instance."""
+        values: List[Any] = []
+        _from_model(cls._plan, model, values)
+        return tuple.__new__(cls, values)
+
+    @classmethod
+    def from_api_response(cls: Type[R], data: Dict[str, Any]) -> R:
+        """Build a record from API response data, validated through the model."""
+        return cls.from_model(cls._model_class.from_api_response(data))
+
+    @classmethod
+    def from_trusted_api_response(cls: Type[R], data: Dict[str, Any]) -> R:
+        """
+        Build a record from API response data without validating it.
+
+        As with `AirwallexModel.from_trusted_api_response`, timestamps are parsed
+        and nested models built, but no other value is checked or coerced.
+        """
+        values: List[Any] = []
+        _from_raw(cls._plan, data, values)
+        return tuple.__new__(cls, values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The flattened field values, by field name."""
+        return dict(zip(self._fields, self))
+
+    def to_model(self) -> AirwallexModel:
+        """Build and validate the full model instance of this record."""
+        data, _ = _to_data(self._plan, self, 0)
+        return self._model_class.model_validate(data)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Generated classes cannot be found by name, so pickle the model class instead
+        return _rebuild, (self._model_class, tuple(self))
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={value!r}" for name, value in zip(self._fields, self))
+        return f"{self.__class__.__name__}({values})"
+
+
+_record_classes: Dict[Type[AirwallexModel], Type[CompactRecord]] = {}
+
+
+def compact_record_class(model_class: Type[T]) -> Type[CompactRecord]:
+    """
+    Return the compact record class of a model class, generating it on first use.
+
+    The class is named after the model (``Transaction`` -> ``TransactionRecord``)
+    and has a read-only property per flattened field.
+    """
+    record_class = _record_classes.get(model_class)
+    if record_class is not None:
+        return record_class
+
+    plan = _fields(model_class)
+    names = _flat_names(plan)
+    namespace: Dict[str, Any] = {
+        "__slots__": (),
+        "__module__": __name__,
+        "__doc__": f"Compact read-only record of a `{model_class.__name__}`.",
+        "_fields": tuple(names),
+        "_model_class": model_class,
+        "_plan": plan,
+    }
+    for index, name in enumerate(names):
+        # Fields may shadow tuple methods, as in a namedtuple, but not the record API
+        if name in namespace or name in vars(CompactRecord):
+            raise ValueError(f"Field '{name}' of {model_class.__name__} clashes with a record attribute")
+        namespace[name] = property(itemgetter(index), doc=f"Alias for field number {index}")
+    record_class = type(f"{model_class.__name__}Record", (CompactRecord,), namespace)
+    _record_classes[model_class] = record_class
+    return record_class
+
+
+def _rebuild(model_class: Type[AirwallexModel], values: Tuple[Any, ...]) -> CompactRecord:
+    return compact_record_class(model_class)(values)
@@ -0,0 +1,153 @@
+"""
+Lazily validated views of API response items.
+
+``from_api_response`` converts every key and validates every field of an item,
+even when the caller only reads one or two of them. ``LazyModel`` keeps the raw
+item and converts and validates a field the first time it is read, so bulk
+listings only pay for the fields they use.
+"""
+from typing import Annotated, Any, Dict, Generic, Optional, Tuple, Type, TypeVar
+
+from pydantic import TypeAdapter
+
+from .base import AirwallexModel
+from ..utils import camel_to_snake_case, snake_to_camel_case
+
+T = TypeVar("T", bound=AirwallexModel)
+
+_MISSING = object()
+
+
+class _FieldPlan:
+    """How the fields of one model class are read lazily."""
+
+    def __init__(self, model_class: Type[AirwallexModel]) -> None:
+        decorators = model_class.__pydantic_decorators__
+        # Model validators other than the key conversion can rewrite any field
+        self.eager = any(
+            name != "_convert_keys_to_snake_case" for name in decorators.model_validators
+        )
+        # Fields with their own validators are read from the full model
+        self.validated_fields = {
+            field
+            for validators in (decorators.validators, decorators.field_validators)
+            for decorator in validators.values()
+            for field in decorator.info.fields
+        }
+        self.adapters: Dict[str, TypeAdapter] = {}
+
+    def adapter(self, model_class: Type[AirwallexModel], name: str) -> TypeAdapter:
+        adapter = self.adapters.get(name)
+        if adapter is None:
+            field = model_class.model_fields[name]
+            annotation = Annotated[(field.annotation, *field.metadata)] if field.metadata else field.annotation
+            adapter = self.adapters[name] = TypeAdapter(annotation)
+        return adapter
+
+
+_plans: Dict[Type[AirwallexModel], _FieldPlan] = {}
+
+
+def _plan_for(model_class: Type[AirwallexModel]) -> _FieldPlan:
+    plan = _plans.get(model_class)
+    if plan is None:
+        plan = _plans[model_class] = _FieldPlan(model_class)
+    return plan
+
+
+class LazyModel(Generic[T]):
+    """
+    Read-only view of a raw API item that validates fields on first access.
+
+    Reading a model field converts and validates just that field; reading
+    anything else (``to_api_dict``, ``model_dump``, ...) builds the full model
+    with `model` and reads it from there. Validation errors for a field
+    surface when the field is read rather than when the item is listed.
+
+    Args:
+        model_class: Model the item is an instance of.
+        data: Item as returned by the API.
+    """
+
+    __slots__ = ("_model_class", "_data", "_values", "_model")
+
+    def __init__(self, model_class: Type[T], data: Dict[str, Any]) -> None:
+        self._model_class = model_class
+        self._data = data
+        self._values: Dict[str, Any] = {}
+        self._model: Optional[T] = None
+
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """The item as returned by the API."""
+        return self._data
+
+    @property
+    def model_class(self) -> Type[T]:
+        """Model the item is an instance of."""
+        return self._model_class
+
+    def model(self) -> T:
+        """Convert and validate the whole item, returning the model instance."""
+        if self._model is None:
+            self._model = self._model_class.from_api_response(self._data)
+        return self._model
+
+    def _raw_value(self, name: str) -> Tuple[Optional[str], Any]:
+        data = self._data
+        for key in (name, snake_to_camel_case(name)):
+            if key in data:
+                return key, data[key]
+        for key, value in data.items():
+            if camel_to_snake_case(key) == name:
+                return key, value
+        return None, _MISSING
+
+    def _field(self, name: str) -> Any:
+        if self._model is not None:
+            return getattr(self._model, name)
+
+        model_class = self._model_class
+        plan = _plan_for(model_class)
+        if plan.eager or name in plan.validated_fields:
+            return getattr(self.model(), name)
+
+        key, value = self._raw_value(name)
+        field = model_class.model_fields[name]
+        if value is _MISSING:
+            if field.is_required():
+                # Let the full validation report the missing field
+                return getattr(self.model(), name)
+            return field.get_default(call_default_factory=True)
+        if isinstance(value, (dict, list)):
+            value = model_class._convert_keys_to_snake_case({key: value})[camel_to_snake_case(key)]
+        return plan.adapter(model_class, name).validate_python(value)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name in self._model_class.model_fields:
+            values = self._values
+            if name not in values:
+                values[name] = self._field(name)
+            return values[name]
+        return getattr(self.model(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in LazyModel.__slots__:
+            object.__setattr__(self, name, value)
+        else:
+            raise AttributeError(f"{type(self).__name__} is read-only; call model() for a mutable copy")
+
+    def __dir__(self) -> Any:
+        return sorted(set(object.__dir__(self)) | set(self._model_class.model_fields))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyModel):
+            other = other.model()
+        return self.model() == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"<Lazy{self._model_class.__name__} {self._data!r}>"
@@ -0,0 +1,98 @@
+"""
+Adaptive page sizes for paginated listings.
+
+Small pages multiply round trips; very large pages are slow to arrive and
+spike memory. ``PageSizeTuner`` picks the page size from the latency and size
+of the pages fetched so far: it steps up while pages come back quickly and
+comfortably inside the memory budget, and steps down when they do not.
+
+Listings are paginated by page number, so a page of size ``s`` starting at
+item ``offset`` is only addressable when ``offset`` is a multiple of ``s``.
+Page sizes are therefore taken from a ladder where each size divides the
+next, and a larger size is only used once the offset is aligned to it.
+"""
+import threading
+from typing import Optional, Sequence
+
+# Each size divides the next, so any offset reached is a multiple of the smallest
+PAGE_SIZE_LADDER = (10, 50, 100, 500, 1000)
+
+# Weight of the newest sample in the moving average of bytes per item
+BYTES_PER_ITEM_WEIGHT = 0.3
+
+
+class PageSizeTuner:
+    """
+    Chooses page sizes for one paginated listing.
+
+    Args:
+        initial: Page size to start with; rounded down onto the ladder.
+        min_size: Smallest page size to use.
+        max_size: Largest page size to use (the API allows up to 1000).
+        target_latency: Seconds a page should take to arrive. Pages faster than
+            half of this step the size up, slower ones step it down.
+        memory_budget: Maximum response body size of one page, in bytes.
+        ladder: Candidate page sizes, each dividing the next.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: int = 100,
+        min_size: int = 10,
+        max_size: int = 1000,
+        target_latency: float = 2.0,
+        memory_budget: int = 8 * 1024 * 1024,
+        ladder: Sequence[int] = PAGE_SIZE_LADDER,
+    ) -> None:
+        self.sizes = [size for size in ladder if min_size <= size <= max_size]
+        if not self.sizes:
+            raise ValueError("No page size on the ladder lies between min_size and max_size")
+        if any(larger % smaller for smaller, larger in zip(self.sizes, self.sizes[1:])):
+            raise ValueError("Each page size on the ladder must divide the next")
+        self.target_latency = target_latency
+        self.memory_budget = memory_budget
+
+        self._index = max(
+            [i for i, size in enumerate(self.sizes) if size <= initial] or [0]
+        )
+        self._bytes_per_item: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def page_size(self) -> int:
+        """Page size currently aimed for."""
+        return self.sizes[self._index]
+
+    def next_size(self, offset: int) -> int:
+        """Largest size, up to the current target, whose pages can start at ``offset``."""
+        with self._lock:
+            for size in reversed(self.sizes[:self._index + 1]):
+                if offset % size == 0:
+                    return size
+        return self.sizes[0]
+
+    def observe(self, page_size: int, latency: float, nbytes: int, count: int) -> None:
+        """
+        Adjust the target page size from a fetched page.
+
+        Args:
+            page_size: Size the page was requested with.
+            latency: Seconds the request took.
+            nbytes: Size of the response body.
+            count: Number of items on the page.
+        """
+        with self._lock:
+            if count:
+                sample = nbytes / count
+                self._bytes_per_item = sample if self._bytes_per_item is None else (
+                    BYTES_PER_ITEM_WEIGHT * sample + (1 - BYTES_PER_ITEM_WEIGHT) * self._bytes_per_item
+                )
+            if latency > self.target_latency or nbytes > self.memory_budget:
+                self._index = max(self._index - 1, 0)
+            elif page_size == self.page_size and count == page_size and latency < self.target_latency / 2:
+                # Only full pages at the current size say whether a larger one would fit
+                if self._index + 1 < len(self.sizes):
+                    larger = self.sizes[self._index + 1]
+                    if (self._bytes_per_item or 0) * larger <= self.memory_budget:
+                        self._index += 1
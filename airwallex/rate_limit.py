@@ -0,0 +1,115 @@
+"""
+Client-side rate limiting for the Airwallex API.
+
+A ``RateLimiter`` holds one token bucket per endpoint family and delays each
+request until its bucket has capacity, so bursts are smoothed out before they
+reach the API instead of being rejected with a 429. A limiter may be shared by
+any number of threads, coroutines and clients.
+"""
+import asyncio
+import fnmatch
+import threading
+import time
+from typing import Dict, Optional, Tuple, Union
+
+from .utils import endpoint_path
+
+# A rate in requests/second, or a (rate, burst) pair
+RateSpec = Union[float, Tuple[float, float]]
+
+
+class TokenBucket:
+    """
+    Token bucket allowing ``rate`` requests per second with bursts of ``burst``.
+    
+    Callers reserve a token up front and are told how long to wait for it, so
+    waiters are admitted in arrival order without polling.
+    """
+    
+    def __init__(self, rate: float, burst: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1.0)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """Take a token and return how many seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            # A negative balance is the queue of callers already waiting
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+    
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+    
+    async def acquire_async(self) -> None:
+        """Wait, without blocking the event loop, until a token is available."""
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+class RateLimiter:
+    """
+    Per-endpoint-family rate limits.
+    
+    Families are matched against the request path relative to ``/api/v1/``.
+    Patterns may use shell-style wildcards (``"issuing/*"``); a pattern without
+    wildcards matches that path and everything below it (``"payments"`` covers
+    ``payments/create`` too). The first matching pattern wins, and all requests
+    in a family draw from the same bucket.
+    
+    Args:
+        limits: Mapping of pattern to requests/second or ``(rate, burst)``.
+        default: Limit for requests that match no pattern. Unlimited if None.
+    
+    Example:
+        RateLimiter({"issuing/*": 20, "payments": (5, 10)}, default=50)
+    """
+    
+    def __init__(self, limits: Optional[Dict[str, RateSpec]] = None, default: Optional[RateSpec] = None) -> None:
+        self._buckets: Dict[str, TokenBucket] = {
+            pattern: self._make_bucket(spec) for pattern, spec in (limits or {}).items()
+        }
+        self._default = self._make_bucket(default) if default is not None else None
+    
+    @staticmethod
+    def _make_bucket(spec: RateSpec) -> TokenBucket:
+        if isinstance(spec, tuple):
+            return TokenBucket(*spec)
+        return TokenBucket(spec)
+    
+    @staticmethod
+    def _matches(pattern: str, path: str) -> bool:
+        if any(char in pattern for char in "*?["):
+            return fnmatch.fnmatchcase(path, pattern)
+        return path == pattern or path.startswith(f"{pattern}/")
+    
+    def bucket_for(self, url: str) -> Optional[TokenBucket]:
+        """Return the bucket that governs requests to ``url``."""
+        path = endpoint_path(url)
+        for pattern, bucket in self._buckets.items():
+            if self._matches(pattern, path):
+                return bucket
+        return self._default
+    
+    def acquire(self, url: str) -> None:
+        """Block until a request to ``url`` may be sent."""
+        bucket = self.bucket_for(url)
+        if bucket:
+            bucket.acquire()
+    
+    async def acquire_async(self, url: str) -> None:
+        """Wait until a request to ``url`` may be sent."""
+        bucket = self.bucket_for(url)
+        if bucket:
+            await bucket.acquire_async()
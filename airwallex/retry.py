@@ -0,0 +1,188 @@
+"""
+Retry policies for the Airwallex API clients.
+
+A ``RetryPolicy`` decides how many times a failed request is retried and how
+long to wait in between. ``ExponentialBackoff`` with full jitter (the default)
+spreads retries from many workers out over time instead of having them hit a
+struggling API in lockstep. A ``RetryBudget`` additionally caps retries at a
+fraction of live traffic, so that when the API degrades retries cannot multiply
+the load on it.
+"""
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Optional
+
+import httpx
+
+# Failures where the request never reached the server: always safe to retry
+CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+# Failures typical of reusing a keep-alive connection the server already closed
+STALE_CONNECTION_ERRORS = (httpx.RemoteProtocolError, httpx.ReadError, httpx.WriteError)
+
+# Failures after the request may have been processed: only retry idempotent requests
+MAYBE_SENT_ERRORS = STALE_CONNECTION_ERRORS + (httpx.ReadTimeout, httpx.WriteTimeout)
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+def is_idempotent(method: str, payload: Any = None) -> bool:
+    """
+    Whether repeating a request cannot apply it twice.
+    
+    Safe methods are idempotent by definition. Airwallex de-duplicates create
+    requests that carry a ``request_id``, which makes such POSTs idempotent too.
+    """
+    if method.upper() in IDEMPOTENT_METHODS:
+        return True
+    return isinstance(payload, dict) and bool(payload.get("request_id"))
+
+
+def is_retryable_transport_error(exc: Exception, method: str, payload: Any = None) -> bool:
+    """Whether a transport-level failure may be retried for this request."""
+    if isinstance(exc, CONNECT_ERRORS):
+        return True
+    return isinstance(exc, MAYBE_SENT_ERRORS) and is_idempotent(method, payload)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delay in seconds or an HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RetryPolicy:
+    """
+    Base retry policy: how many retries, and how long to wait before each.
+    
+    Args:
+        max_retries: Retries allowed per request after the first attempt.
+        max_retry_after: Upper bound on a server-supplied Retry-After, in seconds.
+    """
+    
+    def __init__(self, max_retries: int = 5, max_retry_after: float = 60.0) -> None:
+        self.max_retries = max_retries
+        self.max_retry_after = max_retry_after
+    
+    def backoff(self, attempt: int) -> float:
+        """Seconds to wait before retry number ``attempt`` (starting at 1)."""
+        raise NotImplementedError
+    
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Seconds to wait before retry ``attempt``, honouring Retry-After if given."""
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+        return self.backoff(attempt)
+
+
+class FixedBackoff(RetryPolicy):
+    """Wait the same ``interval`` before every retry."""
+    
+    def __init__(self, interval: float = 1.0, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.interval = interval
+    
+    def backoff(self, attempt: int) -> float:
+        return self.interval
+
+
+class ExponentialBackoff(RetryPolicy):
+    """
+    Exponential backoff, capped, with optional jitter.
+    
+    The un-jittered delay before retry ``n`` is ``min(cap, base * 2 ** (n - 1))``.
+    
+    Args:
+        base: Delay before the first retry, in seconds.
+        cap: Maximum delay, in seconds.
+        jitter: "full" waits a random time between 0 and the delay, "equal" between
+            half the delay and the delay, "none" waits exactly the delay.
+    """
+    
+    JITTER_MODES = ("full", "equal", "none")
+    
+    def __init__(self, base: float = 0.5, cap: float = 30.0, jitter: str = "full", **kwargs) -> None:
+        super().__init__(**kwargs)
+        if jitter not in self.JITTER_MODES:
+            raise ValueError(f"jitter must be one of {self.JITTER_MODES}")
+        self.base = base
+        self.cap = cap
+        self.jitter = jitter
+    
+    def backoff(self, attempt: int) -> float:
+        delay = min(self.cap, self.base * 2 ** (attempt - 1))
+        if self.jitter == "full":
+            return random.uniform(0, delay)
+        if self.jitter == "equal":
+            return delay / 2 + random.uniform(0, delay / 2)
+        return delay
+
+
+class RetryBudget:
+    """
+    Token bucket that limits retries to a fraction of live traffic.
+    
+    Every request deposits ``ratio`` tokens and every retry withdraws one, so in
+    steady state retries are capped at ``ratio`` times the request rate. A small
+    time-based allowance (``min_retries_per_second``) keeps retries possible
+    for low-traffic clients, and the balance never exceeds ``max_balance`` so a
+    quiet period cannot bank an unbounded burst of retries.
+    
+    A budget may be shared by several clients and threads.
+    """
+    
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_retries_per_second: float = 1.0,
+        max_balance: float = 10.0,
+    ) -> None:
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.max_balance = max_balance
+        self._balance = max_balance
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _refill(self, amount: float = 0.0) -> None:
+        now = time.monotonic()
+        self._balance = min(
+            self.max_balance,
+            self._balance + amount + (now - self._updated) * self.min_retries_per_second
+        )
+        self._updated = now
+    
+    @property
+    def balance(self) -> float:
+        """Retries currently available."""
+        with self._lock:
+            self._refill()
+            return self._balance
+    
+    def deposit(self) -> None:
+        """Record a new (non-retry) request."""
+        with self._lock:
+            self._refill(self.ratio)
+    
+    def withdraw(self) -> bool:
+        """Take a retry from the budget. Returns False if the budget is exhausted."""
+        with self._lock:
+            self._refill()
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
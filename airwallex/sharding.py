@@ -0,0 +1,294 @@
+"""
+Time-window sharded scans over listings filtered by creation time.
+
+A full-history pull through one paginated listing is a single serial walk of
+page after page. A sharded scan splits the ``from_created_at``/``to_created_at``
+range into sub-windows and pages through them concurrently. Windows that turn
+out to hold more than a few pages are split in half again, so a burst of
+activity in one week does not leave a single shard doing most of the work.
+
+Each window owns the half-open interval ``[start, end)`` (the last one also owns
+its end instant), items outside it are dropped, and windows are emitted in time
+order with their items sorted by creation time, so the merged output is in
+ascending creation order with no duplicates at window boundaries. For listings
+whose ``to_created_at`` is exclusive, the last window asks for slightly past its
+end so that its end instant is still returned.
+"""
+import asyncio
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pydantic import TypeAdapter
+
+logger = logging.getLogger(__name__)
+
+_datetime_adapter = TypeAdapter(datetime)
+
+PageFetcher = Callable[[Dict[str, Any]], Dict[str, Any]]
+AsyncPageFetcher = Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+def parse_timestamp(value: Union[str, datetime]) -> datetime:
+    """Parse an API timestamp, treating naive values as UTC."""
+    parsed = value if isinstance(value, datetime) else _datetime_adapter.validate_python(value)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+class TimeWindow:
+    """A slice ``[start, end)`` of the scanned range, or ``[start, end]`` if it is the last."""
+
+    __slots__ = ("start", "end", "closed")
+
+    def __init__(self, start: datetime, end: datetime, closed: bool = False) -> None:
+        self.start = start
+        self.end = end
+        self.closed = closed
+
+    def __repr__(self) -> str:
+        bracket = "]" if self.closed else ")"
+        return f"<TimeWindow [{self.start.isoformat()}, {self.end.isoformat()}{bracket}>"
+
+    def __lt__(self, other: "TimeWindow") -> bool:
+        return self.start < other.start
+
+    def owns(self, timestamp: datetime) -> bool:
+        """Whether an item created at ``timestamp`` belongs to this window."""
+        return self.start <= timestamp < self.end or (self.closed and timestamp == self.end)
+
+    def split(self, parts: int = 2) -> List["TimeWindow"]:
+        """Split into ``parts`` consecutive windows of equal length."""
+        step = (self.end - self.start) / parts
+        bounds = [self.start + step * i for i in range(parts)] + [self.end]
+        return [
+            TimeWindow(bounds[i], bounds[i + 1], self.closed and i == parts - 1)
+            for i in range(parts)
+        ]
+
+
+class ShardedScan:
+    """
+    Plan and bookkeeping for one sharded scan; the page fetching is done by
+    ``run`` (thread pool) or ``run_async`` (asyncio).
+
+    Args:
+        from_created_at: Start of the range (inclusive).
+        to_created_at: End of the range (inclusive).
+        created_at_field: Item field holding the creation timestamp.
+        params: Other filter parameters sent with every page request.
+        shards: Number of windows the range is initially split into.
+        page_size: Items per page.
+        first_page_num: Number of the first page of a listing (0 or 1).
+        max_pages_per_window: Windows holding more pages than this are split.
+        min_window: Windows shorter than this are never split.
+        inclusive_end: Whether the listing includes items created exactly at
+            ``to_created_at``; if not, the last window's bound is moved past it.
+    """
+
+    # How far past the end of the range to ask an exclusive listing for
+    EXCLUSIVE_END_MARGIN = timedelta(milliseconds=1)
+
+    def __init__(
+        self,
+        *,
+        from_created_at: Union[str, datetime],
+        to_created_at: Union[str, datetime],
+        created_at_field: str,
+        params: Optional[Dict[str, Any]] = None,
+        shards: int = 8,
+        page_size: int = 100,
+        first_page_num: int = 0,
+        max_pages_per_window: int = 10,
+        min_window: timedelta = timedelta(seconds=1),
+        inclusive_end: bool = True,
+    ) -> None:
+        start = parse_timestamp(from_created_at)
+        end = parse_timestamp(to_created_at)
+        if end < start:
+            raise ValueError("to_created_at must not be before from_created_at")
+        if shards < 1 or max_pages_per_window < 1:
+            raise ValueError("shards and max_pages_per_window must be at least 1")
+
+        self.created_at_field = created_at_field
+        self.params = dict(params or {})
+        self.page_size = page_size
+        self.first_page_num = first_page_num
+        self.max_pages_per_window = max_pages_per_window
+        self.min_window = min_window
+        self.inclusive_end = inclusive_end
+        self.windows = TimeWindow(start, end, closed=True).split(shards) if end > start else [
+            TimeWindow(start, end, closed=True)
+        ]
+
+        # Windows not yet emitted, in time order, and the items of finished ones
+        self._pending: List[TimeWindow] = list(self.windows)
+        self._finished: Dict[int, List[Dict[str, Any]]] = {}
+
+    def page_params(self, window: TimeWindow, index: int) -> Dict[str, Any]:
+        """Query parameters for the ``index``-th page (from zero) of ``window``."""
+        end = window.end
+        if window.closed and not self.inclusive_end:
+            # Items past the end are dropped by `owned_items`
+            end += self.EXCLUSIVE_END_MARGIN
+        return {
+            **self.params,
+            "from_created_at": window.start.isoformat(),
+            "to_created_at": end.isoformat(),
+            "page_num": self.first_page_num + index,
+            "page_size": self.page_size,
+        }
+
+    def should_split(self, window: TimeWindow, probe: Dict[str, Any]) -> bool:
+        """Whether a window is dense enough to split, from a probe of its last allowed page."""
+        return bool(probe.get("has_more")) and window.end - window.start >= self.min_window * 2
+
+    def owned_items(self, window: TimeWindow, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """The items belonging to ``window``, sorted by creation time."""
+        keyed = []
+        for item in items:
+            timestamp = parse_timestamp(item[self.created_at_field])
+            if window.owns(timestamp):
+                keyed.append((timestamp, item))
+        keyed.sort(key=lambda pair: pair[0])
+        return [item for _, item in keyed]
+
+    def replace(self, window: TimeWindow, children: List[TimeWindow]) -> None:
+        """Replace a window by the windows it was split into."""
+        logger.debug(f"Splitting dense {window}")
+        index = self._pending.index(window)
+        self._pending[index:index + 1] = children
+
+    def finish(self, window: TimeWindow, items: List[Dict[str, Any]]) -> None:
+        """Record the items of a completed window."""
+        self._finished[id(window)] = items
+
+    def ready(self) -> Generator[Dict[str, Any], None, None]:
+        """Yield the items of completed windows that are next in time order."""
+        while self._pending and id(self._pending[0]) in self._finished:
+            window = self._pending.pop(0)
+            yield from self._finished.pop(id(window))
+
+    def scan_window(self, window: TimeWindow, fetch: PageFetcher) -> Tuple[str, Any]:
+        """
+        Page through one window, or decide to split it.
+
+        Returns:
+            ("split", [windows]) or ("items", [raw items owned by the window])
+        """
+        last_index = self.max_pages_per_window - 1
+        probe = fetch(self.page_params(window, last_index))
+        if self.should_split(window, probe):
+            return "split", window.split()
+
+        items: List[Dict[str, Any]] = []
+        for index in range(last_index):
+            data = fetch(self.page_params(window, index))
+            items.extend(data.get("items", []))
+            if not data.get("has_more") or not data.get("items"):
+                return "items", self.owned_items(window, items)
+
+        # The probe was the last page, unless the window could not be split further
+        items.extend(probe.get("items", []))
+        index = last_index
+        data = probe
+        while data.get("has_more") and data.get("items"):
+            index += 1
+            data = fetch(self.page_params(window, index))
+            items.extend(data.get("items", []))
+        return "items", self.owned_items(window, items)
+
+    async def scan_window_async(self, window: TimeWindow, fetch: AsyncPageFetcher) -> Tuple[str, Any]:
+        """Asynchronous version of `scan_window`."""
+        last_index = self.max_pages_per_window - 1
+        probe = await fetch(self.page_params(window, last_index))
+        if self.should_split(window, probe):
+            return "split", window.split()
+
+        items: List[Dict[str, Any]] = []
+        for index in range(last_index):
+            data = await fetch(self.page_params(window, index))
+            items.extend(data.get("items", []))
+            if not data.get("has_more") or not data.get("items"):
+                return "items", self.owned_items(window, items)
+
+        items.extend(probe.get("items", []))
+        index = last_index
+        data = probe
+        while data.get("has_more") and data.get("items"):
+            index += 1
+            data = await fetch(self.page_params(window, index))
+            items.extend(data.get("items", []))
+        return "items", self.owned_items(window, items)
+
+    def run(self, fetch: PageFetcher, max_workers: int = 8) -> Generator[Dict[str, Any], None, None]:
+        """Scan on a thread pool, yielding raw items in creation order."""
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="airwallex-scan")
+        running: Dict[Future, TimeWindow] = {}
+        try:
+            for window in self.windows:
+                running[executor.submit(self.scan_window, window, fetch)] = window
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    window = running.pop(future)
+                    outcome, result = future.result()
+                    if outcome == "split":
+                        self.replace(window, result)
+                        for child in result:
+                            running[executor.submit(self.scan_window, child, fetch)] = child
+                    else:
+                        self.finish(window, result)
+                yield from self.ready()
+        finally:
+            for future in running:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    async def run_async(
+        self,
+        fetch: AsyncPageFetcher,
+        max_concurrency: int = 8
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Scan with asyncio tasks, yielding raw items in creation order."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def scan(window: TimeWindow) -> Tuple[str, Any]:
+            async with semaphore:
+                return await self.scan_window_async(window, fetch)
+
+        running: Dict["asyncio.Task[Tuple[str, Any]]", TimeWindow] = {
+            asyncio.ensure_future(scan(window)): window for window in self.windows
+        }
+        try:
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    window = running.pop(task)
+                    outcome, result = task.result()
+                    if outcome == "split":
+                        self.replace(window, result)
+                        for child in result:
+                            running[asyncio.ensure_future(scan(child))] = child
+                    else:
+                        self.finish(window, result)
+                for item in self.ready():
+                    yield item
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
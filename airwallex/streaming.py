@@ -0,0 +1,136 @@
+"""
+Incremental decoding of paginated list responses.
+
+``response.json()`` needs the whole body in memory before the first item can
+be used, and then holds the body, the decoded dicts and the built models at the
+same time. ``ItemsDecoder`` is fed the body chunk by chunk and returns each
+element of the top-level ``items`` array as soon as it is complete, so only one
+item (plus one network chunk) is held at a time. The other top-level fields,
+such as ``has_more``, are collected in ``metadata``.
+"""
+import codecs
+import json
+import re
+from typing import Any, Dict, List
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DELIMITERS = frozenset(" \t\n\r,:]}")
+
+# Buffered text already parsed is dropped once it grows past this many characters
+_COMPACT_THRESHOLD = 64 * 1024
+
+# Parser states
+_START, _KEY, _COLON, _VALUE, _ITEMS_OPEN, _ITEM_OR_END, _ITEM, _ITEM_SEPARATOR, _VALUE_SEPARATOR, _DONE = range(10)
+
+
+class ItemsDecoder:
+    """
+    Push parser for ``{"items": [...], ...}`` response bodies.
+
+    Call ``feed`` with each chunk of the body and ``close`` after the last one;
+    both return the items completed so far.
+    """
+
+    def __init__(self, items_key: str = "items") -> None:
+        self.items_key = items_key
+        self.metadata: Dict[str, Any] = {}
+        self._decoder = json.JSONDecoder()
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _START
+        self._key = ""
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Add a chunk of the body, returning the items it completed."""
+        self._buffer += self._text.decode(chunk)
+        return self._parse(final=False)
+
+    def close(self) -> List[Any]:
+        """Finish the body, returning any remaining items."""
+        self._buffer += self._text.decode(b"", final=True)
+        items = self._parse(final=True)
+        if self._state != _DONE:
+            raise ValueError("Response body ended before the JSON object was complete")
+        return items
+
+    def _expect(self, char: str) -> None:
+        if self._buffer[self._pos] != char:
+            raise ValueError(
+                f"Expected {char!r} at position {self._pos} of the response, found {self._buffer[self._pos]!r}"
+            )
+        self._pos += 1
+
+    def _decode_value(self, final: bool) -> Any:
+        """Decode the JSON value at the current position, or raise EOFError if it may be incomplete."""
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            raise EOFError
+        # A number at the end of the buffer, or cut before its fraction or exponent
+        # ("10" of "10.5"), may continue in the next chunk
+        if not final and (end == len(self._buffer) or self._buffer[end] not in _DELIMITERS):
+            raise EOFError
+        self._pos = end
+        return value
+
+    def _parse(self, final: bool) -> List[Any]:
+        items: List[Any] = []
+        buffer = self._buffer
+        while True:
+            self._pos = _WHITESPACE.match(buffer, self._pos).end()
+            if self._pos == len(buffer) or self._state == _DONE:
+                break
+            char = buffer[self._pos]
+            try:
+                if self._state == _START:
+                    self._expect("{")
+                    self._state = _KEY
+                elif self._state == _KEY:
+                    if char == "}":
+                        self._pos += 1
+                        self._state = _DONE
+                    else:
+                        self._key = self._decode_value(final)
+                        self._state = _COLON
+                elif self._state == _COLON:
+                    self._expect(":")
+                    self._state = _ITEMS_OPEN if self._key == self.items_key else _VALUE
+                elif self._state == _ITEMS_OPEN:
+                    if char == "[":
+                        self._pos += 1
+                        self._state = _ITEM_OR_END
+                    else:
+                        self._state = _VALUE
+                elif self._state == _ITEM_OR_END and char == "]":
+                    self._pos += 1
+                    self._state = _VALUE_SEPARATOR
+                elif self._state in (_ITEM_OR_END, _ITEM):
+                    items.append(self._decode_value(final))
+                    self._state = _ITEM_SEPARATOR
+                elif self._state == _ITEM_SEPARATOR:
+                    if char == "]":
+                        self._pos += 1
+                        self._state = _VALUE_SEPARATOR
+                    else:
+                        self._expect(",")
+                        self._state = _ITEM
+                elif self._state == _VALUE:
+                    self.metadata[self._key] = self._decode_value(final)
+                    self._state = _VALUE_SEPARATOR
+                elif self._state == _VALUE_SEPARATOR:
+                    if char == "}":
+                        self._pos += 1
+                        self._state = _DONE
+                    else:
+                        self._expect(",")
+                        self._state = _KEY
+            except EOFError:
+                break
+
+        if self._pos > _COMPACT_THRESHOLD:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        return items
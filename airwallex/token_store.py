@@ -0,0 +1,153 @@
+"""
+Token stores for sharing access tokens between clients.
+
+By default every client logs in on its own. Passing a token store lets several
+clients - threads in one process, or worker processes on one host - share a
+single access token and refresh it cooperatively: whoever finds the token
+expired takes the store's lock, logs in and saves the new token, and everyone
+else picks it up from the store instead of logging in again.
+"""
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Iterator, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+
+class TokenStore:
+    """
+    Interface for token stores.
+    
+    Entries are keyed by an opaque string derived from the client credentials.
+    ``acquire``/``release`` guard the login so only one client refreshes a
+    given token at a time.
+    """
+    
+    def load(self, key: str) -> Optional[Tuple[str, datetime]]:
+        """Return the stored ``(token, expires_at)`` for ``key``, if any."""
+        raise NotImplementedError
+    
+    def save(self, key: str, token: str, expires_at: datetime) -> None:
+        """Store a token for ``key``. Called while holding the lock for ``key``."""
+        raise NotImplementedError
+    
+    def acquire(self, key: str, blocking: bool = True) -> bool:
+        """Take the refresh lock for ``key``. Returns False if non-blocking and busy."""
+        raise NotImplementedError
+    
+    def release(self, key: str) -> None:
+        """Release the refresh lock for ``key``."""
+        raise NotImplementedError
+    
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """Hold the refresh lock for ``key`` for the duration of the block."""
+        self.acquire(key)
+        try:
+            yield
+        finally:
+            self.release(key)
+
+
+class MemoryTokenStore(TokenStore):
+    """Share tokens between clients in the same process."""
+    
+    def __init__(self) -> None:
+        self._tokens: Dict[str, Tuple[str, datetime]] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+    
+    def load(self, key: str) -> Optional[Tuple[str, datetime]]:
+        return self._tokens.get(key)
+    
+    def save(self, key: str, token: str, expires_at: datetime) -> None:
+        self._tokens[key] = (token, expires_at)
+    
+    def acquire(self, key: str, blocking: bool = True) -> bool:
+        with self._guard:
+            lock = self._locks.setdefault(key, threading.Lock())
+        return lock.acquire(blocking)
+    
+    def release(self, key: str) -> None:
+        self._locks[key].release()
+
+
+class FileTokenStore(TokenStore):
+    """
+    Share tokens between processes on the same host through a JSON file.
+    
+    Refreshes are serialised with an OS-level lock (``flock`` on POSIX,
+    ``msvcrt.locking`` on Windows) on a sibling ``.lock`` file, and the token
+    file is replaced atomically so readers never see a partial write. The file
+    holds live credentials and is created readable by the owner only.
+    
+    Args:
+        path: Location of the token file, e.g. ``/run/myapp/airwallex-token.json``.
+    """
+    
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.lock_path = f"{path}.lock"
+        self._held: Dict[str, int] = {}
+    
+    def _read(self) -> Dict[str, Dict[str, str]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+    
+    def load(self, key: str) -> Optional[Tuple[str, datetime]]:
+        entry = self._read().get(key)
+        if not entry:
+            return None
+        return entry["token"], datetime.fromisoformat(entry["expires_at"])
+    
+    def save(self, key: str, token: str, expires_at: datetime) -> None:
+        data = self._read()
+        data[key] = {"token": token, "expires_at": expires_at.isoformat()}
+        
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".airwallex-token-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    
+    def acquire(self, key: str, blocking: bool = True) -> bool:
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:  # pragma: no cover - Windows
+                msvcrt.locking(fd, msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+        except OSError:
+            os.close(fd)
+            if blocking:
+                raise
+            return False
+        # The lock file is shared by all keys, so at most one entry is ever held
+        self._held[key] = fd
+        return True
+    
+    def release(self, key: str) -> None:
+        fd = self._held.pop(key)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:  # pragma: no cover - Windows
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
@@ -3,10 +3,16 @@ Utility functions for the Airwallex SDK.
 """
 import re
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, List, Union, TypeVar
 
 T = TypeVar('T')
 
+_WORD_BOUNDARY = re.compile(r'(?<!^)(?=[A-Z])')
+
+# API responses reuse a small vocabulary of keys, so conversions are memoized
+KEY_CACHE_SIZE = 4096
+
 
 def snake_to_pascal_case(snake_str: str) -> str:
     """Convert snake_case to PascalCase."""
@@ -15,21 +21,60 @@ def snake_to_pascal_case(snake_str: str) -> str:
 
 def pascal_to_snake_case(pascal_str: str) -> str:
     """Convert PascalCase to snake_case."""
-    return re.sub(r'(?<!^)(?=[A-Z])', '_', pascal_str).lower()
+    return _WORD_BOUNDARY.sub('_', pascal_str).lower()
 
 
+@lru_cache(maxsize=KEY_CACHE_SIZE)
 def camel_to_snake_case(camel_str: str) -> str:
     """Convert camelCase to snake_case."""
-    pattern = re.compile(r'(?<!^)(?=[A-Z])')
-    return pattern.sub('_', camel_str).lower()
+    return _WORD_BOUNDARY.sub('_', camel_str).lower()
 
 
+@lru_cache(maxsize=KEY_CACHE_SIZE)
 def snake_to_camel_case(snake_str: str) -> str:
     """Convert snake_case to camelCase."""
     components = snake_str.split('_')
     return components[0] + ''.join(x.title() for x in components[1:])
 
 
+# Fields holding one of a small set of codes, by exact name or "_"-suffix (e.g. "billing_currency")
+CODE_FIELD_NAMES = ("currency", "status", "type", "country")
+
+
+def is_code_field(name: str) -> bool:
+    """Whether a field, by its name, holds one of a small set of codes such as a currency or status."""
+    return any(name == code or name.endswith('_' + code) for code in CODE_FIELD_NAMES)
+
+
+def endpoint_path(url: str) -> str:
+    """
+    Return the API path of a request URL relative to the API version prefix.
+    
+    e.g. "/api/v1/issuing/cards/abc?x=1" -> "issuing/cards/abc"
+    """
+    path = url.split('?', 1)[0]
+    if '://' in path:
+        path = '/' + path.split('://', 1)[1].partition('/')[2]
+    return re.sub(r'^/?api/v\d+/', '', path).strip('/')
+
+
+# Top-level path segments that group several resources, e.g. issuing/cards
+NAMESPACED_PATHS = frozenset({'issuing', 'pa', 'simulation'})
+
+
+def endpoint_family(url: str) -> str:
+    """
+    Return the resource family of a request URL, without resource IDs or actions.
+    
+    e.g. "/api/v1/issuing/authorizations/abc" -> "issuing/authorizations",
+    "/api/v1/payments/abc/cancel" -> "payments"
+    """
+    segments = endpoint_path(url).split('/')
+    if segments[0] in NAMESPACED_PATHS and len(segments) > 1:
+        return '/'.join(segments[:2])
+    return segments[0]
+
+
 def serialize(data: Union[Dict[str, Any], List[Dict[str, Any]]]) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
     """
     Serialize data for the Airwallex API.
@@ -0,0 +1,187 @@
+"""
+Local stand-in for the Airwallex API used by the benchmarks.
+
+The server speaks HTTP/1.1 with keep-alive, answers the login endpoint and
+returns canned JSON for everything else. It counts accepted TCP connections
+and can add a fixed delay to each new connection to emulate the round-trips
+of a TCP + TLS handshake to a remote host.
+"""
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional
+
+LOGIN_PATH = "/api/v1/authentication/login"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self) -> None:
+        super().setup()
+        server = self.server
+        with server.lock:
+            server.connections += 1
+        if server.handshake_delay:
+            time.sleep(server.handshake_delay)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _reply(self, status: int, body: Any) -> None:
+        payload = body if isinstance(body, bytes) else json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _handle(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        server = self.server
+        with server.lock:
+            server.requests += 1
+        if server.response_delay:
+            time.sleep(server.response_delay)
+        if self.path.startswith(LOGIN_PATH):
+            with server.lock:
+                server.logins += 1
+            expires_at = datetime.now(timezone.utc) + timedelta(minutes=30)
+            self._reply(201, {"token": "bench_token", "expires_at": expires_at.isoformat()})
+            return
+        status, body = server.route(self.command, self.path)
+        self._reply(status, body)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+
+class StandInServer:
+    """
+    Run the stand-in API on a background thread.
+
+    Args:
+        route: Callable mapping (method, path) to (status, JSON body or bytes).
+        handshake_delay: Seconds to stall each new connection.
+        response_delay: Seconds to stall each response.
+    """
+
+    def __init__(
+        self,
+        route: Optional[Callable[[str, str], Any]] = None,
+        handshake_delay: float = 0.0,
+        response_delay: float = 0.0,
+    ) -> None:
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.request_queue_size = 1024
+        self._httpd.lock = threading.Lock()
+        self._httpd.route = route or (lambda method, path: (200, {"ok": True}))
+        self._httpd.handshake_delay = handshake_delay
+        self._httpd.response_delay = response_delay
+        self.reset()
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    @property
+    def auth_url(self) -> str:
+        return self.base_url.rstrip("/") + LOGIN_PATH
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "connections": self._httpd.connections,
+            "requests": self._httpd.requests,
+            "logins": self._httpd.logins,
+        }
+
+    def reset(self) -> None:
+        self._httpd.connections = 0
+        self._httpd.requests = 0
+        self._httpd.logins = 0
+
+    def __enter__(self) -> "StandInServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+async def _serve_async(port: int, response_delay: float, ready) -> None:
+    """Minimal asyncio HTTP/1.1 keep-alive server answering ``{"ok": true}``."""
+    import asyncio
+
+    body = b'{"ok": true}'
+    reply = (
+        b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+        b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+    )
+
+    async def handle(reader, writer) -> None:
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        await reader.readexactly(int(line.split(b":")[1]))
+                if response_delay:
+                    await asyncio.sleep(response_delay)
+                writer.write(reply)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", port, backlog=2048)
+    ready.set()
+    async with server:
+        await server.serve_forever()
+
+
+def _run_async(port: int, response_delay: float, ready) -> None:
+    import asyncio
+
+    asyncio.run(_serve_async(port, response_delay, ready))
+
+
+class SubprocessStandInServer:
+    """
+    Asyncio stand-in in a separate process, for load tests.
+
+    Running the server out of process keeps it from competing with the client
+    for the GIL, and asyncio keeps hundreds of open connections cheap.
+    """
+
+    def __init__(self, response_delay: float = 0.0, target: Optional[Callable] = None) -> None:
+        import multiprocessing
+        import socket
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            self.port = sock.getsockname()[1]
+        self._ready = multiprocessing.Event()
+        self._process = multiprocessing.Process(
+            target=target or _run_async, args=(self.port, response_delay, self._ready), daemon=True
+        )
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}/"
+
+    def __enter__(self) -> "SubprocessStandInServer":
+        self._process.start()
+        if not self._ready.wait(timeout=10):
+            raise RuntimeError("stand-in server did not start")
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._process.terminate()
+        self._process.join()
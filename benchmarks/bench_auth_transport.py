@@ -0,0 +1,64 @@
+"""
+Benchmark: login over a throwaway httpx client vs. the client's pooled transport.
+
+Every login used to build (and tear down) its own httpx client, paying a fresh
+connection handshake each time. Logins now reuse the client's keep-alive pool.
+The stand-in server stalls every new connection by ``--handshake-ms`` to model
+the TCP + TLS round-trips to the real API.
+
+    python benchmarks/bench_auth_transport.py --logins 50 --handshake-ms 40
+"""
+import argparse
+import os
+import sys
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from airwallex import AirwallexClient  # noqa: E402
+from _server import StandInServer  # noqa: E402
+
+
+def throwaway_login(client: AirwallexClient) -> None:
+    """The previous behaviour: a new httpx client per login."""
+    with httpx.Client(timeout=client.request_timeout) as auth_client:
+        response = auth_client.post(client.auth_url, headers=client._auth_headers())
+        client._handle_auth_response(response)
+
+
+def pooled_login(client: AirwallexClient) -> None:
+    """The current behaviour: login through the client's connection pool."""
+    client._login()
+
+
+def run(server: StandInServer, login, logins: int) -> None:
+    server.reset()
+    with AirwallexClient(
+        client_id="bench", api_key="bench", base_url=server.base_url, auth_url=server.auth_url
+    ) as client:
+        start = time.perf_counter()
+        for _ in range(logins):
+            login(client)
+        elapsed = time.perf_counter() - start
+    stats = server.stats
+    print(
+        f"{login.__name__:<16} logins={stats['logins']:<5} connections={stats['connections']:<5} "
+        f"total={elapsed * 1000:8.1f} ms  per-login={elapsed / logins * 1000:6.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--logins", type=int, default=50)
+    parser.add_argument("--handshake-ms", type=float, default=40.0)
+    args = parser.parse_args()
+
+    with StandInServer(handshake_delay=args.handshake_ms / 1000) as server:
+        run(server, throwaway_login, args.logins)
+        run(server, pooled_login, args.logins)
+
+
+if __name__ == "__main__":
+    main()
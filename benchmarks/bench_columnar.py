@@ -0,0 +1,66 @@
+"""
+Benchmark: DataFrames from models vs. columnar decoding of listing pages.
+
+Reporting code used to build a DataFrame by validating every item into a model
+and copying its fields out again. ``ColumnarDecoder`` decodes the raw items of
+each page straight into typed NumPy arrays, which convert to pandas without
+per-row objects. Requires numpy and pandas.
+
+    python benchmarks/bench_columnar.py --items 1000 --pages 10 --repeat 3
+"""
+import argparse
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pandas as pd  # noqa: E402
+
+from airwallex.columnar import ColumnarBatch, ColumnarDecoder  # noqa: E402
+from airwallex.models.issuing_transaction import Transaction  # noqa: E402
+from bench_key_conversion import make_page  # noqa: E402
+
+Page = List[Dict[str, Any]]
+
+
+def via_models(pages: List[Page]) -> pd.DataFrame:
+    rows = [Transaction.from_api_response(item).model_dump() for page in pages for item in page]
+    return pd.json_normalize(rows)
+
+
+def via_columns(pages: List[Page], amounts: str) -> pd.DataFrame:
+    decoder = ColumnarDecoder(Transaction, amounts=amounts)
+    return ColumnarBatch.concat(decoder.decode(page) for page in pages).to_pandas()
+
+
+def timed(label: str, build: Callable[[], pd.DataFrame], rows: int, repeat: int) -> float:
+    build()  # warm up
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        frame = build()
+        best = min(best, time.perf_counter() - start)
+    memory = frame.memory_usage(deep=True).sum() / 2**20
+    print(f"{label:<22} rows/s={rows / best:10.0f}  per-row={best / rows * 1e6:6.2f} us  frame={memory:7.1f} MiB")
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=1000, help="items per page")
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    pages = [make_page(args.items) for _ in range(args.pages)]
+    rows = args.items * args.pages
+    baseline = timed("models -> DataFrame", lambda: via_models(pages), rows, args.repeat)
+    for amounts in ("float", "minor_units"):
+        best = timed(f"columnar ({amounts})", lambda: via_columns(pages, amounts), rows, args.repeat)
+        print(f"{'':<22} speedup={baseline / best:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
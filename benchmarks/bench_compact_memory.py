@@ -0,0 +1,79 @@
+"""
+Benchmark: memory held by listing results as models vs. compact records.
+
+Each page is decoded from JSON bytes, built into results and dropped, as in a
+real listing, and the memory still allocated once every page has been read is
+reported per item (timings include the tracing overhead). Compared are
+validated and trusted models and the ``compact=True`` records built from the
+same data.
+
+    python benchmarks/bench_compact_memory.py --items 100000 --page-size 1000
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Type
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from airwallex.models import AirwallexModel  # noqa: E402
+from airwallex.models.compact import compact_record_class  # noqa: E402
+from airwallex.models.issuing_authorization import Authorization  # noqa: E402
+from airwallex.models.issuing_transaction import Transaction  # noqa: E402
+from bench_trusted_decode import make_authorizations, make_transactions  # noqa: E402
+
+
+def measure(label: str, pages: List[bytes], build: Callable[[Dict[str, Any]], Any]) -> None:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    results: List[Any] = []
+    for page in pages:
+        items = json.loads(page)
+        results.extend(build(item) for item in items)
+        del items
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    count = len(results)
+    print(
+        f"{label:<40} bytes/item={held / count:7.0f}  total={held / 2**20:8.1f} MiB  "
+        f"per-item={elapsed / count * 1e6:6.2f} us"
+    )
+
+
+def run(model_class: Type[AirwallexModel], pages: List[bytes]) -> None:
+    record_class = compact_record_class(model_class)
+    name = model_class.__name__
+    measure(f"{name} from_api_response", pages, model_class.from_api_response)
+    measure(f"{name} from_trusted_api_response", pages, model_class.from_trusted_api_response)
+    measure(f"{record_class.__name__} (validated)", pages, record_class.from_api_response)
+    measure(f"{record_class.__name__} (trusted)", pages, record_class.from_trusted_api_response)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=100000)
+    parser.add_argument("--page-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    page_count = max(1, args.items // args.page_size)
+    for model_class, make in ((Transaction, make_transactions), (Authorization, make_authorizations)):
+        # Distinct IDs on every page, like a real listing
+        pages = [
+            json.dumps([
+                {**item, "transaction_id": f"txn_{number}_{index}", "lifecycle_id": f"lc_{number}_{index}"}
+                for index, item in enumerate(make(args.page_size))
+            ]).encode()
+            for number in range(page_count)
+        ]
+        run(model_class, pages)
+
+
+if __name__ == "__main__":
+    main()
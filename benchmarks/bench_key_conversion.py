@@ -0,0 +1,124 @@
+"""
+Benchmark: per-item cost of decoding a 1000-item issuing/transactions page.
+
+Response keys used to be converted to snake_case with a regex compiled on every
+call, once in ``from_api_response`` and again in the model's before-validator,
+recursing into nested models that then converted their keys a third time. Keys
+are now looked up in alias tables built once per model class, falling back to a
+memoized conversion, and each model converts only its own level.
+
+    python benchmarks/bench_key_conversion.py --items 1000 --repeat 5
+"""
+import argparse
+import os
+import re
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from airwallex.models.issuing_transaction import Transaction  # noqa: E402
+
+
+def make_page(items: int) -> List[Dict[str, Any]]:
+    """A page of issuing transactions shaped like the API's, with camelCase keys mixed in."""
+    return [
+        {
+            "acquiringInstitutionIdentifier": "123456",
+            "authCode": "A1B2C3",
+            "billing_amount": 12.5 + i,
+            "billing_currency": "USD",
+            "card_id": f"card_{i % 50}",
+            "cardNickname": "Travel",
+            "lifecycle_id": f"lc_{i}",
+            "masked_card_number": "************4242",
+            "matched_authorizations": [f"auth_{i}"],
+            "merchant": {
+                "categoryCode": "5814",
+                "city": "Melbourne",
+                "country": "AU",
+                "identifier": "M123",
+                "name": "Coffee",
+                "postcode": "3000",
+                "state": "VIC",
+            },
+            "network_transaction_id": f"ntx_{i}",
+            "postedDate": "2025-01-02T00:00:00Z",
+            "retrieval_ref": f"rr_{i}",
+            "riskDetails": {"riskActionsPerformed": ["NONE"], "riskFactors": [], "threeDsecureOutcome": "PASSED"},
+            "status": "APPROVED",
+            "transaction_amount": 12.5 + i,
+            "transaction_currency": "USD",
+            "transactionDate": "2025-01-01T00:00:00Z",
+            "transaction_id": f"txn_{i}",
+            "transaction_type": "CLEARING",
+        }
+        for i in range(items)
+    ]
+
+
+def legacy_convert(data: Any) -> Any:
+    """The previous key conversion: a fresh regex per key, recursing into every dict."""
+    if not isinstance(data, dict):
+        return data
+    result = {}
+    for key, value in data.items():
+        snake_key = re.compile(r'(?<!^)(?=[A-Z])').sub('_', key).lower()
+        if isinstance(value, dict):
+            result[snake_key] = legacy_convert(value)
+        elif isinstance(value, list) and all(isinstance(item, dict) for item in value):
+            result[snake_key] = [legacy_convert(item) for item in value]
+        else:
+            result[snake_key] = value
+    return result
+
+
+def legacy_keys(page: List[Dict[str, Any]]) -> None:
+    for item in page:
+        legacy_convert(item)
+
+
+def table_keys(page: List[Dict[str, Any]]) -> None:
+    for item in page:
+        Transaction._convert_keys_to_snake_case(item)
+
+
+def legacy_decode(page: List[Dict[str, Any]]) -> None:
+    # Pre-conversion as the old from_api_response did, then the model's own validators
+    for item in page:
+        Transaction.model_validate(legacy_convert(item))
+
+
+def table_decode(page: List[Dict[str, Any]]) -> None:
+    for item in page:
+        Transaction.from_api_response(item)
+
+
+def run(name: str, func: Callable[[List[Dict[str, Any]]], None], page: List[Dict[str, Any]], repeat: int) -> None:
+    func(page)  # warm up caches and validators
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(page)
+        best = min(best, time.perf_counter() - start)
+    print(f"{name:<14} page={best * 1000:8.2f} ms  per-item={best / len(page) * 1e6:7.2f} us")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    page = make_page(args.items)
+    print("key conversion only:")
+    run("legacy_keys", legacy_keys, page, args.repeat)
+    run("table_keys", table_keys, page, args.repeat)
+    print("full from_api_response:")
+    run("legacy_decode", legacy_decode, page, args.repeat)
+    run("table_decode", table_decode, page, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Benchmark: async throughput as concurrency rises, for different pool settings.
+
+Each level fires ``level x --rounds`` GETs with at most N in flight against a
+local stand-in server that takes ``--latency-ms`` to answer. With httpx's default
+limits (100 connections) throughput stops scaling at 100 in-flight requests;
+raising ``max_connections`` lets it keep going.
+
+Raising ``max_keepalive_connections`` as well is slower, not faster: httpcore
+checks every pooled connection against the whole pool each time a request
+enters or leaves it, so the cost per request grows with the square of the idle
+connections kept. The last row shows this; it is worst where the client, not
+the server, is the bottleneck (e.g. c=50 on a single core).
+
+``--http2`` serves the stand-in over cleartext HTTP/2 (requires ``h2`` and
+``hypercorn``) so every request multiplexes over a single connection and the
+pool stays at one connection. The server differs from the HTTP/1.1 stand-in,
+so compare the shape of the two runs rather than their absolute numbers.
+
+    python benchmarks/bench_pool_concurrency.py
+    python benchmarks/bench_pool_concurrency.py --http2
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from airwallex import AirwallexAsyncClient  # noqa: E402
+from _server import SubprocessStandInServer  # noqa: E402
+
+LEVELS = (1, 10, 50, 100, 250, 500)
+
+POOLS: Dict[str, Dict[str, Any]] = {
+    "default pool": {},
+    "tuned pool": {"max_connections": 500},
+    "500 keep-alive": {"max_connections": 500, "max_keepalive_connections": 500, "keepalive_expiry": 30},
+}
+
+
+def _run_http2(port: int, latency: float, ready) -> None:
+    """Serve the stand-in over cleartext HTTP/2 with hypercorn."""
+    from hypercorn.asyncio import serve
+    from hypercorn.config import Config
+
+    async def app(scope, receive, send):
+        if scope["type"] != "http":
+            return
+        await asyncio.sleep(latency)
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": [(b"content-type", b"application/json")]})
+        await send({"type": "http.response.body", "body": b'{"ok": true}'})
+
+    config = Config()
+    config.bind = [f"127.0.0.1:{port}"]
+    config.h2_max_concurrent_streams = 1000
+    # Hypercorn sends GOAWAY after 1000 requests on a connection by default,
+    # failing the streams still in flight on it
+    config.keep_alive_max_requests = 2**31
+    ready.set()
+    asyncio.run(serve(app, config))
+
+
+async def measure(client: AirwallexAsyncClient, concurrency: int, requests: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with semaphore:
+            await client._request("GET", "/api/v1/accounts")
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return requests / (time.perf_counter() - start)
+
+
+async def run_pool(name: str, options: Dict[str, Any], base_url: str, args: argparse.Namespace) -> None:
+    client = AirwallexAsyncClient(client_id="bench", api_key="bench", base_url=base_url, **options)
+    # The stand-in may not implement login; authentication isn't what's measured
+    client._token = "bench_token"
+    client._token_expiry = datetime.now(timezone.utc) + timedelta(hours=1)
+    if args.http2:
+        # httpx only negotiates HTTP/2 over TLS; use prior knowledge for cleartext
+        await client._client.aclose()
+        client._client = httpx.AsyncClient(**{**client._http_client_options(), "http1": False, "http2": True})
+    try:
+        row = []
+        for level in LEVELS:
+            row.append(await measure(client, level, max(args.requests, level * args.rounds)))
+        print(f"{name:<14}" + "".join(f"{rps:>10.0f}" for rps in row))
+    finally:
+        await client.close()
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    latency = args.latency_ms / 1000
+    server = SubprocessStandInServer(latency, target=_run_http2 if args.http2 else None)
+    with server:
+        print(f"{'req/s':<14}" + "".join(f"{'c=' + str(level):>10}" for level in LEVELS))
+        pools = {"http2": {"http2": True}} if args.http2 else POOLS
+        for name, options in pools.items():
+            await run_pool(name, options, server.base_url, args)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100, help="minimum requests per level")
+    parser.add_argument("--rounds", type=int, default=5, help="requests per level = level x rounds")
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--http2", action="store_true")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
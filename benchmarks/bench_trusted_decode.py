@@ -0,0 +1,90 @@
+"""
+Benchmark: validated vs. trusted decoding of listing pages.
+
+``from_api_response`` runs full pydantic validation on every item. Clients
+created with ``trusted_decode=True`` build models with
+``from_trusted_api_response`` instead: keys are converted, nested models built
+and timestamps parsed, but nothing else is checked.
+
+    python benchmarks/bench_trusted_decode.py --items 1000 --repeat 5
+"""
+import argparse
+import os
+import sys
+import time
+from typing import Any, Dict, List, Type
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from airwallex.models import AirwallexModel  # noqa: E402
+from airwallex.models.financial_transaction import FinancialTransaction  # noqa: E402
+from airwallex.models.issuing_authorization import Authorization  # noqa: E402
+from airwallex.models.issuing_transaction import Transaction  # noqa: E402
+from bench_key_conversion import make_page as make_transactions  # noqa: E402
+
+
+def make_authorizations(items: int) -> List[Dict[str, Any]]:
+    page = make_transactions(items)
+    for item in page:
+        item["create_time"] = item.pop("transactionDate")
+        item["expiry_date"] = "2025-01-08T00:00:00Z"
+    return page
+
+
+def make_financial_transactions(items: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": f"ft_{i}",
+            "amount": 100.0 + i,
+            "net": 99.0 + i,
+            "fee": 1.0,
+            "currency": "USD",
+            "status": "SETTLED",
+            "batch_id": "batch_1",
+            "client_rate": 1.0,
+            "currency_pair": "USDUSD",
+            "source_id": f"src_{i}",
+            "source_type": "PAYMENT",
+            "transaction_type": "PAYMENT",
+            "created_at": "2025-01-01T00:00:00Z",
+            "estimated_settled_at": "2025-01-02T00:00:00Z",
+            "settled_at": "2025-01-02T00:00:00Z",
+        }
+        for i in range(items)
+    ]
+
+
+def run(model_class: Type[AirwallexModel], page: List[Dict[str, Any]], repeat: int) -> None:
+    results = {}
+    for mode in ("from_api_response", "from_trusted_api_response"):
+        decode = getattr(model_class, mode)
+        for item in page:  # warm up
+            decode(item)
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for item in page:
+                decode(item)
+            best = min(best, time.perf_counter() - start)
+        results[mode] = best
+        print(
+            f"{model_class.__name__:<22} {mode:<27} items/s={len(page) / best:10.0f}  "
+            f"per-item={best / len(page) * 1e6:7.2f} us"
+        )
+    speedup = results["from_api_response"] / results["from_trusted_api_response"]
+    print(f"{model_class.__name__:<22} speedup={speedup:.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    run(Transaction, make_transactions(args.items), args.repeat)
+    run(Authorization, make_authorizations(args.items), args.repeat)
+    run(FinancialTransaction, make_financial_transactions(args.items), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
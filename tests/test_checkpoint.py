@@ -0,0 +1,139 @@
+"""
+Tests for resumable pagination with checkpoints.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+import httpx
+
+from airwallex import AirwallexClient, AirwallexAsyncClient, JSONFileCheckpointStore, SQLiteCheckpointStore
+
+from test_pagination import listing_handler, listing_page
+
+
+class CheckpointTestMixin:
+    """Shared setup creating one of each checkpoint store in a temporary directory."""
+    
+    def make_stores(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        sqlite_store = SQLiteCheckpointStore(os.path.join(directory.name, "checkpoints.db"))
+        self.addCleanup(sqlite_store.close)
+        return [JSONFileCheckpointStore(os.path.join(directory.name, "checkpoints.json")), sqlite_store]
+
+
+class TestCheckpointStores(CheckpointTestMixin, unittest.TestCase):
+    """Tests for the JSON file and SQLite checkpoint stores."""
+    
+    def test_save_load_clear(self):
+        """Test both backends round-trip and clear checkpoints."""
+        for store in self.make_stores():
+            with self.subTest(store=store.__class__.__name__):
+                self.assertIsNone(store.load("key"))
+                store.save("key", {"page_num": 3, "offset": 7})
+                store.save("other", {"page_num": 1, "offset": 0})
+                self.assertEqual(store.load("key"), {"page_num": 3, "offset": 7})
+                store.clear("key")
+                self.assertIsNone(store.load("key"))
+                self.assertEqual(store.load("other"), {"page_num": 1, "offset": 0})
+
+
+class TestResumablePagination(CheckpointTestMixin, unittest.TestCase):
+    """Tests for resuming the sync paginator."""
+    
+    def setUp(self):
+        self.client = AirwallexClient(client_id="test_client_id", api_key="test_api_key")
+        self.client._client = httpx.Client(
+            base_url=self.client.base_url,
+            transport=httpx.MockTransport(lambda request: listing_page(request, total=45))
+        )
+        self.client._token = "test_token"
+        self.client._token_expiry = datetime.now() + timedelta(minutes=30)
+        self.addCleanup(self.client.close)
+    
+    def test_resume_after_interruption(self):
+        """Test an interrupted run resumes at the item it stopped on, with nothing skipped or repeated."""
+        for store in self.make_stores():
+            with self.subTest(store=store.__class__.__name__):
+                seen = []
+                pages = self.client.financial_transaction.paginate(checkpoint=store, page_size=10, currency="USD")
+                for txn in pages:
+                    # Stop while "processing" the 24th item
+                    if len(seen) == 23:
+                        break
+                    seen.append(txn.id)
+                pages.close()
+                
+                # A different filter set does not pick up the checkpoint
+                other = self.client.financial_transaction.paginate(checkpoint=store, page_size=10, currency="EUR")
+                self.assertEqual(next(other).id, "txn_0")
+                other.close()
+                
+                seen.extend(txn.id for txn in self.client.financial_transaction.paginate(
+                    checkpoint=store, page_size=10, currency="USD"
+                ))
+                self.assertEqual(seen, [f"txn_{i}" for i in range(45)])
+                
+                # The finished listing starts over
+                restarted = self.client.financial_transaction.paginate(checkpoint=store, page_size=10, currency="USD")
+                self.assertEqual(next(restarted).id, "txn_0")
+    
+    def test_resume_after_crash_mid_page(self):
+        """Test a run killed mid-page, without closing the paginator, only repeats the item in progress."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, "checkpoints.json")
+        seen = []
+        pages = self.client.financial_transaction.paginate(checkpoint=JSONFileCheckpointStore(path), page_size=10)
+        for txn in pages:
+            seen.append(txn.id)
+            if len(seen) == 24:
+                break
+        # Keep the store as a crash at this point would leave it, before the paginator is closed
+        crashed = os.path.join(directory.name, "crashed.json")
+        shutil.copy(path, crashed)
+        pages.close()
+        
+        resumed = [txn.id for txn in self.client.financial_transaction.paginate(
+            checkpoint=JSONFileCheckpointStore(crashed), page_size=10
+        )]
+        # txn_23 was still being processed, so it is yielded again
+        self.assertEqual(resumed[0], "txn_23")
+        self.assertEqual(seen[:23] + resumed, [f"txn_{i}" for i in range(45)])
+
+
+class TestAsyncResumablePagination(CheckpointTestMixin, unittest.IsolatedAsyncioTestCase):
+    """Tests for resuming the async paginator."""
+    
+    async def test_resume_with_prefetch(self):
+        """Test the async paginator resumes from a checkpoint saved by a prefetching run."""
+        client = AirwallexAsyncClient(client_id="test_client_id", api_key="test_api_key")
+        client._client = httpx.AsyncClient(
+            base_url=client.base_url, transport=httpx.MockTransport(listing_handler(total=45))
+        )
+        client._token = "test_token"
+        client._token_expiry = datetime.now() + timedelta(minutes=30)
+        store = self.make_stores()[1]
+        
+        try:
+            seen = []
+            pages = client.financial_transaction.paginate_async(checkpoint=store, page_size=10, prefetch=3)
+            async for txn in pages:
+                if len(seen) == 17:
+                    break
+                seen.append(txn.id)
+            await pages.aclose()
+            
+            async for txn in client.financial_transaction.paginate_async(checkpoint=store, page_size=10):
+                seen.append(txn.id)
+        finally:
+            await client.close()
+        
+        self.assertEqual(seen, [f"txn_{i}" for i in range(45)])
+
+
+if __name__ == '__main__':
+    unittest.main()
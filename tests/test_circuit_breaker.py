@@ -0,0 +1,91 @@
+"""
+Tests for per-endpoint circuit breakers.
+"""
+import time
+import unittest
+from datetime import datetime, timedelta
+
+import httpx
+
+from airwallex import AirwallexClient, CircuitBreaker, CircuitBreakerRegistry, FixedBackoff
+from airwallex.exceptions import CircuitOpenError
+from airwallex.utils import endpoint_family
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    """Tests for breaker state transitions."""
+    
+    def test_opens_then_probes_then_closes(self):
+        """Test the breaker opens at its threshold and closes after a successful probe."""
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0.05)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, "closed")
+        breaker.record_failure()
+        self.assertEqual(breaker.state, "open")
+        self.assertFalse(breaker.allow())
+        
+        time.sleep(0.06)
+        self.assertEqual(breaker.state, "half_open")
+        self.assertTrue(breaker.allow())
+        # Only one probe at a time
+        self.assertFalse(breaker.allow())
+        breaker.record_success()
+        self.assertEqual(breaker.state, "closed")
+    
+    def test_failed_probe_reopens(self):
+        """Test a failed half-open probe re-opens the circuit."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+        self.assertTrue(breaker.allow())
+        breaker.record_failure()
+        self.assertEqual(breaker.state, "open")
+        self.assertEqual(breaker.times_opened, 2)
+    
+    def test_endpoint_family(self):
+        """Test breakers are keyed by resource family rather than full path."""
+        self.assertEqual(endpoint_family("/api/v1/issuing/cards/abc/details"), "issuing/cards")
+        self.assertEqual(endpoint_family("/api/v1/payments/abc/cancel"), "payments")
+        self.assertEqual(endpoint_family("/api/v1/financial_transactions?page_num=1"), "financial_transactions")
+
+
+class TestClientCircuitBreaker(unittest.TestCase):
+    """Tests for circuit breaking in the sync client."""
+    
+    def test_open_circuit_fails_fast(self):
+        """Test a failing endpoint trips its breaker without affecting other endpoints."""
+        calls = []
+        
+        def handler(request):
+            calls.append(request.url.path)
+            if request.url.path.startswith("/api/v1/issuing"):
+                return httpx.Response(503, json={"code": "service_unavailable"})
+            return httpx.Response(200, json={"ok": True})
+        
+        client = AirwallexClient(
+            client_id="test_client_id",
+            api_key="test_api_key",
+            retry_policy=FixedBackoff(interval=0, max_retries=10),
+            circuit_breaker=CircuitBreakerRegistry(failure_threshold=3, recovery_timeout=60)
+        )
+        client._client = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(handler))
+        client._token = "test_token"
+        client._token_expiry = datetime.now() + timedelta(minutes=30)
+        self.addCleanup(client.close)
+        
+        # Retries stop as soon as the breaker opens, not after max_retries
+        with self.assertRaises(CircuitOpenError) as ctx:
+            client._request("GET", "/api/v1/issuing/cards/abc")
+        self.assertEqual(ctx.exception.endpoint, "issuing/cards")
+        self.assertEqual(len(calls), 3)
+        
+        with self.assertRaises(CircuitOpenError):
+            client._request("GET", "/api/v1/issuing/cards")
+        self.assertEqual(len(calls), 3)
+        
+        self.assertEqual(client._request("GET", "/api/v1/payments").status_code, 200)
+        self.assertEqual(client.circuit_states, {"issuing/cards": "open", "payments": "closed"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,11 +1,15 @@
 """
 Tests for the Airwallex SDK client.
 """
+import asyncio
+import time
 import unittest
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timedelta
 import json
 
+import httpx
+
 from airwallex import AirwallexClient, AirwallexAsyncClient
 from airwallex.exceptions import AuthenticationError, create_exception_from_response
 
@@ -101,6 +105,118 @@ class TestAirwallexClient(unittest.TestCase):
         # Check response
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), {"id": "test_id", "name": "Test Account"})
+    
+    @patch('httpx.Client.post')
+    def test_background_token_refresh(self, mock_post):
+        """Test the token is renewed ahead of expiry on a timer thread."""
+        auth_response = MagicMock()
+        auth_response.status_code = 201
+        auth_response.json.side_effect = lambda: {
+            "token": f"token_{mock_post.call_count}",
+            "expires_at": (datetime.now() + timedelta(seconds=1)).isoformat()
+        }
+        mock_post.return_value = auth_response
+        
+        client = AirwallexClient(
+            client_id=self.client_id,
+            api_key=self.api_key,
+            background_token_refresh=True,
+            token_refresh_skew=0.8
+        )
+        try:
+            client.authenticate()
+            self.assertEqual(client._token, "token_1")
+            
+            # Renewal is due 0.5s in (half the lifetime), well before expiry
+            time.sleep(0.7)
+            self.assertEqual(mock_post.call_count, 2)
+            self.assertEqual(client._token, "token_2")
+        finally:
+            client.close()
+
+
+class TestAirwallexAsyncClient(unittest.IsolatedAsyncioTestCase):
+    """Tests for the AirwallexAsyncClient class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.login_count = 0
+        self.client = AirwallexAsyncClient(client_id="test_client_id", api_key="test_api_key")
+    
+    async def asyncTearDown(self):
+        await self.client.close()
+    
+    def _use_transport(self, handler):
+        """Route API requests through a mock transport."""
+        self.client._client = httpx.AsyncClient(
+            base_url=self.client.base_url,
+            transport=httpx.MockTransport(handler),
+        )
+    
+    def _mock_login(self, token):
+        """Build a slow login stub that counts how often it is called."""
+        async def login(*args, **kwargs):
+            self.login_count += 1
+            # Yield to the event loop so concurrent callers pile up behind the login
+            await asyncio.sleep(0.05)
+            return httpx.Response(201, json={
+                "token": token,
+                "expires_at": (datetime.now() + timedelta(minutes=30)).isoformat()
+            })
+        return login
+    
+    async def test_concurrent_requests_share_one_login(self):
+        """Test 1,000 concurrent requests on a cold client trigger exactly one login."""
+        self._use_transport(lambda request: httpx.Response(200, json={"ok": True}))
+        
+        with patch('httpx.AsyncClient.post', new=self._mock_login("test_token")):
+            responses = await asyncio.gather(
+                *(self.client._request("GET", "/api/v1/test") for _ in range(1000))
+            )
+        
+        self.assertEqual(self.login_count, 1)
+        self.assertTrue(all(response.status_code == 200 for response in responses))
+    
+    async def test_concurrent_401s_share_one_refresh(self):
+        """Test a rejected token is refreshed once no matter how many requests see the 401."""
+        def handler(request):
+            if request.headers["Authorization"] == "Bearer new_token":
+                return httpx.Response(200, json={"ok": True})
+            return httpx.Response(401, json={"code": "credentials_expired"})
+        self._use_transport(handler)
+        
+        # Start with a token the client believes is valid but the API has revoked
+        self.client._token = "old_token"
+        self.client._token_expiry = datetime.now() + timedelta(minutes=30)
+        
+        with patch('httpx.AsyncClient.post', new=self._mock_login("new_token")):
+            responses = await asyncio.gather(
+                *(self.client._request("GET", "/api/v1/test") for _ in range(1000))
+            )
+        
+        self.assertEqual(self.login_count, 1)
+        self.assertTrue(all(response.status_code == 200 for response in responses))
+    
+    async def test_background_token_refresh(self):
+        """Test the token is renewed ahead of expiry by a background task."""
+        self.client.background_token_refresh = True
+        self.client.token_refresh_skew = 0.8
+        
+        async def login(*args, **kwargs):
+            self.login_count += 1
+            return httpx.Response(201, json={
+                "token": f"token_{self.login_count}",
+                "expires_at": (datetime.now() + timedelta(seconds=1)).isoformat()
+            })
+        
+        with patch('httpx.AsyncClient.post', new=login):
+            await self.client.authenticate()
+            self.assertEqual(self.client._token, "token_1")
+            
+            # Renewal is due 0.5s in (half the lifetime), well before expiry
+            await asyncio.sleep(0.7)
+            self.assertEqual(self.login_count, 2)
+            self.assertEqual(self.client._token, "token_2")
 
 
 if __name__ == '__main__':
@@ -0,0 +1,103 @@
+"""
+Tests for pluggable JSON codecs.
+"""
+import json
+import unittest
+from datetime import datetime, timedelta
+
+import httpx
+
+from airwallex import AirwallexClient, ValidationError
+from airwallex.codec import JSONCodec, OrjsonCodec, StdlibJSONCodec, get_codec, orjson
+
+
+class CountingCodec(StdlibJSONCodec):
+    """Stdlib codec that records how often it is used."""
+
+    def __init__(self):
+        self.encoded = []
+        self.decoded = 0
+
+    def dumps(self, obj):
+        self.encoded.append(obj)
+        return super().dumps(obj)
+
+    def decode(self, response):
+        self.decoded += 1
+        return self.loads(response.content)
+
+
+class TestGetCodec(unittest.TestCase):
+    """Tests for resolving the json_codec option."""
+
+    def test_resolution(self):
+        """Test names, instances and the default resolve to codecs."""
+        self.assertIsInstance(get_codec(), StdlibJSONCodec)
+        self.assertIsInstance(get_codec("json"), StdlibJSONCodec)
+        codec = CountingCodec()
+        self.assertIs(get_codec(codec), codec)
+        self.assertIsInstance(get_codec("auto"), JSONCodec)
+        with self.assertRaises(ValueError):
+            get_codec("simplejson")
+
+    def test_stdlib_encoding_matches_httpx(self):
+        """Test the default codec encodes payloads exactly as httpx's json= does."""
+        payload = {"name": "Café ✓", "amount": 10.5, "items": [1, None, True]}
+        request = httpx.Request("POST", "https://example.com", json=payload)
+        self.assertEqual(StdlibJSONCodec().dumps(payload), request.content)
+
+    @unittest.skipUnless(orjson, "orjson is not installed")
+    def test_orjson_round_trip(self):
+        """Test the orjson codec decodes and encodes bytes."""
+        codec = get_codec("orjson")
+        self.assertIsInstance(codec, OrjsonCodec)
+        payload = {"name": "Café ✓", "amount": 10.5}
+        self.assertEqual(codec.loads(codec.dumps(payload)), payload)
+        self.assertEqual(json.loads(codec.dumps(payload)), payload)
+
+
+class TestClientCodec(unittest.TestCase):
+    """Tests for the client's use of its codec."""
+
+    def setUp(self):
+        self.requests = []
+        self.codec = CountingCodec()
+        self.client = AirwallexClient(client_id="test_client_id", api_key="test_api_key", json_codec=self.codec)
+        self.client._token = "test_token"
+        self.client._token_expiry = datetime.now() + timedelta(minutes=30)
+        self.addCleanup(self.client.close)
+
+    def _use_transport(self, handler):
+        def record(request):
+            self.requests.append(request)
+            return handler(request)
+        self.client._client = httpx.Client(base_url=self.client.base_url, transport=httpx.MockTransport(record))
+
+    def test_payloads_and_responses(self):
+        """Test create payloads are encoded and responses decoded with the codec."""
+        self._use_transport(lambda request: httpx.Response(201, json={
+            "id": "ben_1",
+            "name": "Supplier",
+            "type": "BANK_ACCOUNT",
+            "status": "ACTIVE",
+            "created_at": "2025-01-01T00:00:00Z",
+        }))
+        self.client.beneficiary.create({"nickname": "Supplier"})
+        self.assertEqual(self.codec.encoded, [{"nickname": "Supplier"}])
+        self.assertEqual(json.loads(self.requests[0].content), {"nickname": "Supplier"})
+        self.assertEqual(self.requests[0].headers["Content-Type"], "application/json")
+        self.assertEqual(self.codec.decoded, 1)
+
+    def test_error_parsing(self):
+        """Test error bodies are parsed with the codec."""
+        self._use_transport(lambda request: httpx.Response(400, json={
+            "code": "invalid_argument", "message": "bad nickname"
+        }))
+        with self.assertRaises(ValidationError) as caught:
+            self.client._request("POST", "/api/v1/beneficiaries/create", json={"nickname": ""})
+        self.assertEqual(caught.exception.error_message, "bad nickname")
+        self.assertEqual(self.codec.decoded, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
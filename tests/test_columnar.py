@@ -0,0 +1,137 @@
+"""
+Tests for columnar decoding of listings.
+"""
+import unittest
+from unittest.mock import patch
+from datetime import datetime, timedelta
+
+import httpx
+
+from airwallex import AirwallexClient, AirwallexAsyncClient
+from airwallex.columnar import ColumnarBatch, ColumnarDecoder, np, pa, pd
+from airwallex.models.financial_transaction import FinancialTransaction
+from airwallex.models.issuing_transaction import Transaction
+
+from test_lazy import make_issuing_transaction
+from test_pagination import listing_handler, listing_page
+
+
+@unittest.skipUnless(np, "numpy is not installed")
+class TestColumnarDecoder(unittest.TestCase):
+    """Tests for decoding raw items into typed columns."""
+
+    def setUp(self):
+        self.items = [
+            make_issuing_transaction(),
+            make_issuing_transaction(
+                transaction_id="txn_2",
+                billingAmount=1234,
+                billing_currency="JPY",
+                transaction_date="2025-01-01T10:00:00+10:00",
+                postedDate="2025-01-02T00:00:00Z",
+                merchant=None,
+            ),
+            make_issuing_transaction(transaction_id="txn_3", billingAmount=1.5, billing_currency="KWD"),
+        ]
+
+    def test_column_types(self):
+        """Test amounts, timestamps, categoricals and nested fields are decoded to typed arrays."""
+        batch = ColumnarDecoder(Transaction).decode(self.items)
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(batch["billing_amount"].dtype, np.float64)
+        self.assertEqual(batch["billing_amount"].tolist(), [12.5, 1234.0, 1.5])
+        self.assertEqual(batch["transaction_date"].dtype, np.dtype("datetime64[us]"))
+        self.assertEqual(batch["transaction_date"][1], np.datetime64("2025-01-01T00:00:00"))
+        self.assertTrue(np.isnat(batch["posted_date"][0]))
+        self.assertEqual(batch.categories["billing_currency"], ["USD", "JPY", "KWD"])
+        self.assertEqual(batch["billing_currency"].tolist(), [0, 1, 2])
+        self.assertEqual(batch["merchant.name"].tolist(), ["Coffee", None, "Coffee"])
+        self.assertEqual(batch["merchant.category_code"].tolist(), ["5814", None, "5814"])
+
+    def test_minor_units(self):
+        """Test amounts are scaled by the exponent of their own currency."""
+        batch = ColumnarDecoder(Transaction, amounts="minor_units").decode(self.items)
+        self.assertEqual(batch["billing_amount"].dtype, np.int64)
+        self.assertEqual(batch["billing_amount"].tolist(), [1250, 1234, 1500])
+        self.assertEqual(batch["transaction_amount"].tolist(), [1250, 1250, 1250])
+
+    def test_categories_are_shared_across_pages(self):
+        """Test pages decoded with one decoder concatenate into consistent categoricals."""
+        decoder = ColumnarDecoder(Transaction)
+        batch = ColumnarBatch.concat([decoder.decode(self.items[1:]), decoder.decode(self.items[:1])])
+        self.assertEqual(batch.categories["billing_currency"], ["JPY", "KWD", "USD"])
+        self.assertEqual(batch["billing_currency"].tolist(), [0, 1, 2])
+        self.assertEqual(batch["transaction_id"].tolist(), ["txn_2", "txn_3", "txn_1"])
+
+    @unittest.skipUnless(pd, "pandas is not installed")
+    def test_to_pandas(self):
+        """Test conversion to a DataFrame with categorical and UTC datetime columns."""
+        frame = ColumnarDecoder(Transaction).decode(self.items).to_pandas()
+        self.assertEqual(str(frame["billing_currency"].dtype), "category")
+        self.assertEqual(list(frame["billing_currency"]), ["USD", "JPY", "KWD"])
+        self.assertEqual(str(frame["transaction_date"].dt.tz), "UTC")
+
+    @unittest.skipUnless(pa, "pyarrow is not installed")
+    def test_to_arrow(self):
+        """Test conversion to an Arrow table with dictionary and timestamp columns."""
+        table = ColumnarDecoder(Transaction).decode(self.items).to_arrow()
+        self.assertEqual(table.num_rows, 3)
+        self.assertTrue(pa.types.is_dictionary(table.schema.field("status").type))
+        self.assertEqual(table.schema.field("transaction_date").type, pa.timestamp("us", tz="UTC"))
+        self.assertEqual(table.schema.field("merchant.city").type, pa.string())
+
+
+@unittest.skipUnless(np, "numpy is not installed")
+class TestColumnarListings(unittest.TestCase):
+    """Tests for columnar output from the listing methods."""
+
+    def setUp(self):
+        self.client = AirwallexClient(client_id="test_client_id", api_key="test_api_key")
+        self.client._token = "test_token"
+        self.client._token_expiry = datetime.now() + timedelta(minutes=30)
+        self.addCleanup(self.client.close)
+
+    def test_paginate_columns(self):
+        """Test every page is decoded and concatenated without building models."""
+        self.client._client = httpx.Client(
+            base_url=self.client.base_url,
+            transport=httpx.MockTransport(lambda request: listing_page(request, total=25)),
+        )
+        with patch.object(FinancialTransaction, "model_validate", side_effect=AssertionError):
+            batch = self.client.financial_transaction.paginate_columns(page_size=10, amounts="minor_units")
+        self.assertEqual(batch["id"].tolist(), [f"txn_{i}" for i in range(25)])
+        self.assertEqual(batch["amount"].tolist(), [1000] * 25)
+        self.assertEqual(batch.categories["status"], ["SETTLED"])
+
+    def test_list_with_filters(self):
+        """Test list_with_filters returns one page as columns."""
+        self.client._client = httpx.Client(
+            base_url=self.client.base_url,
+            transport=httpx.MockTransport(lambda request: httpx.Response(
+                200, json={"items": [make_issuing_transaction()], "has_more": False}
+            )),
+        )
+        batch = self.client.issuing_transaction.list_with_filters(columnar=True)
+        self.assertIsInstance(batch, ColumnarBatch)
+        self.assertEqual(batch["transaction_id"].tolist(), ["txn_1"])
+
+
+@unittest.skipUnless(np, "numpy is not installed")
+class TestAsyncColumnarListings(unittest.IsolatedAsyncioTestCase):
+    """Tests for columnar output from the async paginator."""
+
+    async def test_paginate_columns_async(self):
+        """Test prefetched pages are concatenated in order."""
+        client = AirwallexAsyncClient(client_id="test_client_id", api_key="test_api_key")
+        client._token = "test_token"
+        client._token_expiry = datetime.now() + timedelta(minutes=30)
+        client._client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(listing_handler(total=35)))
+        try:
+            batch = await client.financial_transaction.paginate_columns_async(page_size=10, prefetch=3)
+        finally:
+            await client.close()
+        self.assertEqual(batch["id"].tolist(), [f"txn_{i}" for i in range(35)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Tests for compact read-only records.
+"""
+import pickle
+import sys
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import httpx
+
+from airwallex import AirwallexClient, CompactRecord
+from airwallex.models.compact import compact_record_class
+from airwallex.models.issuing_transaction import Transaction
+
+from test_lazy import make_issuing_transaction
+from test_pagination import listing_page
+
+
+class TestCompactRecord(unittest.TestCase):
+    """Tests for generated record classes."""
+
+    def setUp(self):
+        self.record_class = compact_record_class(Transaction)
+        self.raw = make_issuing_transaction(
+            matched_authorizations=["auth_1"], riskDetails={"riskFactors": ["velocity"]}
+        )
+
+    def test_fields_are_flattened(self):
+        """Test records hold the validated values, with nested models flattened."""
+        record = self.record_class.from_api_response(self.raw)
+        self.assertIs(compact_record_class(Transaction), self.record_class)
+        self.assertIsInstance(record, CompactRecord)
+        self.assertEqual(self.record_class.__name__, "TransactionRecord")
+        self.assertEqual(record.billing_amount, 12.5)
+        self.assertEqual(record.transaction_date, datetime(2025, 1, 1, tzinfo=timezone.utc))
+        self.assertEqual(record.merchant_name, "Coffee")
+        self.assertEqual(record.merchant_category_code, "5814")
+        self.assertEqual(record.risk_details_risk_factors, ("velocity",))
+        self.assertEqual(record.matched_authorizations, ("auth_1",))
+        self.assertIsNone(record.posted_date)
+        self.assertEqual(record.to_dict()["merchant_name"], "Coffee")
+
+    def test_compact_and_read_only(self):
+        """Test records have no instance dict, reject writes and intern codes."""
+        record = self.record_class.from_trusted_api_response(self.raw)
+        self.assertFalse(hasattr(record, "__dict__"))
+        with self.assertRaises(AttributeError):
+            record.status = "DECLINED"
+        self.assertIs(record.billing_currency, sys.intern("USD"))
+
+    def test_round_trips(self):
+        """Test records rebuild the model and survive pickling."""
+        record = self.record_class.from_api_response(self.raw)
+        self.assertEqual(record.to_model(), Transaction.from_api_response(self.raw))
+        self.assertEqual(pickle.loads(pickle.dumps(record)), record)
+        without_merchant = self.record_class.from_api_response(make_issuing_transaction(merchant=None))
+        self.assertIsNone(without_merchant.merchant_name)
+        self.assertIsNone(without_merchant.to_model().merchant)
+
+
+class TestCompactListings(unittest.TestCase):
+    """Tests for compact=True on the listing methods."""
+
+    def setUp(self):
+        self.client = AirwallexClient(client_id="test_client_id", api_key="test_api_key")
+        self.client._client = httpx.Client(
+            base_url=self.client.base_url,
+            transport=httpx.MockTransport(lambda request: listing_page(request, total=15)),
+        )
+        self.client._token = "test_token"
+        self.client._token_expiry = datetime.now() + timedelta(minutes=30)
+        self.addCleanup(self.client.close)
+
+    def test_paginate(self):
+        """Test the paginator yields records for every item."""
+        records = list(self.client.financial_transaction.paginate(page_size=10, compact=True))
+        self.assertEqual([record.id for record in records], [f"txn_{i}" for i in range(15)])
+        self.assertEqual(type(records[0]).__name__, "FinancialTransactionRecord")
+
+    def test_list_with_filters(self):
+        """Test list_with_filters returns records, and rejects combining them with other result modes."""
+        records = self.client.financial_transaction.list_with_filters(page_size=10, compact=True)
+        self.assertEqual(len(records), 10)
+        self.assertEqual(records[0].status, "SETTLED")
+        for modes in ({"lazy": True}, {"columnar": True}, {"dataframe": True}):
+            with self.subTest(**modes), self.assertRaises(ValueError):
+                self.client.financial_transaction.list(compact=True, page_num=0, page_size=10, **modes)
+        with self.assertRaises(ValueError):
+            self.client.financial_transaction.list(lazy=True, columnar=True, page_num=0, page_size=10)
+
+
+if __name__ == "__main__":
+    unittest.main()
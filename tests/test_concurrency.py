@@ -0,0 +1,94 @@
+"""
+Tests for adaptive concurrency control.
+"""
+import asyncio
+import unittest
+from datetime import datetime, timedelta
+
+import httpx
+
+from airwallex import AirwallexAsyncClient, AdaptiveConcurrencyLimiter
+
+
+class TestAdaptiveConcurrencyLimiter(unittest.IsolatedAsyncioTestCase):
+    """Tests for the AIMD limiter."""
+    
+    async def test_additive_increase(self):
+        """Test roughly a window of healthy responses at the limit raises it by one."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+        for _ in range(3):
+            await limiter.acquire()
+        for _ in range(5):
+            saturated = await limiter.acquire()
+            self.assertTrue(saturated)
+            limiter.release(200, 0.01, saturated=saturated)
+        self.assertEqual(limiter.limit, 5)
+    
+    async def test_no_increase_below_limit(self):
+        """Test healthy responses do not grow the limit while requests stay below it."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+        for _ in range(100):
+            saturated = await limiter.acquire()
+            self.assertFalse(saturated)
+            limiter.release(200, 0.01, saturated=saturated)
+        self.assertEqual(limiter.limit, 4)
+        self.assertEqual(limiter.increases, 0)
+    
+    async def test_multiplicative_decrease(self):
+        """Test a burst of 429s from one window cuts the limit once."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=16)
+        for _ in range(8):
+            await limiter.acquire()
+        for _ in range(8):
+            limiter.release(429, 0.5)
+        self.assertEqual(limiter.limit, 8)
+        self.assertEqual(limiter.decreases, 1)
+    
+    async def test_latency_spike_decreases(self):
+        """Test a response far slower than the baseline counts as overload."""
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=10, latency_tolerance=3.0)
+        for _ in range(limiter.WARMUP_SAMPLES):
+            await limiter.acquire()
+            limiter.release(200, 0.01)
+        before = limiter.limit
+        await limiter.acquire()
+        limiter.release(200, 0.5)
+        self.assertEqual(limiter.limit, before // 2)
+
+
+class TestAsyncClientConcurrency(unittest.IsolatedAsyncioTestCase):
+    """Tests for the limiter inside the async client."""
+    
+    async def test_in_flight_requests_respect_limit(self):
+        """Test the client never has more requests in flight than the limit allows."""
+        active = 0
+        peak = 0
+        
+        async def handler(request):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return httpx.Response(200, json={"ok": True})
+        
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=3, max_limit=3)
+        client = AirwallexAsyncClient(
+            client_id="test_client_id", api_key="test_api_key", concurrency_limiter=limiter
+        )
+        client._client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+        client._token = "test_token"
+        client._token_expiry = datetime.now() + timedelta(minutes=30)
+        
+        try:
+            await asyncio.gather(*(client._request("GET", "/api/v1/accounts") for _ in range(30)))
+        finally:
+            await client.close()
+        
+        self.assertEqual(peak, 3)
+        self.assertEqual(client.concurrency_limit, 3)
+        self.assertEqual(limiter.in_flight, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+Tests for hedged GET requests.
+"""
+import asyncio
+import unittest
+from datetime import datetime, timedelta
+
+import httpx
+
+from airwallex import AirwallexAsyncClient, FixedBackoff, HedgingPolicy, RetryBudget
+from airwallex.hedging import LatencyWindow
+
+
+class TestHedgingPolicy(unittest.TestCase):
+    """Tests for hedge delays and the hedge budget."""
+    
+    def test_latency_window_percentile(self):
+        """Test percentiles track a sliding window of latencies."""
+        window = LatencyWindow(size=100)
+        for latency in range(1, 201):
+            window.add(latency / 1000)
+        self.assertEqual(len(window), 100)
+        self.assertAlmostEqual(window.percentile(50), 0.150)
+        self.assertAlmostEqual(window.percentile(95), 0.195)
+    
+    def test_no_hedging_until_warmed_up(self):
+        """Test hedging waits for enough samples and respects the budget."""
+        policy = HedgingPolicy(min_samples=5, budget=RetryBudget(ratio=0, min_retries_per_second=0, max_balance=1))
+        for _ in range(4):
+            policy.record("issuing/cards", 0.05)
+        self.assertIsNone(policy.delay_for("issuing/cards"))
+        policy.record("issuing/cards", 0.05)
+        self.assertEqual(policy.delay_for("issuing/cards"), 0.05)
+        
+        self.assertTrue(policy.try_hedge())
+        self.assertFalse(policy.try_hedge())
+        self.assertEqual(policy.stats()["hedges_denied"], 1)
+
+
+class TestAsyncHedging(unittest.IsolatedAsyncioTestCase):
+    """Tests for hedging in the async client."""
+    
+    def _client(self, handler, policy, **kwargs):
+        client = AirwallexAsyncClient(client_id="test_client_id", api_key="test_api_key", hedging=policy, **kwargs)
+        client._client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+        client._token = "test_token"
+        client._token_expiry = datetime.now() + timedelta(minutes=30)
+        return client
+    
+    async def test_fast_request_is_not_hedged(self):
+        """Test a GET answered within the hedge delay returns its response without a hedge."""
+        async def handler(request):
+            return httpx.Response(200, json={"id": "card_1"})
+        
+        policy = HedgingPolicy(min_samples=1, min_delay=1.0)
+        policy.record("issuing/cards", 1.0)
+        client = self._client(handler, policy)
+        try:
+            response = await client._request("GET", "/api/v1/issuing/cards/card_1")
+        finally:
+            await client.close()
+        
+        self.assertEqual(response.json(), {"id": "card_1"})
+        self.assertEqual(policy.stats()["hedges_sent"], 0)
+    
+    async def test_error_before_hedge_delay_is_raised(self):
+        """Test a transport error inside the hedge delay surfaces as itself, and its latency is recorded."""
+        async def handler(request):
+            raise httpx.ConnectError("connection refused", request=request)
+        
+        policy = HedgingPolicy(min_samples=1, min_delay=1.0)
+        policy.record("issuing/cards", 1.0)
+        client = self._client(handler, policy, retry_policy=FixedBackoff(interval=0, max_retries=0))
+        try:
+            with self.assertRaises(httpx.ConnectError):
+                await client._request("GET", "/api/v1/issuing/cards/card_1")
+        finally:
+            await client.close()
+        
+        self.assertEqual(len(policy._windows["issuing/cards"]), 2)
+        self.assertEqual(policy.stats()["hedges_sent"], 0)
+    
+    async def test_slow_request_is_hedged(self):
+        """Test a slow GET is raced by a hedge and the slow attempt is cancelled."""
+        calls = 0
+        cancelled = []
+        
+        async def handler(request):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.append(True)
+                    raise
+            return httpx.Response(200, json={"id": "card_1", "attempt": calls})
+        
+        policy = HedgingPolicy(min_samples=1)
+        policy.record("issuing/cards", 0.01)
+        client = AirwallexAsyncClient(client_id="test_client_id", api_key="test_api_key", hedging=policy)
+        client._client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+        client._token = "test_token"
+        client._token_expiry = datetime.now() + timedelta(minutes=30)
+        
+        try:
+            response = await asyncio.wait_for(client._request("GET", "/api/v1/issuing/cards/card_1/details"), 1)
+        finally:
+            await client.close()
+        
+        self.assertEqual(response.json()["attempt"], 2)
+        self.assertEqual(cancelled, [True])
+        self.assertEqual(policy.stats(), {"hedges_sent": 1, "hedges_won": 1, "hedges_denied": 0})
+        # Only the hedge completed; the cancelled primary's latency is not recorded
+        self.assertEqual(len(policy._windows["issuing/cards"]), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
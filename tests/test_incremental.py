@@ -0,0 +1,75 @@
+"""
+Tests for incremental high-water-mark syncs.
+"""
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import httpx
+
+from airwallex import AirwallexClient, JSONFileCheckpointStore
+from airwallex.sharding import parse_timestamp
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def make_transaction(index, created_at):
+    return {
+        "id": f"txn_{index}",
+        "amount": 10.0,
+        "net": 9.5,
+        "fee": 0.5,
+        "currency": "USD",
+        "status": "SETTLED",
+        "created_at": created_at.isoformat(),
+    }
+
+
+class TestIncrementalSync(unittest.TestCase):
+    """Tests for fetch_new on financial transactions."""
+    
+    def setUp(self):
+        self.history = [make_transaction(i, START + timedelta(hours=i)) for i in range(5)]
+        self.requested_from = []
+        
+        def handler(request):
+            since = request.url.params.get("from_created_at")
+            self.requested_from.append(since)
+            matching = [
+                item for item in self.history
+                if since is None or parse_timestamp(item["created_at"]) >= parse_timestamp(since)
+            ]
+            return httpx.Response(200, json={"items": matching, "has_more": False})
+        
+        self.client = AirwallexClient(client_id="test_client_id", api_key="test_api_key")
+        self.client._client = httpx.Client(base_url=self.client.base_url, transport=httpx.MockTransport(handler))
+        self.client._token = "test_token"
+        self.client._token_expiry = datetime.now() + timedelta(minutes=30)
+        self.addCleanup(self.client.close)
+        
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.store = JSONFileCheckpointStore(os.path.join(directory.name, "sync.json"))
+    
+    def _sync(self):
+        return [txn.id for txn in self.client.financial_transaction.fetch_new(self.store, overlap=timedelta(hours=2))]
+    
+    def test_only_new_items_are_returned(self):
+        """Test later runs list from the mark minus the overlap and drop items already returned."""
+        self.assertEqual(self._sync(), [f"txn_{i}" for i in range(5)])
+        self.assertIsNone(self.requested_from[-1])
+        
+        self.assertEqual(self._sync(), [])
+        self.assertEqual(parse_timestamp(self.requested_from[-1]), START + timedelta(hours=2))
+        
+        # A new item, and one that became visible late inside the overlap window
+        self.history.append(make_transaction(5, START + timedelta(hours=5)))
+        self.history.append(make_transaction(6, START + timedelta(hours=3, minutes=30)))
+        self.assertEqual(sorted(self._sync()), ["txn_5", "txn_6"])
+        self.assertEqual(self._sync(), [])
+        self.assertEqual(parse_timestamp(self.requested_from[-1]), START + timedelta(hours=3))
+
+
+if __name__ == '__main__':
+    unittest.main()
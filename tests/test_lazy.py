@@ -0,0 +1,109 @@
+"""
+Tests for lazily validated list results.
+"""
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import httpx
+import pydantic
+
+from airwallex import AirwallexClient, LazyModel
+from airwallex.models.invoice import Invoice
+from airwallex.models.issuing_transaction import Transaction
+
+from test_pagination import listing_page
+
+
+def make_issuing_transaction(**overrides):
+    item = {
+        "transaction_id": "txn_1",
+        "billingAmount": "12.50",
+        "billing_currency": "USD",
+        "card_id": "card_1",
+        "masked_card_number": "************4242",
+        "status": "APPROVED",
+        "transaction_amount": 12.5,
+        "transaction_currency": "USD",
+        "transaction_date": "2025-01-01T00:00:00Z",
+        "transaction_type": "CLEARING",
+        "merchant": {"name": "Coffee", "categoryCode": "5814"},
+    }
+    item.update(overrides)
+    return item
+
+
+class TestLazyModel(unittest.TestCase):
+    """Tests for LazyModel views."""
+
+    def test_fields_match_the_validated_model(self):
+        """Test each field reads the same as on the fully validated model."""
+        raw = make_issuing_transaction()
+        lazy = LazyModel(Transaction, raw)
+        model = Transaction.from_api_response(raw)
+        for name in Transaction.model_fields:
+            with self.subTest(field=name):
+                self.assertEqual(getattr(lazy, name), getattr(model, name))
+        self.assertEqual(lazy.transaction_date, datetime(2025, 1, 1, tzinfo=timezone.utc))
+        self.assertEqual(lazy.merchant.category_code, "5814")
+        self.assertEqual(lazy, model)
+
+    def test_only_accessed_fields_are_validated(self):
+        """Test reading one field neither validates the others nor builds the model."""
+        lazy = LazyModel(Transaction, make_issuing_transaction(billingAmount="not a number"))
+        with patch.object(Transaction, "model_validate", side_effect=AssertionError("model built")):
+            self.assertEqual(lazy.status, "APPROVED")
+            self.assertEqual(lazy.transaction_id, "txn_1")
+        with self.assertRaises(pydantic.ValidationError):
+            lazy.billing_amount
+
+    def test_model_and_other_attributes(self):
+        """Test non-field attributes are read from the full model, which is built once."""
+        lazy = LazyModel(Transaction, make_issuing_transaction())
+        self.assertIsInstance(lazy.model(), Transaction)
+        self.assertIs(lazy.model(), lazy.model())
+        self.assertEqual(lazy.to_api_dict()["transactionId"], "txn_1")
+        with self.assertRaises(AttributeError):
+            lazy.status = "DECLINED"
+
+    def test_fields_with_validators_use_the_model(self):
+        """Test a field with its own validator is not read past the validator."""
+        lazy = LazyModel(Invoice, {"id": "inv_1", "status": "DRAFT"})
+        with self.assertRaises(pydantic.ValidationError):
+            lazy.status
+
+    def test_missing_optional_field_returns_default(self):
+        """Test an optional field absent from the item reads as its default."""
+        lazy = LazyModel(Transaction, make_issuing_transaction())
+        self.assertIsNone(lazy.risk_details)
+
+
+class TestLazyListing(unittest.TestCase):
+    """Tests for lazy results from list and paginate."""
+
+    def setUp(self):
+        self.client = AirwallexClient(client_id="test_client_id", api_key="test_api_key")
+        self.client._client = httpx.Client(
+            base_url=self.client.base_url,
+            transport=httpx.MockTransport(lambda request: listing_page(request, total=25)),
+        )
+        self.client._token = "test_token"
+        self.client._token_expiry = datetime.now() + timedelta(minutes=30)
+        self.addCleanup(self.client.close)
+
+    def test_list_lazy(self):
+        """Test list(lazy=True) returns lazy views without sending the flag."""
+        items = self.client.financial_transaction.list(lazy=True, page_num=0, page_size=10)
+        self.assertEqual(len(items), 10)
+        self.assertTrue(all(isinstance(item, LazyModel) for item in items))
+        self.assertEqual(items[3].id, "txn_3")
+
+    def test_paginate_lazy(self):
+        """Test paginate(lazy=True) yields lazy views of every item."""
+        items = list(self.client.financial_transaction.paginate(lazy=True, page_size=10))
+        self.assertEqual([item.id for item in items], [f"txn_{i}" for i in range(25)])
+        self.assertEqual(items[0].amount, 10.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+"""
+Tests for key conversion and decoding in the base model.
+"""
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import httpx
+
+from airwallex import AirwallexClient
+from airwallex.models.financial_transaction import FinancialTransaction
+from airwallex.models.issuing_transaction import Transaction
+from airwallex.utils import camel_to_snake_case, snake_to_camel_case
+
+from test_lazy import make_issuing_transaction
+from test_pagination import listing_page
+
+
+class TestKeyConversion(unittest.TestCase):
+    """Tests for camelCase/snake_case conversion of API data."""
+
+    def test_alias_tables_match_conversion_functions(self):
+        """Test the per-class tables agree with the conversion functions."""
+        for name, camel_name in Transaction._camel_aliases.items():
+            self.assertEqual(camel_name, snake_to_camel_case(name))
+            self.assertEqual(Transaction._snake_aliases[camel_name], camel_to_snake_case(camel_name))
+        self.assertEqual(Transaction._nested_model_fields, {"merchant", "risk_details"})
+
+    def test_nested_and_unknown_keys(self):
+        """Test nested models, nested dicts and unknown keys are converted as before."""
+        converted = Transaction._convert_keys_to_snake_case({
+            "transactionId": "txn_1",
+            "someNewField": {"innerKey": [{"deepKey": 1}]},
+            "merchant": {"categoryCode": "5814"},
+        })
+        self.assertEqual(converted["transaction_id"], "txn_1")
+        self.assertEqual(converted["some_new_field"], {"inner_key": [{"deep_key": 1}]})
+
+        model = Transaction.from_api_response({
+            "transactionId": "txn_1",
+            "billingAmount": 1,
+            "billingCurrency": "USD",
+            "cardId": "card_1",
+            "maskedCardNumber": "4242",
+            "status": "APPROVED",
+            "transactionAmount": 1,
+            "transactionCurrency": "USD",
+            "transactionDate": "2025-01-01T00:00:00Z",
+            "transactionType": "CLEARING",
+            "merchant": {"categoryCode": "5814"},
+            "riskDetails": {"riskFactors": ["velocity"]},
+        })
+        self.assertEqual(model.merchant.category_code, "5814")
+        self.assertEqual(model.risk_details.risk_factors, ["velocity"])
+
+    def test_to_api_dict(self):
+        """Test models serialise back to camelCase keys."""
+        model = FinancialTransaction.from_api_response({
+            "id": "ft_1",
+            "amount": 10,
+            "currency": "USD",
+            "net": 9.5,
+            "fee": 0.5,
+            "status": "SETTLED",
+            "source_type": "PAYMENT",
+            "created_at": "2025-01-01T00:00:00Z",
+        })
+        api_dict = model.to_api_dict()
+        self.assertEqual(api_dict["sourceType"], "PAYMENT")
+        self.assertEqual(api_dict["createdAt"], "2025-01-01T00:00:00+00:00")
+
+
+class TestTrustedDecode(unittest.TestCase):
+    """Tests for building models without validation."""
+
+    def test_matches_validated_model(self):
+        """Test trusted decoding builds the same model as validation for valid data."""
+        raw = make_issuing_transaction(billingAmount=12.5, riskDetails={"riskFactors": ["velocity"]})
+        trusted = Transaction.from_trusted_api_response(raw)
+        validated = Transaction.from_api_response(raw)
+        self.assertEqual(trusted, validated)
+        self.assertEqual(trusted.model_fields_set, validated.model_fields_set)
+        self.assertEqual(trusted.transaction_date, datetime(2025, 1, 1, tzinfo=timezone.utc))
+        self.assertEqual(trusted.risk_details.risk_factors, ["velocity"])
+        self.assertIsNone(trusted.card_nickname)
+        self.assertEqual(trusted.to_api_dict(), validated.to_api_dict())
+
+    def test_values_are_not_validated(self):
+        """Test values other than timestamps and nested models are kept as decoded."""
+        trusted = Transaction.from_trusted_api_response(make_issuing_transaction(billingAmount="12.50"))
+        self.assertEqual(trusted.billing_amount, "12.50")
+
+    def test_client_option(self):
+        """Test clients created with trusted_decode skip validation for listings."""
+        client = AirwallexClient(client_id="test_client_id", api_key="test_api_key", trusted_decode=True)
+        client._client = httpx.Client(
+            base_url=client.base_url,
+            transport=httpx.MockTransport(lambda request: listing_page(request, total=5)),
+        )
+        client._token = "test_token"
+        client._token_expiry = datetime.now() + timedelta(minutes=30)
+        self.addCleanup(client.close)
+
+        with patch.object(FinancialTransaction, "model_validate", side_effect=AssertionError("validated")):
+            items = list(client.financial_transaction.paginate(page_size=10))
+        self.assertEqual([item.id for item in items], [f"txn_{i}" for i in range(5)])
+        self.assertEqual(items[0].created_at, datetime(2025, 1, 1, tzinfo=timezone.utc))
+
+
+if __name__ == "__main__":
+    unittest.main()
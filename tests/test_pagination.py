@@ -0,0 +1,263 @@
+"""
+Tests for paginated listings.
+"""
+import asyncio
+import time
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import httpx
+
+from airwallex import AirwallexClient, AirwallexAsyncClient, PageSizeTuner
+from airwallex.api.base import AirwallexAPIBase
+
+
+def make_transaction(index):
+    return {
+        "id": f"txn_{index}",
+        "amount": 10.0,
+        "net": 9.5,
+        "fee": 0.5,
+        "currency": "USD",
+        "status": "SETTLED",
+        "created_at": "2025-01-01T00:00:00Z",
+    }
+
+
+def listing_page(request, total):
+    page_num = int(request.url.params["page_num"])
+    page_size = int(request.url.params["page_size"])
+    start = page_num * page_size
+    items = [make_transaction(i) for i in range(start, min(start + page_size, total))]
+    return httpx.Response(200, json={"items": items, "has_more": start + page_size < total})
+
+
+def listing_handler(total, page_delay=0.0, requested=None):
+    """Serve `total` financial transactions in pages, like the Airwallex API."""
+    async def handler(request):
+        if requested is not None:
+            requested.append(int(request.url.params["page_num"]))
+        await asyncio.sleep(page_delay)
+        return listing_page(request, total)
+    return handler
+
+
+class TestReadAhead(unittest.TestCase):
+    """Tests for background read-ahead in the sync paginator."""
+    
+    def setUp(self):
+        self.requested = []
+        
+        def handler(request):
+            self.requested.append(int(request.url.params["page_num"]))
+            time.sleep(0.03)
+            return listing_page(request, total=50)
+        
+        self.client = AirwallexClient(client_id="test_client_id", api_key="test_api_key")
+        self.client._client = httpx.Client(base_url=self.client.base_url, transport=httpx.MockTransport(handler))
+        self.client._token = "test_token"
+        self.client._token_expiry = datetime.now() + timedelta(minutes=30)
+        self.addCleanup(self.client.close)
+    
+    def _consume(self, **kwargs):
+        ids = []
+        for txn in self.client.financial_transaction.paginate(page_size=10, **kwargs):
+            ids.append(txn.id)
+            time.sleep(0.003)
+        return ids
+    
+    def test_read_ahead_overlaps_fetching_and_processing(self):
+        """Test read-ahead yields the same items while hiding fetch time behind processing."""
+        start = time.monotonic()
+        sequential = self._consume()
+        sequential_time = time.monotonic() - start
+        
+        start = time.monotonic()
+        ahead = self._consume(read_ahead=2)
+        ahead_time = time.monotonic() - start
+        
+        self.assertEqual(ahead, sequential)
+        self.assertEqual(len(ahead), 50)
+        self.assertLess(ahead_time, sequential_time * 0.75)
+    
+    def test_closing_early_stops_worker(self):
+        """Test abandoning the generator stops the worker at the queue bound."""
+        pages = self.client.financial_transaction.paginate(page_size=10, read_ahead=1)
+        next(pages)
+        pages.close()
+        time.sleep(0.2)
+        # Page 1 is consumed, at most one page buffered and one in progress
+        self.assertLessEqual(len(self.requested), 3)
+    
+    def test_closing_early_closes_read_ahead(self):
+        """Test closing the paginator closes its read-ahead generator without waiting for collection."""
+        read_ahead = AirwallexAPIBase._read_ahead
+        started = []
+        
+        def tracked(pages, depth):
+            started.append(read_ahead(pages, depth))
+            return started[-1]
+        
+        with patch.object(AirwallexAPIBase, "_read_ahead", staticmethod(tracked)):
+            pages = self.client.financial_transaction.paginate(page_size=10, read_ahead=1)
+            next(pages)
+            pages.close()
+        self.assertIsNone(started[0].gi_frame)
+
+
+def make_issuing_transaction(index):
+    return {
+        "billing_amount": 10.0,
+        "billing_currency": "USD",
+        "card_id": "card_1",
+        "masked_card_number": "************4242",
+        "status": "APPROVED",
+        "transaction_amount": 10.0,
+        "transaction_currency": "USD",
+        "transaction_date": "2025-01-01T00:00:00Z",
+        "transaction_id": f"itx_{index}",
+        "transaction_type": "AUTHORIZATION",
+    }
+
+
+class TestPageSizeTuner(unittest.TestCase):
+    """Tests for adaptive page sizes."""
+    
+    def test_steps_up_when_fast_and_down_over_budget(self):
+        """Test the tuner grows on fast full pages and shrinks when a page exceeds the budget."""
+        tuner = PageSizeTuner(initial=10, target_latency=1.0, memory_budget=40_000)
+        tuner.observe(10, 0.1, 1_000, 10)
+        self.assertEqual(tuner.page_size, 50)
+        tuner.observe(50, 0.1, 5_000, 50)
+        self.assertEqual(tuner.page_size, 100)
+        # 500 items at ~100 bytes each would exceed the budget
+        tuner.observe(100, 0.1, 10_000, 100)
+        self.assertEqual(tuner.page_size, 100)
+        tuner.observe(100, 1.5, 10_000, 100)
+        self.assertEqual(tuner.page_size, 50)
+    
+    def test_larger_sizes_wait_for_alignment(self):
+        """Test a larger page size is only used at offsets its pages can start from."""
+        tuner = PageSizeTuner(initial=100)
+        self.assertEqual(tuner.next_size(0), 100)
+        self.assertEqual(tuner.next_size(60), 10)
+        self.assertEqual(tuner.next_size(150), 50)
+    
+    def test_auto_page_size_paginates_every_item(self):
+        """Test an auto-sized listing returns every item once while growing its pages."""
+        sizes = []
+        
+        def handler(request):
+            sizes.append(int(request.url.params["page_size"]))
+            return listing_page(request, total=1234)
+        
+        client = AirwallexClient(client_id="test_client_id", api_key="test_api_key")
+        client._client = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(handler))
+        client._token = "test_token"
+        client._token_expiry = datetime.now() + timedelta(minutes=30)
+        self.addCleanup(client.close)
+        
+        ids = [txn.id for txn in client.financial_transaction.paginate(page_size="auto")]
+        self.assertEqual(ids, [f"txn_{i}" for i in range(1234)])
+        self.assertEqual(sizes[0], 100)
+        self.assertEqual(max(sizes), 1000)
+    
+    def test_tuner_is_rejected_where_sizes_are_fixed(self):
+        """Test a tuner instance, like "auto", cannot be combined with streaming or sharded scans."""
+        client = AirwallexClient(client_id="test_client_id", api_key="test_api_key")
+        client._client = httpx.Client(
+            base_url=client.base_url, transport=httpx.MockTransport(lambda request: listing_page(request, total=10))
+        )
+        self.addCleanup(client.close)
+        for page_size in ("auto", PageSizeTuner()):
+            with self.subTest(page_size=page_size):
+                with self.assertRaises(ValueError):
+                    next(client.financial_transaction.paginate(page_size=page_size, stream=True))
+                with self.assertRaises(ValueError):
+                    next(client.financial_transaction.scan("2025-01-01", "2025-02-01", page_size=page_size))
+
+
+class TestIssuingPagination(unittest.TestCase):
+    """Tests for the shared streaming paginator on issuing resources."""
+    
+    def test_issuing_listing_streams_from_page_zero(self):
+        """Test issuing listings start at page 0 and yield items before later pages are fetched."""
+        requested = []
+        
+        def handler(request):
+            page_num = int(request.url.params["page_num"])
+            page_size = int(request.url.params["page_size"])
+            requested.append(page_num)
+            items = [make_issuing_transaction(page_num * page_size + i) for i in range(page_size)]
+            return httpx.Response(200, json={"items": items, "has_more": page_num < 2})
+        
+        client = AirwallexClient(client_id="test_client_id", api_key="test_api_key")
+        client._client = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(handler))
+        client._token = "test_token"
+        client._token_expiry = datetime.now() + timedelta(minutes=30)
+        self.addCleanup(client.close)
+        
+        transactions = client.issuing_transaction.paginate()
+        first = next(transactions)
+        self.assertEqual(first.transaction_id, "itx_0")
+        self.assertEqual(requested, [0])
+        
+        rest = [txn.transaction_id for txn in transactions]
+        self.assertEqual(len(rest), 29)
+        self.assertEqual(requested, [0, 1, 2])
+
+
+class TestAsyncPrefetch(unittest.IsolatedAsyncioTestCase):
+    """Tests for windowed prefetching in paginate_async."""
+    
+    async def asyncSetUp(self):
+        self.client = AirwallexAsyncClient(client_id="test_client_id", api_key="test_api_key")
+        self.client._token = "test_token"
+        self.client._token_expiry = datetime.now() + timedelta(minutes=30)
+    
+    async def asyncTearDown(self):
+        await self.client.close()
+    
+    def _use_handler(self, handler):
+        self.client._client = httpx.AsyncClient(
+            base_url=self.client.base_url, transport=httpx.MockTransport(handler)
+        )
+    
+    async def test_prefetch_yields_in_order_and_overlaps_pages(self):
+        """Test prefetched pages arrive in order in about a window's worth of round trips."""
+        self._use_handler(listing_handler(total=95, page_delay=0.05))
+        
+        start = asyncio.get_running_loop().time()
+        ids = [txn.id async for txn in self.client.financial_transaction.paginate_async(page_size=10, prefetch=5)]
+        elapsed = asyncio.get_running_loop().time() - start
+        
+        self.assertEqual(ids, [f"txn_{i}" for i in range(95)])
+        # 10 pages sequentially would take at least 0.5s
+        self.assertLess(elapsed, 0.35)
+    
+    async def test_overshoot_pages_are_discarded(self):
+        """Test pages past the end are never yielded and stop_page is respected."""
+        requested = []
+        self._use_handler(listing_handler(total=25, requested=requested))
+        
+        ids = [txn.id async for txn in self.client.financial_transaction.paginate_async(page_size=10, prefetch=4)]
+        self.assertEqual(len(ids), 25)
+        self.assertEqual(sorted(requested)[:3], [0, 1, 2])
+        
+        requested.clear()
+        ids = [txn.id async for txn in self.client.financial_transaction.paginate_async(
+            stop_page=1, page_size=10, prefetch=4
+        )]
+        self.assertEqual(len(ids), 20)
+        self.assertEqual(sorted(requested), [0, 1])
+    
+    async def test_stream_rejects_tuner(self):
+        """Test a tuner instance cannot be combined with stream=True."""
+        self._use_handler(listing_handler(total=10))
+        with self.assertRaises(ValueError):
+            await self.client.financial_transaction.paginate_async(page_size=PageSizeTuner(), stream=True).__anext__()
+
+
+if __name__ == '__main__':
+    unittest.main()
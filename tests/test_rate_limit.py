@@ -0,0 +1,74 @@
+"""
+Tests for client-side rate limiting.
+"""
+import asyncio
+import time
+import unittest
+from datetime import datetime, timedelta
+
+import httpx
+
+from airwallex import AirwallexAsyncClient, RateLimiter, TokenBucket
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Tests for the token bucket and endpoint family matching."""
+    
+    def test_bucket_allows_burst_then_paces(self):
+        """Test a bucket admits its burst immediately and then paces at its rate."""
+        bucket = TokenBucket(rate=20, burst=2)
+        
+        start = time.monotonic()
+        for _ in range(2):
+            bucket.acquire()
+        self.assertLess(time.monotonic() - start, 0.02)
+        
+        for _ in range(4):
+            bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.19)
+    
+    def test_endpoint_families(self):
+        """Test requests are routed to the bucket of the first matching family."""
+        limiter = RateLimiter({"issuing/*": 20, "payments": (5, 10)}, default=50)
+        issuing = limiter.bucket_for("/api/v1/issuing/cards/abc")
+        payments = limiter.bucket_for("/api/v1/payments/create")
+        
+        self.assertEqual(issuing.rate, 20)
+        self.assertIs(limiter.bucket_for("/api/v1/issuing/transactions?page_num=1"), issuing)
+        self.assertEqual((payments.rate, payments.burst), (5, 10))
+        self.assertIs(limiter.bucket_for("/api/v1/payments"), payments)
+        self.assertEqual(limiter.bucket_for("/api/v1/payments_report").rate, 50)
+        self.assertIsNone(RateLimiter({"payments": 5}).bucket_for("/api/v1/accounts"))
+
+
+class TestAsyncRateLimiting(unittest.IsolatedAsyncioTestCase):
+    """Tests for rate limiting in the async client."""
+    
+    async def test_concurrent_requests_are_smoothed(self):
+        """Test concurrent coroutines are admitted at the configured rate."""
+        sent = []
+        
+        def handler(request):
+            sent.append(time.monotonic())
+            return httpx.Response(200, json={"ok": True})
+        
+        client = AirwallexAsyncClient(
+            client_id="test_client_id",
+            api_key="test_api_key",
+            rate_limiter=RateLimiter({"issuing/*": (50, 1)})
+        )
+        client._client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+        client._token = "test_token"
+        client._token_expiry = datetime.now() + timedelta(minutes=30)
+        
+        try:
+            await asyncio.gather(*(client._request("GET", "/api/v1/issuing/cards") for _ in range(10)))
+        finally:
+            await client.close()
+        
+        # 10 requests at 50/s with no burst allowance span at least 9 intervals
+        self.assertGreaterEqual(max(sent) - min(sent), 9 / 50 - 0.01)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+"""
+Tests for retry policies and the retry budget.
+"""
+import unittest
+from datetime import datetime, timedelta
+
+import httpx
+
+from airwallex import AirwallexClient, ExponentialBackoff, FixedBackoff, RetryBudget
+from airwallex.exceptions import RateLimitError, ServerError
+from airwallex.retry import parse_retry_after
+
+
+class TestRetryPolicies(unittest.TestCase):
+    """Tests for backoff calculations."""
+    
+    def test_exponential_backoff_full_jitter(self):
+        """Test full jitter stays between zero and the capped exponential delay."""
+        policy = ExponentialBackoff(base=0.5, cap=4.0)
+        for attempt, ceiling in ((1, 0.5), (2, 1.0), (3, 2.0), (4, 4.0), (10, 4.0)):
+            for _ in range(50):
+                self.assertTrue(0 <= policy.backoff(attempt) <= ceiling)
+    
+    def test_retry_after_takes_precedence(self):
+        """Test a server-supplied Retry-After overrides the backoff, up to a cap."""
+        policy = ExponentialBackoff(jitter="none", max_retry_after=10)
+        self.assertEqual(policy.delay(1, retry_after=3), 3)
+        self.assertEqual(policy.delay(1, retry_after=120), 10)
+        self.assertEqual(policy.delay(3), 2.0)
+    
+    def test_parse_retry_after(self):
+        """Test Retry-After parsing for seconds and HTTP dates."""
+        self.assertEqual(parse_retry_after("7"), 7.0)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0.0)
+    
+    def test_budget_is_capped_by_traffic(self):
+        """Test retries are limited to the configured fraction of requests."""
+        budget = RetryBudget(ratio=0.5, min_retries_per_second=0, max_balance=1)
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+        budget.deposit()
+        budget.deposit()
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+
+
+class TestClientRetries(unittest.TestCase):
+    """Tests for retries in the sync client."""
+    
+    def _make_client(self, handler, **kwargs):
+        client = AirwallexClient(client_id="test_client_id", api_key="test_api_key", **kwargs)
+        client._client = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(handler))
+        client._token = "test_token"
+        client._token_expiry = datetime.now() + timedelta(minutes=30)
+        self.addCleanup(client.close)
+        return client
+    
+    def test_rate_limit_without_retry_after_gives_up(self):
+        """Test a 429 without Retry-After is retried a bounded number of times."""
+        calls = []
+        
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(429, json={"code": "too_many_requests"})
+        
+        client = self._make_client(handler, retry_policy=FixedBackoff(0, max_retries=3))
+        with self.assertRaises(RateLimitError):
+            client._request("GET", "/api/v1/accounts")
+        self.assertEqual(len(calls), 4)
+    
+    def test_server_errors_stop_when_budget_is_exhausted(self):
+        """Test retries stop once the retry budget runs out."""
+        calls = []
+        
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503)
+        
+        client = self._make_client(
+            handler,
+            retry_policy=FixedBackoff(0, max_retries=5),
+            retry_budget=RetryBudget(ratio=0, min_retries_per_second=0, max_balance=2)
+        )
+        with self.assertRaises(ServerError):
+            client._request("GET", "/api/v1/accounts")
+        self.assertEqual(len(calls), 3)
+    
+    def test_server_error_then_success(self):
+        """Test a transient server error is retried transparently."""
+        responses = iter([httpx.Response(502), httpx.Response(200, json={"ok": True})])
+        client = self._make_client(lambda request: next(responses), retry_policy=FixedBackoff(0))
+        self.assertEqual(client._request("GET", "/api/v1/accounts").json(), {"ok": True})
+    
+    def _flaky_handler(self, exc_class, failures=1):
+        """Raise a transport error for the first `failures` requests, then succeed."""
+        calls = []
+        
+        def handler(request):
+            calls.append(request)
+            if len(calls) <= failures:
+                raise exc_class("boom", request=request)
+            return httpx.Response(200, json={"ok": True})
+        return handler, calls
+    
+    def test_read_timeout_retried_for_get(self):
+        """Test a read timeout on a GET is retried."""
+        handler, calls = self._flaky_handler(httpx.ReadTimeout)
+        client = self._make_client(handler, retry_policy=FixedBackoff(0))
+        self.assertEqual(client._request("GET", "/api/v1/accounts").status_code, 200)
+        self.assertEqual(len(calls), 2)
+    
+    def test_stale_connection_not_retried_for_plain_post(self):
+        """Test a POST without an idempotency key is not replayed after it may have been sent."""
+        handler, calls = self._flaky_handler(httpx.RemoteProtocolError)
+        client = self._make_client(handler, retry_policy=FixedBackoff(0))
+        with self.assertRaises(httpx.RemoteProtocolError):
+            client._request("POST", "/api/v1/payments/create", json={"amount": 1})
+        self.assertEqual(len(calls), 1)
+    
+    def test_stale_connection_retried_for_post_with_request_id(self):
+        """Test a POST carrying a request_id is safe to replay."""
+        handler, calls = self._flaky_handler(httpx.RemoteProtocolError)
+        client = self._make_client(handler, retry_policy=FixedBackoff(0))
+        response = client._request("POST", "/api/v1/payments/create", json={"request_id": "abc"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(calls), 2)
+    
+    def test_connect_error_retried_for_any_method(self):
+        """Test connection failures are retried since nothing was sent."""
+        handler, calls = self._flaky_handler(httpx.ConnectError, failures=2)
+        client = self._make_client(handler, retry_policy=FixedBackoff(0))
+        self.assertEqual(client._request("POST", "/api/v1/payments/create", json={}).status_code, 200)
+        self.assertEqual(len(calls), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
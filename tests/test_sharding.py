@@ -0,0 +1,160 @@
+"""
+Tests for time-window sharded scans.
+"""
+import asyncio
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import httpx
+
+from airwallex import AirwallexClient, AirwallexAsyncClient
+from airwallex.sharding import TimeWindow, parse_timestamp
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+END = datetime(2025, 1, 31, tzinfo=timezone.utc)
+
+
+def make_history():
+    """One transaction a day, a burst of 300 on 10 January and one at each end."""
+    created = [START + timedelta(days=day) for day in range(31)]
+    created += [START + timedelta(days=9, seconds=second * 10) for second in range(1, 301)]
+    return [
+        {
+            "id": f"txn_{index}",
+            "amount": 10.0,
+            "net": 9.5,
+            "fee": 0.5,
+            "currency": "USD",
+            "status": "SETTLED",
+            "created_at": timestamp.isoformat().replace("+00:00", "Z"),
+        }
+        for index, timestamp in enumerate(created)
+    ]
+
+
+def history_page(request, history, requested):
+    """Serve a page of `history` filtered by creation time, newest first."""
+    params = request.url.params
+    start = parse_timestamp(params["from_created_at"])
+    end = parse_timestamp(params["to_created_at"])
+    page_num = int(params["page_num"])
+    page_size = int(params["page_size"])
+    requested.append((start, end, page_num))
+    
+    matching = [item for item in history if start <= parse_timestamp(item["created_at"]) <= end]
+    matching.sort(key=lambda item: item["created_at"], reverse=True)
+    offset = page_num * page_size
+    return httpx.Response(200, json={
+        "items": matching[offset:offset + page_size],
+        "has_more": offset + page_size < len(matching),
+    })
+
+
+class TestTimeWindows(unittest.TestCase):
+    """Tests for window planning."""
+    
+    def test_windows_partition_the_range(self):
+        """Test windows are contiguous and only the last one owns its end instant."""
+        windows = TimeWindow(START, END, closed=True).split(3)
+        self.assertEqual(windows[0].start, START)
+        self.assertEqual(windows[0].end, windows[1].start)
+        self.assertEqual(windows[-1].end, END)
+        self.assertFalse(windows[0].owns(windows[1].start))
+        self.assertTrue(windows[1].owns(windows[1].start))
+        self.assertTrue(windows[-1].owns(END))
+
+
+class TestShardedScan(unittest.TestCase):
+    """Tests for sharded scans on the sync client."""
+    
+    def test_scan_matches_history_in_order(self):
+        """Test a sharded scan returns every item once, oldest first, splitting the dense window."""
+        history = make_history()
+        requested = []
+        client = AirwallexClient(client_id="test_client_id", api_key="test_api_key")
+        client._client = httpx.Client(
+            base_url=client.base_url,
+            transport=httpx.MockTransport(lambda request: history_page(request, history, requested))
+        )
+        client._token = "test_token"
+        client._token_expiry = datetime.now() + timedelta(minutes=30)
+        self.addCleanup(client.close)
+        
+        transactions = list(client.financial_transaction.scan(
+            START, END, shards=4, max_pages_per_window=3, page_size=20
+        ))
+        
+        expected = sorted(history, key=lambda item: item["created_at"])
+        self.assertEqual([txn.id for txn in transactions], [item["id"] for item in expected])
+        # The window holding the burst was split below the initial quarter-month shards
+        narrowest = min(end - start for start, end, _ in requested)
+        self.assertLess(narrowest, (END - START) / 8)
+
+
+    def test_exclusive_end_keeps_items_at_the_boundary(self):
+        """Test a listing with an exclusive to_created_at still returns items created at the end of the range."""
+        created = [START, START + timedelta(days=15), END]
+        authorizations = [
+            {
+                "transaction_id": f"auth_{index}",
+                "billing_amount": 10.0,
+                "billing_currency": "USD",
+                "card_id": "card_1",
+                "create_time": timestamp.isoformat(),
+                "status": "CLEARED",
+                "transaction_amount": 10.0,
+                "transaction_currency": "USD",
+            }
+            for index, timestamp in enumerate(created)
+        ]
+        
+        def handler(request):
+            params = request.url.params
+            start = parse_timestamp(params["from_created_at"])
+            end = parse_timestamp(params["to_created_at"])
+            items = [item for item in authorizations if start <= parse_timestamp(item["create_time"]) < end]
+            return httpx.Response(200, json={"items": items, "has_more": False})
+        
+        client = AirwallexClient(client_id="test_client_id", api_key="test_api_key")
+        client._client = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(handler))
+        client._token = "test_token"
+        client._token_expiry = datetime.now() + timedelta(minutes=30)
+        self.addCleanup(client.close)
+        
+        ids = [auth.transaction_id for auth in client.issuing_authorization.scan(START, END, shards=3)]
+        self.assertEqual(ids, ["auth_0", "auth_1", "auth_2"])
+
+
+class TestAsyncShardedScan(unittest.IsolatedAsyncioTestCase):
+    """Tests for sharded scans on the async client."""
+    
+    async def test_windows_are_scanned_concurrently(self):
+        """Test the async scan overlaps windows and preserves creation order."""
+        history = make_history()
+        requested = []
+        
+        async def handler(request):
+            await asyncio.sleep(0.02)
+            return history_page(request, history, requested)
+        
+        client = AirwallexAsyncClient(client_id="test_client_id", api_key="test_api_key")
+        client._client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+        client._token = "test_token"
+        client._token_expiry = datetime.now() + timedelta(minutes=30)
+        
+        try:
+            start = asyncio.get_running_loop().time()
+            ids = [txn.id async for txn in client.financial_transaction.scan_async(
+                START, END, shards=8, max_pages_per_window=4, page_size=50
+            )]
+            elapsed = asyncio.get_running_loop().time() - start
+        finally:
+            await client.close()
+        
+        expected = sorted(history, key=lambda item: item["created_at"])
+        self.assertEqual(ids, [item["id"] for item in expected])
+        self.assertLess(elapsed, len(requested) * 0.02 / 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
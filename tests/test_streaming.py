@@ -0,0 +1,116 @@
+"""
+Tests for incremental decoding of list responses.
+"""
+import json
+import unittest
+from datetime import datetime, timedelta
+
+import httpx
+
+from airwallex import AirwallexClient, AirwallexAsyncClient
+from airwallex.streaming import ItemsDecoder
+
+from test_pagination import make_transaction
+
+
+class TestItemsDecoder(unittest.TestCase):
+    """Tests for the push parser."""
+    
+    def test_byte_by_byte(self):
+        """Test items and metadata decode correctly whatever the chunk boundaries."""
+        body = {
+            "has_more": True,
+            "items": [{"id": "a", "amount": 12345, "note": "café ✓"}, [1, 2], 7, None, "s"],
+            "total": 10.5,
+        }
+        encoded = json.dumps(body, ensure_ascii=False, indent=1).encode("utf-8")
+        for chunk_size in (1, 3, 7, len(encoded)):
+            with self.subTest(chunk_size=chunk_size):
+                decoder = ItemsDecoder()
+                items = []
+                for start in range(0, len(encoded), chunk_size):
+                    items.extend(decoder.feed(encoded[start:start + chunk_size]))
+                items.extend(decoder.close())
+                self.assertEqual(items, body["items"])
+                self.assertEqual(decoder.metadata, {"has_more": True, "total": 10.5})
+    
+    def test_items_are_returned_as_soon_as_complete(self):
+        """Test an item is returned before the rest of the body has arrived."""
+        decoder = ItemsDecoder()
+        self.assertEqual(decoder.feed(b'{"items": [{"id": "a"}, {"id": '), [{"id": "a"}])
+        self.assertEqual(decoder.feed(b'"b"}], "has_more": false}'), [{"id": "b"}])
+        self.assertEqual(decoder.close(), [])
+        self.assertEqual(decoder.metadata, {"has_more": False})
+    
+    def test_truncated_body_raises(self):
+        """Test a body cut off mid-object is reported."""
+        decoder = ItemsDecoder()
+        decoder.feed(b'{"items": [{"id": "a"}')
+        with self.assertRaises(ValueError):
+            decoder.close()
+
+
+def streamed_pages(total, page_size, produced):
+    """Serve pages of transactions as a body streamed one item at a time."""
+    def body(page_num):
+        start = page_num * page_size
+        items = [make_transaction(i) for i in range(start, min(start + page_size, total))]
+        yield b'{"items": ['
+        for index, item in enumerate(items):
+            produced.append(item["id"])
+            yield (b"," if index else b"") + json.dumps(item).encode()
+        yield b'], "has_more": ' + (b"true" if start + page_size < total else b"false") + b"}"
+    return body
+
+
+class TestStreamingPagination(unittest.TestCase):
+    """Tests for paginate(stream=True)."""
+    
+    def test_items_yielded_while_page_downloads(self):
+        """Test the first item is yielded before the page body has been fully produced."""
+        produced = []
+        body = streamed_pages(total=25, page_size=10, produced=produced)
+        
+        def handler(request):
+            return httpx.Response(200, content=body(int(request.url.params["page_num"])))
+        
+        client = AirwallexClient(client_id="test_client_id", api_key="test_api_key")
+        client._client = httpx.Client(base_url=client.base_url, transport=httpx.MockTransport(handler))
+        client._token = "test_token"
+        client._token_expiry = datetime.now() + timedelta(minutes=30)
+        self.addCleanup(client.close)
+        
+        transactions = client.financial_transaction.paginate(page_size=10, stream=True)
+        self.assertEqual(next(transactions).id, "txn_0")
+        self.assertLess(len(produced), 10)
+        self.assertEqual([txn.id for txn in transactions], [f"txn_{i}" for i in range(1, 25)])
+
+
+class TestAsyncStreamingPagination(unittest.IsolatedAsyncioTestCase):
+    """Tests for paginate_async(stream=True)."""
+    
+    async def test_streamed_items_match_listing(self):
+        """Test the async streaming paginator yields every item in order."""
+        produced = []
+        body = streamed_pages(total=25, page_size=10, produced=produced)
+        
+        async def handler(request):
+            async def chunks():
+                for chunk in body(int(request.url.params["page_num"])):
+                    yield chunk
+            return httpx.Response(200, content=chunks())
+        
+        client = AirwallexAsyncClient(client_id="test_client_id", api_key="test_api_key")
+        client._client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+        client._token = "test_token"
+        client._token_expiry = datetime.now() + timedelta(minutes=30)
+        
+        try:
+            ids = [txn.id async for txn in client.financial_transaction.paginate_async(page_size=10, stream=True)]
+        finally:
+            await client.close()
+        self.assertEqual(ids, [f"txn_{i}" for i in range(25)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+"""
+Tests for sharing access tokens between clients.
+"""
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch, MagicMock
+from datetime import datetime, timedelta, timezone
+
+from airwallex import AirwallexClient, MemoryTokenStore, FileTokenStore
+
+
+class TestTokenStores(unittest.TestCase):
+    """Tests for clients sharing a token store."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.token_path = os.path.join(tmpdir.name, "token.json")
+        
+        self.auth_response = MagicMock()
+        self.auth_response.status_code = 201
+        self.auth_response.json.return_value = {
+            "token": "shared_token",
+            "expires_at": (datetime.now(timezone.utc) + timedelta(minutes=30)).isoformat()
+        }
+    
+    def _make_client(self, store):
+        return AirwallexClient(client_id="test_client_id", api_key="test_api_key", token_store=store)
+    
+    def _authenticate_concurrently(self, clients):
+        barrier = threading.Barrier(len(clients))
+        
+        def run(client):
+            barrier.wait()
+            client.authenticate()
+        
+        threads = [threading.Thread(target=run, args=(client,)) for client in clients]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    
+    @patch('httpx.Client.post')
+    def test_memory_store_shares_token(self, mock_post):
+        """Test clients sharing an in-memory store log in once."""
+        mock_post.return_value = self.auth_response
+        store = MemoryTokenStore()
+        clients = [self._make_client(store) for _ in range(8)]
+        
+        self._authenticate_concurrently(clients)
+        
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertTrue(all(client._token == "shared_token" for client in clients))
+    
+    @patch('httpx.Client.post')
+    def test_file_store_shares_token(self, mock_post):
+        """Test clients sharing a file store log in once, each with its own file handle."""
+        mock_post.return_value = self.auth_response
+        clients = [self._make_client(FileTokenStore(self.token_path)) for _ in range(8)]
+        
+        self._authenticate_concurrently(clients)
+        
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertTrue(all(client._token == "shared_token" for client in clients))
+        self.assertEqual(os.stat(self.token_path).st_mode & 0o777, 0o600)
+    
+    @patch('httpx.Client.post')
+    def test_rejected_shared_token_is_replaced(self, mock_post):
+        """Test a stored token that the API rejected is not adopted again."""
+        mock_post.return_value = self.auth_response
+        store = FileTokenStore(self.token_path)
+        store.save(
+            AirwallexClient(client_id="test_client_id", api_key="test_api_key")._token_store_key,
+            "revoked_token",
+            datetime.now(timezone.utc) + timedelta(minutes=30)
+        )
+        client = self._make_client(store)
+        
+        client.authenticate()
+        self.assertEqual(client._token, "revoked_token")
+        mock_post.assert_not_called()
+        
+        client._refresh_token(stale_token="revoked_token")
+        self.assertEqual(client._token, "shared_token")
+        self.assertEqual(store.load(client._token_store_key)[0], "shared_token")
+
+
+if __name__ == '__main__':
+    unittest.main()